@@ -0,0 +1,44 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import GreedyAI
+from bidirectional_search import BidirectionalSearch
+
+class BidirectionalAI(GreedyAI):
+    """Searches from both ends at once and meets in the middle.
+    mode='a_star' (weighted, balanced heuristic) or 'bfs' (fewest steps)."""
+    def __init__(self, start_node, goal_node, maze, mode='a_star'):
+        self.mode = mode
+        super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='bidirectional')
+        self.algorithm_name = "Bidirectional A*" if mode == 'a_star' else "Bidirectional BFS"
+
+    def compute_path(self):
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'edges') or self.goal_node is None:
+            # No reverse adjacency (e.g. CircularMaze): plain A*
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        engine = BidirectionalSearch(self.maze, self.queue_type, on_expand=self.record_expand)
+        start, goal = self.current_node.id, self.goal_node.id
+        self.visited_nodes.add(self.current_node)
+        if self.mode == 'bfs':
+            _, path = engine.bfs(start, goal)
+        else:
+            _, path = engine.a_star(start, goal)
+
+        if path:
+            self.full_path = [self.maze.node_at(i) for i in path[1:]]
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
+
+    def record_expand(self, side, i):
+        node = self.maze.node_at(i)
+        self.visited_nodes.add(node)
+        self.metrics.record_visit(node)
@@ -0,0 +1,37 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import GreedyAI
+
+class ContractionHierarchyAI(GreedyAI):
+    """Answers from the maze's contraction hierarchy (built once per maze version).
+    Exact like Dijkstra; only the few cells touched by the upward searches count as visited."""
+    def __init__(self, start_node, goal_node, maze):
+        super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='contraction_hierarchy')
+        self.algorithm_name = "Contraction Hierarchy"
+
+    def compute_path(self):
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'build_contraction_hierarchy') or self.goal_node is None:
+            # Not a grid Maze (e.g. CircularMaze): plain A*
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        ch = self.maze.build_contraction_hierarchy()
+        # One query gives both the search spaces (visit metrics) and the unpacked path
+        cost, meet, forward, backward, path = ch.search(self.current_node.id, self.goal_node.id)
+        for i in list(forward) + list(backward):
+            node = self.maze.node_at(i)
+            self.visited_nodes.add(node)
+            self.metrics.record_visit(node)
+
+        if path is not None:
+            self.full_path = [self.maze.node_at(i) for i in path[1:]]
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
@@ -0,0 +1,48 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import GreedyAI
+from junction_graph import JunctionGraph
+
+class CorridorAI(GreedyAI):
+    """Runs a search on the corridor-contracted junction graph instead of the grid.
+    search: 'bfs', 'dfs', 'dijkstra', 'a_star' or 'best_first'."""
+    NAMES = {'bfs': "BFS", 'dfs': "DFS", 'dijkstra': "Dijkstra", 'a_star': "A*", 'best_first': "Greedy Best-First"}
+
+    def __init__(self, start_node, goal_node, maze, search='a_star'):
+        self.search = search
+        self.junction_stats = {}
+        super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='corridor_' + search)
+        self.algorithm_name = f"{self.NAMES[search]} (Junction Graph)"
+
+    def compute_path(self):
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'build_junction_graph') or self.goal_node is None:
+            # No grid to contract (e.g. CircularMaze): plain A*
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        if self.current_node is self.maze.start_node:
+            graph = self.maze.build_junction_graph()
+        else:
+            # Replanning from mid-maze: the current cell must be a junction too
+            graph = JunctionGraph(self.maze, keep=(self.current_node.id,))
+        self.junction_stats = graph.stats()
+
+        self.visited_nodes.add(self.current_node)
+        path = graph.search(self.current_node, self.goal_node, self.search, on_expand=self.record_expand)
+        if path is not None:
+            self.full_path = path
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
+
+    def record_expand(self, i):
+        node = self.maze.node_at(i)
+        self.visited_nodes.add(node)
+        self.metrics.record_visit(node)
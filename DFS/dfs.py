@@ -10,42 +10,35 @@ class DFSAI(GreedyAI):
         super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='dfs')
 
     def compute_path(self):
-        # DFS Implementation
-        stack = [self.current_node]
-        visited = {self.current_node}
-        came_from = {self.current_node: None}
+        # DFS Implementation (keys are integer node ids on indexed mazes)
+        start, goal, expand, to_node = self.search_space(self.current_node, self.goal_node)
+        stack = [start]
+        visited = {start}
+        came_from = {start: None}
         
         self.visited_nodes.add(self.current_node)
         
         current = None
         while stack:
             current = stack.pop()
-            self.visited_nodes.add(current)
-            self.metrics.record_visit(current)
+            current_node = to_node(current)
+            self.visited_nodes.add(current_node)
+            self.metrics.record_visit(current_node)
             
-            if current == self.goal_node:
+            if current == goal:
                 break
             
             # Get neighbors (randomize for variety or fixed order)
-            neighbors = self.maze.get_neighbors(current)
-            for neighbor in neighbors:
+            for neighbor, _ in expand(current):
                 if neighbor not in visited:
                     visited.add(neighbor)
                     came_from[neighbor] = current
                     stack.append(neighbor)
-                    self.metrics.record_evaluation(neighbor, 0)
+                    self.metrics.record_evaluation(to_node(neighbor), 0)
         
-        if current == self.goal_node:
-            self.reconstruct_path(came_from, current)
+        if current == goal:
+            self.full_path = self.reconstruct_keys(came_from, start, goal, to_node)
+            self.calculate_path_stats()
         else:
             print("DFS failed to find path")
             self.finished = True
-
-    def reconstruct_path(self, came_from, current):
-        path = []
-        while current != self.current_node:
-            path.append(current)
-            current = came_from[current]
-        path.reverse()
-        self.full_path = path
-        self.calculate_path_stats()
@@ -0,0 +1,216 @@
+import heapq
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import (GreedyAI, DIRECTIONS, STRAIGHT_STEP_COST, DIAGONAL_STEP_COST,
+                          UNSTABLE_STRAIGHT_STEP_COST, UNSTABLE_DIAGONAL_STEP_COST)
+
+INF = float('inf')
+# Cheapest possible step (powerups are clamped to 0.1): keeps the heuristic consistent
+MIN_STEP_COST = min(STRAIGHT_STEP_COST + DIAGONAL_STEP_COST)
+
+
+class DStarLiteAI(GreedyAI):
+    """
+    D* Lite (optimized version, Koenig & Likhachev) for mazes that change under the AI.
+
+    The search runs backward from the goal, so g[v] / rhs[v] are cost-to-goal estimates
+    over cell ids (same directed CSR step costs as a_star_optimal). They survive between
+    replans: when walls appear or vanish, notify_changes() re-evaluates only the changed
+    cells and their neighbors (the only rows whose edges changed) and repairs the
+    inconsistent part of the tree, instead of searching from scratch.
+
+    replan_log gets one entry per search: {'changed', 'expansions', 'time'}.
+    Cells about to become walls (the maze's unstable_nodes) cost +50 to enter, like
+    every other agent (UNSTABLE_*_STEP_COST). The set is read at each (re)plan; cells
+    that entered or left it since the last one are repaired like changed cells.
+    """
+    def __init__(self, start_node, goal_node, maze):
+        self.replan_log = []
+        self.g = None
+        self.unstable = set() # Cell ids penalized in the current search state
+        super().__init__(start_node, goal_node, maze, heuristic_type='octile', algorithm_type='d_star_lite')
+        self.algorithm_name = "D* Lite"
+
+    def compute_path(self):
+        """Full search from scratch (first plan, or a maze we cannot repair)"""
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'edges') or self.goal_node is None:
+            # No cell ids to keep state on (e.g. CircularMaze): plain A*
+            self.g = None
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        goal = self.goal_node.id
+        self.unstable = set(self.unstable_cells())
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.km = 0
+        self.queue = []
+        self.queued = {} # cell -> key it is queued with (heap entries with other keys are stale)
+        self.last = self.current_node.id
+        self.push(goal)
+        self.replan(0)
+
+    def notify_changes(self, nodes):
+        """Cells in nodes just changed type: repair the search tree and re-extract the path"""
+        if self.g is None:
+            self.compute_path()
+            return
+        if self.current_node == self.goal_node:
+            return
+        self.path_index = 0
+        self.finished = False
+
+        # The start moved since the last search: shift every queued key by the same bound
+        start = self.current_node.id
+        self.km += self.h(self.last, start)
+        self.last = start
+
+        # Cells that entered or left the WARNING phase changed the cost of entering them
+        unstable = set(self.unstable_cells())
+        changed = {node.id for node in nodes} | (unstable ^ self.unstable)
+        self.unstable = unstable
+
+        width, height = self.maze.width, self.maze.height
+        for v in changed:
+            self.update_vertex(v)
+            r, c = divmod(v, width)
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < height and 0 <= nc < width:
+                    self.update_vertex(nr * width + nc)
+        self.replan(len(changed))
+
+    def replan(self, changed):
+        self.visited_nodes.add(self.current_node)
+        t0 = time.perf_counter()
+        if self.goal_cut_off():
+            # Nothing to settle: the queued repairs wait for the next change instead
+            self.replan_log.append({'changed': changed, 'expansions': 0, 'time': time.perf_counter() - t0})
+            print(f"No path found for AI ({self.algorithm_type}): goal is walled off")
+            self.finished = True
+            return
+        expansions = self.compute_shortest_path()
+        self.replan_log.append({
+            'changed': changed,
+            'expansions': expansions,
+            'time': time.perf_counter() - t0,
+        })
+
+        path = self.extract_path()
+        if path is not None:
+            self.full_path = path
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
+
+    # ==========================================
+    # D* Lite core
+    # ==========================================
+
+    def edges(self, u):
+        """maze.edges(u) with the warning penalty on unstable targets"""
+        if not self.unstable:
+            return self.maze.edges(u)
+        unstable, width, codes = self.unstable, self.maze.width, self.maze.type_codes()
+        ur, uc = divmod(u, width)
+        edges = []
+        for s, cost in self.maze.edges(u):
+            if s in unstable:
+                sr, sc = divmod(s, width)
+                table = UNSTABLE_DIAGONAL_STEP_COST if sr != ur and sc != uc else UNSTABLE_STRAIGHT_STEP_COST
+                cost = table[codes[s]]
+            edges.append((s, cost))
+        return edges
+
+    def h(self, a, b):
+        width = self.maze.width
+        ar, ac = divmod(a, width)
+        br, bc = divmod(b, width)
+        return MIN_STEP_COST * max(abs(ar - br), abs(ac - bc))
+
+    def key(self, s):
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self.h(self.last, s) + self.km, m)
+
+    def push(self, s):
+        k = self.key(s)
+        self.queued[s] = k
+        heapq.heappush(self.queue, (k, s))
+
+    def update_vertex(self, u):
+        if u != self.goal_node.id:
+            g = self.g
+            rhs = INF
+            for s, cost in self.edges(u):
+                d = cost + g.get(s, INF)
+                if d < rhs:
+                    rhs = d
+            self.rhs[u] = rhs
+        self.queued.pop(u, None)
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self.push(u)
+
+    def compute_shortest_path(self):
+        """Settle vertices until the start is locally consistent; returns expansions"""
+        queue, queued, g, rhs = self.queue, self.queued, self.g, self.rhs
+        start = self.last
+        node_at, visited, metrics = self.maze.node_at, self.visited_nodes, self.metrics
+        expansions = 0
+
+        while queue:
+            k_old, u = queue[0]
+            if queued.get(u) != k_old:
+                heapq.heappop(queue) # Stale entry
+                continue
+            if k_old >= self.key(start) and rhs.get(start, INF) <= g.get(start, INF):
+                break
+            heapq.heappop(queue)
+            del queued[u]
+
+            k_new = self.key(u)
+            if k_old < k_new:
+                queued[u] = k_new
+                heapq.heappush(queue, (k_new, u))
+                continue
+
+            expansions += 1
+            node = node_at(u)
+            visited.add(node)
+            metrics.record_visit(node)
+            if g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                self.update_vertex(u)
+            # Walkable neighbors are exactly the cells with an edge into u
+            for p in self.maze.neighbor_ids(u):
+                self.update_vertex(p)
+        return expansions
+
+    def extract_path(self):
+        """Follow the cheapest c(s, s') + g(s') successor from the start to the goal"""
+        s, goal = self.last, self.goal_node.id
+        if self.rhs.get(s, INF) == INF:
+            return None
+        g, node_at = self.g, self.maze.node_at
+        path = []
+        limit = self.maze.width * self.maze.height
+        while s != goal:
+            best, best_d = None, INF
+            for t, cost in self.edges(s):
+                d = cost + (0 if t == goal else g.get(t, INF))
+                if d < best_d:
+                    best, best_d = t, d
+            if best is None or len(path) >= limit:
+                return None
+            path.append(node_at(best))
+            s = best
+        return path
@@ -0,0 +1,45 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import GreedyAI
+
+class HPAStarAI(GreedyAI):
+    """Hierarchical A* over 16x16 clusters of the DynamicMaze: abstract search across
+    cluster entrances, then a grid search confined to the clusters it crossed.
+    workers > 1 lets very large table rebuilds run in a process pool."""
+    def __init__(self, start_node, goal_node, maze, workers=0):
+        self.workers = workers
+        super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='hpa_star')
+        self.algorithm_name = "HPA* (Block Entrances)"
+
+    def compute_path(self):
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'build_block_graph') or self.goal_node is None:
+            # No block partition (plain Maze / CircularMaze): plain A*
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        if self.goal_cut_off():
+            print(f"No path found for AI ({self.algorithm_type}): goal is walled off")
+            self.finished = True
+            return
+
+        graph = self.maze.build_block_graph(self.workers)
+        self.visited_nodes.add(self.current_node)
+        path = graph.search(self.current_node.id, self.goal_node.id, on_expand=self.record_expand)
+        if path is not None:
+            node_at = self.maze.node_at
+            self.full_path = [node_at(i) for i in path]
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
+
+    def record_expand(self, i):
+        node = self.maze.node_at(i)
+        self.visited_nodes.add(node)
+        self.metrics.record_visit(node)
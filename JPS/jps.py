@@ -0,0 +1,306 @@
+import math
+import sys
+import os
+import weakref
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from game_classes import GreedyAI, make_queue, WALL, OPEN, STRAIGHT_STEP_COST, DIAGONAL_STEP_COST
+
+# Cells that cost the same to enter as open floor; any other walkable type
+# (traps, powerups) is "weighted" and breaks the uniform-cost symmetry JPS relies on
+PLAIN_CODES = (OPEN, ord('S'), ord('G'))
+UNSTABLE_PENALTY = 50 # Same warning-phase penalty as GreedyAI.compute_path_best_first
+
+_WALKABLE = bytes(0 if code == WALL else 1 for code in range(256))
+_PLAIN = bytes(1 if code in PLAIN_CODES else 0 for code in range(256))
+_WEIGHTED = bytes(0 if code == WALL or code in PLAIN_CODES else 1 for code in range(256))
+
+DIAGONALS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+ALL_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)] + DIAGONALS
+
+
+def sign(x):
+    return (x > 0) - (x < 0)
+
+
+class JumpGrid:
+    """Padded (one wall cell on every side) view of a maze for jump scans.
+    Index p = (r+1)*pw + (c+1), so scans never need bounds checks.
+      walk[p]     - not a wall
+      plain[p]    - open floor (anything else counts as blocked for pruning)
+      weighted[p] - trap/powerup/unstable: always a jump point, expanded in all 8 directions
+      stop[p]     - weighted or next to a weighted cell: jumps stop here"""
+    def __init__(self, maze, unstable=()):
+        self.width, self.height = maze.width, maze.height
+        pw = self.pw = maze.width + 2
+        codes = maze.type_codes()
+        wall_row = bytes([WALL]) * pw
+        padded = bytearray(wall_row)
+        edge = bytes([WALL])
+        for r in range(maze.height):
+            padded += edge + codes[r * maze.width:(r + 1) * maze.width] + edge
+        padded += wall_row
+
+        self.codes = padded
+        self.walk = padded.translate(_WALKABLE)
+        self.plain = bytearray(padded.translate(_PLAIN))
+        self.weighted = bytearray(padded.translate(_WEIGHTED))
+        self.extra_cost = {}
+        for i in unstable:
+            p = self.pad(i)
+            if self.walk[p]:
+                self.plain[p] = 0
+                self.weighted[p] = 1
+                self.extra_cost[p] = UNSTABLE_PENALTY
+
+        self.stop = bytearray(len(padded))
+        p = self.weighted.find(1)
+        while p != -1:
+            for q in (p - pw - 1, p - pw, p - pw + 1, p - 1, p, p + 1, p + pw - 1, p + pw, p + pw + 1):
+                self.stop[q] = 1
+            p = self.weighted.find(1, p + 1)
+
+    def pad(self, i):
+        r, c = divmod(i, self.width)
+        return (r + 1) * self.pw + c + 1
+
+    def unpad(self, p):
+        r, c = divmod(p, self.pw)
+        return (r - 1) * self.width + c - 1
+
+    def rc(self, p):
+        r, c = divmod(p, self.pw)
+        return r - 1, c - 1
+
+    def step_cost(self, p, diagonal):
+        """Cost of stepping onto cell p (same table as the maze CSR index)"""
+        code = self.codes[p]
+        cost = DIAGONAL_STEP_COST[code] if diagonal else STRAIGHT_STEP_COST[code]
+        return cost + self.extra_cost.get(p, 0)
+
+    def forced(self, p, dr, dc):
+        """Does arriving at p in direction (dr, dc) give p a forced neighbor?"""
+        pw, plain, walk = self.pw, self.plain, self.walk
+        if dr and dc:
+            return ((not plain[p - dc] and walk[p - dc + dr * pw]) or
+                    (not plain[p - dr * pw] and walk[p - dr * pw + dc]))
+        if dc:
+            return ((not plain[p - pw] and walk[p - pw + dc]) or
+                    (not plain[p + pw] and walk[p + pw + dc]))
+        return ((not plain[p - 1] and walk[p - 1 + dr * pw]) or
+                (not plain[p + 1] and walk[p + 1 + dr * pw]))
+
+    def directions(self, p, dr, dc):
+        """Pruned successor directions of p reached moving (dr, dc); (0, 0) = no parent"""
+        if (dr == 0 and dc == 0) or self.weighted[p]:
+            return ALL_DIRECTIONS
+        pw, plain = self.pw, self.plain
+        if dr and dc:
+            dirs = [(dr, dc), (dr, 0), (0, dc)]
+            if not plain[p - dc]: dirs.append((dr, -dc))
+            if not plain[p - dr * pw]: dirs.append((-dr, dc))
+        elif dc:
+            dirs = [(0, dc)]
+            if not plain[p - pw]: dirs.append((-1, dc))
+            if not plain[p + pw]: dirs.append((1, dc))
+        else:
+            dirs = [(dr, 0)]
+            if not plain[p - 1]: dirs.append((dr, -1))
+            if not plain[p + 1]: dirs.append((dr, 1))
+        if self.stop[p]:
+            # Weighted neighbors are never pruned: their cost depends on how they are entered
+            for d in ALL_DIRECTIONS:
+                if d not in dirs and self.weighted[p + d[0] * pw + d[1]]:
+                    dirs.append(d)
+        return dirs
+
+    def jump(self, p, dr, dc, goal):
+        """Scan from p in direction (dr, dc); returns the next jump point or -1"""
+        step = dr * self.pw + dc
+        walk, stop = self.walk, self.stop
+        while True:
+            p += step
+            if not walk[p]:
+                return -1
+            if p == goal or stop[p] or self.forced(p, dr, dc):
+                return p
+            if dr and dc:
+                if self.jump(p, dr, 0, goal) != -1 or self.jump(p, 0, dc, goal) != -1:
+                    return p
+
+
+class JumpTable:
+    """JPS+ preprocessing: for every cell and direction, the distance to the next jump
+    point (> 0) or minus the number of free steps before a wall (<= 0).
+    Independent of start/goal; rebuilt when the maze version changes."""
+    def __init__(self, maze):
+        self.version = maze.version
+        grid = self.grid = JumpGrid(maze)
+        pw, walk, stop = grid.pw, grid.walk, grid.stop
+        n = len(grid.walk)
+        self.dist = {}
+
+        # Straight directions first: diagonal jump points depend on them
+        for dr, dc in ALL_DIRECTIONS:
+            diagonal = dr and dc
+            step = dr * pw + dc
+            table = [0] * n
+            order = range(n - 1, -1, -1) if step > 0 else range(n)
+            if diagonal:
+                along_r, along_c = self.dist[(dr, 0)], self.dist[(0, dc)]
+            for p in order:
+                if not walk[p]:
+                    continue
+                q = p + step
+                if not walk[q]:
+                    continue
+                if stop[q] or grid.forced(q, dr, dc) or (diagonal and (along_r[q] > 0 or along_c[q] > 0)):
+                    table[p] = 1
+                elif table[q] > 0:
+                    table[p] = table[q] + 1
+                else:
+                    table[p] = table[q] - 1
+            self.dist[(dr, dc)] = table
+
+
+_jump_tables = weakref.WeakKeyDictionary()
+
+
+def jump_table(maze):
+    """Cached JPS+ table for the maze's current version"""
+    table = _jump_tables.get(maze)
+    if table is None or table.version != maze.version:
+        table = _jump_tables[maze] = JumpTable(maze)
+    return table
+
+
+class JPSAI(GreedyAI):
+    """A* with Jump Point Search pruning on the 8-connected grid.
+    Only jump points enter the open list; the straight/diagonal runs between them
+    are expanded back into single steps for full_path.
+    Traps and powerups (and warning-phase cells on dynamic mazes) are weighted:
+    jumps stop on and next to them, and they expand all 8 neighbors, so the
+    uniform-cost pruning rules never skip a cheaper route through them.
+    plus=True uses precomputed jump distances (JPS+) instead of scanning."""
+    def __init__(self, start_node, goal_node, maze, plus=False):
+        self.plus = plus
+        super().__init__(start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='jps')
+        self.algorithm_name = "Jump Point Search (JPS+)" if plus else "Jump Point Search (JPS)"
+
+    def heuristic(self, node):
+        return math.sqrt((node.r - self.goal_node.r)**2 + (node.c - self.goal_node.c)**2)
+
+    def compute_path(self):
+        self.path_index = 0
+        self.finished = False
+
+        if not hasattr(self.maze, 'type_codes') or self.goal_node is None:
+            # Not a rectangular grid (e.g. CircularMaze): plain A*
+            self.algorithm_type = 'a_star'
+            self.compute_path_best_first()
+            return
+
+        unstable = self.unstable_cells()
+        table = None
+        if self.plus and not unstable:
+            table = jump_table(self.maze)
+            grid = table.grid
+        else:
+            grid = JumpGrid(self.maze, unstable)
+
+        start = grid.pad(self.current_node.id)
+        goal = grid.pad(self.goal_node.id)
+        to_node = lambda p: self.maze.node_at(grid.unpad(p))
+
+        frontier = make_queue(self.queue_type)
+        frontier.put((start, 0, 0), 0)
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        closed = set()
+
+        self.visited_nodes.add(self.current_node)
+
+        while not frontier.empty():
+            current, dr, dc = frontier.get()
+            if current in closed:
+                continue
+            closed.add(current)
+            current_node = to_node(current)
+            self.visited_nodes.add(current_node)
+            self.metrics.record_visit(current_node)
+
+            if current == goal:
+                break
+
+            for d in grid.directions(current, dr, dc):
+                if table is not None:
+                    nxt = self.table_jump(table, current, d, goal)
+                else:
+                    nxt = grid.jump(current, d[0], d[1], goal)
+                if nxt == -1:
+                    continue
+
+                # Every cell strictly between two jump points is plain floor
+                (r0, c0), (r1, c1) = grid.rc(current), grid.rc(nxt)
+                steps = max(abs(r1 - r0), abs(c1 - c0))
+                diagonal = bool(d[0] and d[1])
+                new_cost = cost_so_far[current] + (steps - 1) * (1.414 if diagonal else 1) + grid.step_cost(nxt, diagonal)
+
+                if nxt not in cost_so_far or new_cost < cost_so_far[nxt]:
+                    cost_so_far[nxt] = new_cost
+                    came_from[nxt] = current
+                    neighbor_node = to_node(nxt)
+                    priority = new_cost + self.heuristic(neighbor_node)
+                    self.metrics.record_evaluation(neighbor_node, priority)
+                    frontier.put((nxt, d[0], d[1]), priority)
+
+        if goal in closed:
+            self.full_path = self.unpack(came_from, start, goal, grid, to_node)
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True
+
+    def table_jump(self, table, p, d, goal):
+        """JPS+ successor: precomputed distance, cut short where the goal is in range"""
+        grid = table.grid
+        dr, dc = d
+        dist = table.dist[d][p]
+        reach = abs(dist)
+        r, c = grid.rc(p)
+        gr, gc = grid.rc(goal)
+        if dr and dc:
+            if sign(gr - r) == dr and sign(gc - c) == dc:
+                # Goal lies in this quadrant: stop where its row or column is reached
+                m = min(abs(gr - r), abs(gc - c))
+                if m <= reach:
+                    return p + m * (dr * grid.pw + dc)
+        elif (dr == 0 and gr == r and sign(gc - c) == dc) or (dc == 0 and gc == c and sign(gr - r) == dr):
+            if abs(gr - r) + abs(gc - c) <= reach:
+                return goal
+        if dist > 0:
+            return p + dist * (dr * grid.pw + dc)
+        return -1
+
+    @staticmethod
+    def unpack(came_from, start, goal, grid, to_node):
+        """Jump point chain -> every cell after start, in order"""
+        jump_points = []
+        curr = goal
+        while curr != start:
+            jump_points.append(curr)
+            curr = came_from[curr]
+        jump_points.reverse()
+
+        path = []
+        prev = start
+        for p in jump_points:
+            (r0, c0), (r1, c1) = grid.rc(prev), grid.rc(p)
+            dr, dc = sign(r1 - r0), sign(c1 - c0)
+            step = dr * grid.pw + dc
+            q = prev
+            while q != p:
+                q += step
+                path.append(to_node(q))
+            prev = p
+        return path
@@ -0,0 +1,63 @@
+"""CircularMaze.run_dp scaling: the original dict-keyed loop over get_weighted_neighbors
+vs the list ('python') and NumPy ('numpy') engines, for a full 15-step DP (empty cache)
+and per frame while the rings turn at 60 fps.
+Run: python benchmark_circular_dp.py"""
+import random
+import time
+from circular_maze import CircularMaze, np
+
+SIZES = [(4, 12), (6, 24), (20, 64), (50, 128), (100, 256)]
+REFERENCE_MAX_NODES = 8000 # The original loop takes seconds beyond this
+FRAMES = 120
+
+
+def reference_dp(maze, T=15):
+    """The original run_dp body"""
+    values = {}
+    for t in range(T + 1):
+        for s in range(maze.sectors_per_ring):
+            values[(t, 0, s)] = 0
+    for r in range(1, maze.num_rings):
+        for s in range(maze.sectors_per_ring):
+            values[(T, r, s)] = r * 2
+    for t in range(T - 1, -1, -1):
+        for r in range(1, maze.num_rings):
+            for s in range(maze.sectors_per_ring):
+                node = maze.grid[r][s]
+                wait_cost = 1 + values.get((t + 1, r, s), float('inf'))
+                move_costs = [cost + values.get((t + 1, n.r, n.c), float('inf'))
+                              for n, cost in maze.get_weighted_neighbors(node, future_time=t * 1.0)]
+                values[(t, r, s)] = min(wait_cost, min(move_costs) if move_costs else float('inf'))
+    return values
+
+
+def timed(fn):
+    t = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t) * 1000
+
+
+if __name__ == '__main__':
+    engines = ['python'] + (['numpy'] if np is not None else [])
+    if np is None:
+        print("NumPy not installed: only the list engine is measured")
+    for rings, sectors in SIZES:
+        random.seed(7)
+        maze = CircularMaze(num_rings=rings, sectors=sectors)
+        line = f"{rings:3d} rings x {sectors:3d} sectors:"
+        if rings * sectors <= REFERENCE_MAX_NODES:
+            line += f" original {timed(lambda: reference_dp(maze)):8.1f} ms |"
+        for engine in engines:
+            maze.dp_engine = engine
+            maze.reset_dp_cache()
+            full = timed(maze.run_dp)
+            maze.reset_dp_cache()
+            maze.run_dp()
+
+            def frames():
+                for _ in range(FRAMES):
+                    maze.update(1 / 60)
+                    maze.run_dp()
+            per_frame = timed(frames) / FRAMES
+            line += f" {engine} full {full:8.1f} ms, per frame {per_frame:7.3f} ms |"
+        print(line.rstrip(' |'))
@@ -0,0 +1,37 @@
+"""Grid searches vs the same searches on the corridor-contracted junction graph.
+Reports node/edge counts before and after contraction and per-algorithm runtime.
+Run: python benchmark_corridors.py"""
+import time
+from game_classes import Maze, GreedyAI
+from BFS.bfs import BFSAI
+from DFS.dfs import DFSAI
+from Corridor.corridor import CorridorAI
+
+SIZES = [(25, 25), (101, 101), (201, 201)]
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t, result
+
+
+def grid_agent(maze, search):
+    if search == 'bfs':
+        return BFSAI(maze.start_node, maze.goal_node, maze)
+    if search == 'dfs':
+        return DFSAI(maze.start_node, maze.goal_node, maze)
+    return GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type=search)
+
+
+for width, height in SIZES:
+    maze = Maze(width=width, height=height, seed=11)
+    stats = maze.build_junction_graph().stats()
+    print(f"\n{width}x{height}: nodes {stats['nodes_before']} -> {stats['nodes_after']} ({stats['bypassed']} bypassed), "
+          f"edges {stats['edges_before']} -> {stats['edges_after']}, "
+          f"contraction {stats['build_time'] * 1000:.1f} ms")
+    for search in ('bfs', 'dfs', 'dijkstra', 'a_star', 'best_first'):
+        grid_time, grid = timed(lambda: grid_agent(maze, search))
+        junction_time, junction = timed(lambda: CorridorAI(maze.start_node, maze.goal_node, maze, search))
+        print(f"  {search:<11} grid {grid_time * 1000:8.2f} ms ({grid.metrics.nodes_visited:6d} visited) | "
+              f"junction {junction_time * 1000:8.2f} ms ({junction.metrics.nodes_visited:6d} visited)")
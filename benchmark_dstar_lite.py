@@ -0,0 +1,54 @@
+"""Per-event replan cost on dynamic mazes: D* Lite repair vs planning from scratch
+(the A* recompute GameController used to do after every structural change).
+Run: python benchmark_dstar_lite.py"""
+import random
+import time
+from dynamic_maze import DynamicMaze
+from game_classes import GreedyAI
+from DStarLite.dstar_lite import DStarLiteAI
+
+SIZES = [(25, 25), (51, 51), (101, 101)]
+EVENTS = 40
+CHANGES_PER_EVENT = 3 # A MASS event applies several changes in one frame
+
+
+def random_changes(maze, rng, ai):
+    for _ in range(CHANGES_PER_EVENT):
+        node = maze.node_at(rng.randrange(maze.width * maze.height))
+        if node in (maze.start_node, maze.goal_node, ai.current_node):
+            continue
+        kind = 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL'
+        maze.schedule_change(node, kind, "Benchmark", 1.0)
+    # WARNING -> ANIMATING -> applied
+    maze.process_updates(10.0)
+    maze.process_updates(10.0)
+
+
+for width, height in SIZES:
+    rng = random.Random(5)
+    maze = DynamicMaze(width=width, height=height, seed=5)
+    ai = DStarLiteAI(maze.start_node, maze.goal_node, maze)
+    initial = ai.replan_log[0]
+    repair_time = repair_expanded = full_time = full_expanded = 0
+
+    for _ in range(EVENTS):
+        if ai.finished:
+            break
+        ai.choose_move(maze)
+        random_changes(maze, rng, ai)
+        ai.notify_changes(maze.last_changed_nodes)
+        if not ai.replan_log:
+            continue
+        repair_time += ai.replan_log[-1]['time']
+        repair_expanded += ai.replan_log[-1]['expansions']
+
+        t = time.perf_counter()
+        full = GreedyAI(ai.current_node, maze.goal_node, maze, algorithm_type='a_star')
+        full_time += time.perf_counter() - t
+        full_expanded += full.metrics.nodes_visited
+
+    events = len(ai.replan_log) - 1
+    print(f"\n{width}x{height}: initial plan {initial['expansions']} expanded, {initial['time'] * 1000:.2f} ms")
+    if events:
+        print(f"  D* Lite repair     {repair_time / events * 1000:8.3f} ms/event ({repair_expanded / events:8.1f} expanded)")
+        print(f"  A* from scratch    {full_time / events * 1000:8.3f} ms/event ({full_expanded / events:8.1f} expanded)")
@@ -0,0 +1,28 @@
+"""Replanning strategies on dynamic mazes, driven headless in simulated time.
+Reports replan latency percentiles, nodes expanded per replan and plan-cost drift.
+Run: python benchmark_dynamic.py"""
+from dynamic_maze import DynamicMaze
+from dynamic_simulator import DynamicSimulator
+from GBFS.Euclidean.euclidean import EuclideanAI
+from AStar.astar import AStarAI
+from DStarLite.dstar_lite import DStarLiteAI
+from HPA.hpa import HPAStarAI
+
+SIZES = [(25, 25), (51, 51)]
+AGENTS = [EuclideanAI, AStarAI, DStarLiteAI, HPAStarAI]
+EVENTS = 1000
+EVENT_INTERVAL = (0.5, 1.5) # Much busier than the game's 3-8 s
+
+
+if __name__ == '__main__':
+    for width, height in SIZES:
+        print(f"\n{width}x{height}, {EVENTS} events")
+        for agent_class in AGENTS:
+            maze = DynamicMaze(width=width, height=height, seed=21)
+            sim = DynamicSimulator(maze, agent_class, event_interval=EVENT_INTERVAL, seed=21)
+            r = sim.run(events=EVENTS)
+            lat, exp = r['latency_ms'], r['expanded']
+            print(f"  {r['agent']:<28} {r['replans']:5d} replans ({r['failed_replans']} failed, {r['skipped_replans']} skipped), "
+                  f"latency p50/p95/p99 {lat[50]:6.2f}/{lat[95]:6.2f}/{lat[99]:6.2f} ms, "
+                  f"expanded p50/p95 {exp[50]:5d}/{exp[95]:5d}, drift mean {r['cost_drift']['mean']:5.2f}, "
+                  f"{r['sim_time']:7.0f}s simulated in {r['wall_time']:5.1f}s")
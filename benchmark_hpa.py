@@ -0,0 +1,72 @@
+"""HPA* over 16x16 clusters vs grid A*: build time (and process pool overhead),
+query time and path cost, and per-event repair of the cluster caches vs
+rebuilding them from scratch.
+Run: python benchmark_hpa.py"""
+import multiprocessing
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dynamic_maze import DynamicMaze
+from game_classes import GreedyAI
+from block_graph import BlockGraph
+from HPA.hpa import HPAStarAI
+
+SIZES = [(101, 101), (201, 201)]
+EVENTS = 20
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t, result
+
+
+def pool_started(workers):
+    executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+    list(executor.map(abs, range(workers)))
+    return executor
+
+
+def path_cost(maze, path):
+    cost, prev = 0, maze.start_node.id
+    for node in path:
+        cost += dict(maze.edges(prev))[node.id]
+        prev = node.id
+    return cost
+
+
+if __name__ == '__main__':
+    for width, height in SIZES:
+        maze = DynamicMaze(width=width, height=height, seed=3)
+        build_time, graph = timed(maze.build_block_graph)
+        # What a process pool would add on top of the (parallelised) table builds
+        start_time, executor = timed(lambda: pool_started(4))
+        executor.shutdown()
+        transfer_time = timed(lambda: pickle.loads(pickle.dumps(graph.tables)))[0]
+        print(f"\n{width}x{height}: {len(graph.bounds)} clusters, "
+              f"{sum(len(e) for e in graph.entrances.values())} entrances")
+        print(f"  build serial {build_time * 1000:8.1f} ms | pool overhead: start {start_time * 1000:6.1f} ms (spawn, 4 workers) "
+              f"+ transfer {transfer_time * 1000:6.1f} ms (pool used from {BlockGraph.POOL_MIN_CELLS} cells)")
+
+        hpa_time, hpa = timed(lambda: HPAStarAI(maze.start_node, maze.goal_node, maze))
+        grid_time, grid = timed(lambda: GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='a_star'))
+        if not grid.finished:
+            print(f"  query HPA* {hpa_time * 1000:8.2f} ms ({hpa.metrics.nodes_visited} expanded, cost {path_cost(maze, hpa.full_path):.1f}) | "
+                  f"grid A* {grid_time * 1000:8.2f} ms ({grid.metrics.nodes_visited} expanded, cost {path_cost(maze, grid.full_path):.1f})")
+
+        rng = random.Random(1)
+        repair = rebuild = 0
+        for _ in range(EVENTS):
+            node = maze.node_at(rng.randrange(width * height))
+            if node in (maze.start_node, maze.goal_node):
+                continue
+            maze.schedule_change(node, 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL', "Benchmark", 1.0)
+            # Apply the change with the graph detached, then time the repair on its own
+            maze.block_graph = None
+            maze.process_updates(10.0)
+            maze.process_updates(10.0)
+            maze.block_graph = graph
+            repair += timed(lambda: graph.update([node]))[0]
+            rebuild += timed(lambda: BlockGraph(maze))[0]
+        print(f"  per event: repair {repair / EVENTS * 1000:8.3f} ms | full rebuild {rebuild / EVENTS * 1000:8.3f} ms")
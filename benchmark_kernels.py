@@ -0,0 +1,66 @@
+"""Per-expansion cost of the specialized search kernels vs the old generic loop.
+The generic loop below mirrors the pre-kernel compute_path_best_first: Node keys,
+get_neighbors, diagonal/penalty/clamp per neighbor, algorithm branch per push.
+Run: python benchmark_kernels.py"""
+import math
+import time
+from game_classes import Maze, GreedyAI, PriorityQueue
+
+SIZES = [(31, 25), (101, 101), (201, 201)]
+REPEATS = 3
+
+
+def generic_search(ai):
+    maze, goal = ai.maze, ai.goal_node
+    frontier = PriorityQueue()
+    frontier.put(ai.current_node, 0)
+    cost_so_far = {ai.current_node: 0}
+    expansions = 0
+    while not frontier.empty():
+        current = frontier.get()
+        expansions += 1
+        if current == goal:
+            break
+        for neighbor in maze.get_neighbors(current):
+            edge_cost = 1
+            if abs(current.r - neighbor.r) + abs(current.c - neighbor.c) == 2:
+                edge_cost = 1.414
+            penalty = 0
+            if neighbor.type == 'T': penalty = 3
+            elif neighbor.type == 'P': penalty = -2
+            if hasattr(maze, 'is_node_unstable') and maze.is_node_unstable(neighbor):
+                penalty += 50
+            new_cost = cost_so_far[current] + max(0.1, edge_cost + penalty)
+            if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                cost_so_far[neighbor] = new_cost
+                if ai.algorithm_type == 'dijkstra':
+                    priority = new_cost
+                elif ai.algorithm_type == 'a_star':
+                    priority = new_cost + math.sqrt((neighbor.r - goal.r)**2 + (neighbor.c - goal.c)**2)
+                else:
+                    priority = math.sqrt((neighbor.r - goal.r)**2 + (neighbor.c - goal.c)**2)
+                ai.metrics.record_evaluation(neighbor, priority)
+                frontier.put(neighbor, priority)
+    return expansions
+
+
+def best(fn):
+    times = []
+    for _ in range(REPEATS):
+        t = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t)
+    return min(times), result
+
+
+for width, height in SIZES:
+    maze = Maze(width=width, height=height, seed=5)
+    print(f"\n{width}x{height}:")
+    for algorithm in ('dijkstra', 'a_star', 'best_first'):
+        ai = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type=algorithm)
+        kernel_time, kernel_ai = best(lambda: GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type=algorithm))
+        generic_time, generic_expansions = best(lambda: generic_search(ai))
+        per_kernel = kernel_time / max(kernel_ai.metrics.nodes_visited, 1) * 1e6
+        per_generic = generic_time / max(generic_expansions, 1) * 1e6
+        print(f"  {algorithm:<11} kernel {per_kernel:6.2f} us/expansion | generic {per_generic:6.2f} us/expansion "
+              f"| {per_generic / per_kernel:4.2f}x")
@@ -0,0 +1,32 @@
+"""Heap vs bucket frontier on HARD-sized and larger mazes.
+Run: python benchmark_queues.py"""
+import time
+from game_classes import Maze, GreedyAI
+
+SIZES = [(31, 25), (101, 101), (301, 301)] # HARD, then larger
+REPEATS = 3
+
+
+def best_time(fn):
+    best = float('inf')
+    for _ in range(REPEATS):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, result
+
+
+for width, height in SIZES:
+    maze = Maze(width=width, height=height, seed=7)
+    print(f"\n{width}x{height}:")
+    for label in ('a_star_optimal', 'dijkstra', 'a_star'):
+        row = []
+        for queue_type in ('heap', 'bucket'):
+            if label == 'a_star_optimal':
+                elapsed, cost = best_time(lambda: maze.a_star_optimal(queue_type=queue_type))
+            else:
+                elapsed, ai = best_time(lambda: GreedyAI(maze.start_node, maze.goal_node, maze,
+                                                         algorithm_type=label, queue_type=queue_type))
+                cost = ai.solution_cost
+            row.append(f"{queue_type}: {elapsed * 1000:8.2f} ms (cost {cost:.3f})")
+        print(f"  {label:<15} " + " | ".join(row))
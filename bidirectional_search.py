@@ -0,0 +1,162 @@
+import math
+from game_classes import make_queue
+
+
+class BidirectionalSearch:
+    """
+    Meet-in-the-middle searches over a Maze's adjacency index (cell ids r*width+c).
+    One frontier grows from the start, one from the goal; the backward side walks
+    edges in reverse, so it pays the cost of *entering* each cell (costs are directed:
+    stepping onto a trap costs 4, stepping off it costs whatever the next cell costs).
+
+    bfs(start, goal)    -> (hops, path)  unweighted, like calculate_optimal_path
+    a_star(start, goal) -> (cost, path)  weighted; optimal when the heuristic is admissible
+    path is a list of cell ids from start to goal, or None when the goal is unreachable.
+    visited holds the number of cells expanded by the last search (both sides);
+    on_expand(side, cell_id), if set, is called for each of them (side 0 = forward).
+    """
+    def __init__(self, maze, queue_type='heap', on_expand=None):
+        self.maze = maze
+        self.queue_type = queue_type
+        self.on_expand = on_expand
+        self.visited = 0
+        self.meeting_point = None
+
+    # ==========================================
+    # Bidirectional BFS (hop count)
+    # ==========================================
+
+    def bfs(self, start, goal):
+        self.visited = 0
+        self.meeting_point = None
+        if start == goal:
+            return 0, [start]
+
+        maze = self.maze
+        # Walkability is symmetric, so both sides use the same neighbor lists
+        parents = ({start: None}, {goal: None})
+        depths = [{start: 0}, {goal: 0}]
+        frontiers = [[start], [goal]]
+        levels = [0, 0]
+
+        while frontiers[0] and frontiers[1]:
+            # Grow the smaller frontier by one full layer
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, other = depths[side], depths[1 - side]
+            parent = parents[side]
+            levels[side] += 1
+            best, meet = float('inf'), None
+            next_frontier = []
+            for i in frontiers[side]:
+                self.visited += 1
+                if self.on_expand is not None:
+                    self.on_expand(side, i)
+                for j in maze.neighbor_ids(i):
+                    if j in mine:
+                        continue
+                    mine[j] = levels[side]
+                    parent[j] = i
+                    next_frontier.append(j)
+                    if j in other and levels[side] + other[j] < best:
+                        best, meet = levels[side] + other[j], j
+            if meet is not None:
+                # Every cell of the other side is within its last full layer, so the
+                # best meeting cell of this layer is a shortest path
+                self.meeting_point = meet
+                return best, self.join(parents, meet)
+            frontiers[side] = next_frontier
+
+        return float('inf'), None
+
+    # ==========================================
+    # Bidirectional A* (weighted)
+    # ==========================================
+
+    def a_star(self, start, goal, heuristic=True, landmarks=None):
+        """heuristic=True: Euclidean estimates to both ends, averaged into one balanced
+        potential p(v) = (h_goal(v) - h_start(v)) / 2 (forward keys g + p, backward keys
+        g - p), so both sides agree on reduced edge costs. heuristic=False gives
+        bidirectional Dijkstra. Exact whenever the Euclidean estimate is consistent
+        (no powerups: every step then costs at least its length).
+        landmarks (a current Landmarks) replaces the Euclidean estimates with the ALT
+        bounds, which are consistent with powerups too: always exact."""
+        self.visited = 0
+        self.meeting_point = None
+        if start == goal:
+            return 0, [start]
+
+        maze = self.maze
+        width = maze.width
+        sr, sc = divmod(start, width)
+        gr, gc = divmod(goal, width)
+        # Offset keeping both sides' keys >= 0 (bucket queues need it)
+        offset = math.sqrt((sr - gr)**2 + (sc - gc)**2) / 2 if heuristic else 0
+
+        def potential(i):
+            if not heuristic:
+                return 0
+            r, c = divmod(i, width)
+            return (math.sqrt((r - gr)**2 + (c - gc)**2) - math.sqrt((r - sr)**2 + (c - sc)**2)) / 2
+
+        if landmarks is not None:
+            bound = landmarks.bounds(start, goal)
+            offset = bound(start)[0] / 2
+
+            def potential(i):
+                to_goal, from_start = bound(i)
+                return (to_goal - from_start) / 2
+
+        frontiers = (make_queue(self.queue_type), make_queue(self.queue_type))
+        frontiers[0].put((start, 0), potential(start) + offset)
+        frontiers[1].put((goal, 0), offset - potential(goal))
+        costs = ({start: 0}, {goal: 0})
+        parents = ({start: None}, {goal: None})
+        signs = (1, -1)
+        tops = [0, 0] # Last key popped per side (keys pop in non-decreasing order)
+        best, meet = float('inf'), None
+
+        while not frontiers[0].empty() and not frontiers[1].empty():
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            current, g = frontiers[side].get()
+            tops[side] = g + signs[side] * potential(current) + offset
+            # Stopping criterion: any path still crossing both frontiers costs at least
+            # top_forward + top_backward (minus the two offsets)
+            if tops[0] + tops[1] - 2 * offset >= best:
+                break
+            if g > costs[side][current]:
+                continue # Stale entry (a cheaper one was queued after it)
+            self.visited += 1
+            if self.on_expand is not None:
+                self.on_expand(side, current)
+
+            mine, other = costs[side], costs[1 - side]
+            expand = maze.edges(current) if side == 0 else maze.reverse_edges(current)
+            for neighbor, step_cost in expand:
+                new_cost = g + step_cost
+                if neighbor not in mine or new_cost < mine[neighbor]:
+                    mine[neighbor] = new_cost
+                    parents[side][neighbor] = current
+                    frontiers[side].put((neighbor, new_cost), new_cost + signs[side] * potential(neighbor) + offset)
+                    if neighbor in other and new_cost + other[neighbor] < best:
+                        best, meet = new_cost + other[neighbor], neighbor
+
+        if meet is None:
+            return float('inf'), None
+        self.meeting_point = meet
+        return best, self.join(parents, meet)
+
+    @staticmethod
+    def join(parents, meet):
+        """start ... meet ... goal from the two parent maps"""
+        forward, backward = parents
+        path = []
+        curr = meet
+        while curr is not None:
+            path.append(curr)
+            curr = forward[curr]
+        path.reverse()
+        curr = backward[meet]
+        while curr is not None:
+            path.append(curr)
+            curr = backward[curr]
+        return path
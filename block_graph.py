@@ -0,0 +1,333 @@
+import heapq
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from game_classes import DIRECTIONS, STRAIGHT_STEP_COST, DIAGONAL_STEP_COST, WALL
+
+INF = float('inf')
+
+
+def block_tables(codes, width, bounds, sources):
+    """Dijkstra from every source cell, confined to one block rectangle.
+    Returns {source: dist} over the block's cell ids.
+    Module-level and pure (type bytes in, dicts out) so a process pool can run it."""
+    r0, r1, c0, c1 = bounds
+    tables = {}
+    for s in sources:
+        dist = {s: 0}
+        heap = [(0, s)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            r, c = divmod(u, width)
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if r0 <= nr < r1 and c0 <= nc < c1:
+                    j = nr * width + nc
+                    code = codes[j]
+                    if code == WALL:
+                        continue
+                    nd = d + (DIAGONAL_STEP_COST[code] if dr and dc else STRAIGHT_STEP_COST[code])
+                    if nd < dist.get(j, INF):
+                        dist[j] = nd
+                        heapq.heappush(heap, (nd, j))
+        tables[s] = dist
+    return tables
+
+
+def tables_for_blocks(codes, width, jobs):
+    """Pool task: block_tables for a chunk of (bounds, sources) jobs"""
+    return [block_tables(codes, width, bounds, sources) for bounds, sources in jobs]
+
+
+class BlockGraph:
+    """
+    HPA*-style abstraction over square clusters of cluster_size x cluster_size cells.
+    DynamicMaze.blocks (3-5 cells) are too small for this: a 5x5 block holds barely
+    more cells than entrances, so the abstract graph is as large as the grid.
+
+    Entrances: every walkable pair of cells (a, b) that are adjacent across the border
+    of two neighboring blocks (8-connectivity, so diagonal blocks meet at corners) is a
+    transition. Transitions whose cells are pairwise adjacent on both sides form one
+    entrance; its middle transition (straight steps preferred) is kept. Both of its
+    cells become abstract nodes.
+    Every block caches Dijkstra tables from each of its entrance cells, restricted to
+    the block: entrance-to-entrance distances give the intra edges.
+
+    search() inserts start and goal and runs A* over entrances. Only one transition
+    per entrance is kept, so the abstract path can detour; refine() therefore
+    re-plans on the grid inside the blocks the abstract path crossed.
+    update(nodes) re-derives transitions only on borders of the changed cells' blocks
+    and rebuilds tables only for blocks whose cells or entrances changed.
+
+    Tables are built serially by default. With workers > 1 (and more than one CPU), a
+    rebuild covering at least POOL_MIN_CELLS cells goes to a process pool. Measured
+    (benchmark_hpa.py): tables cost ~0.018 ms per cell, starting a spawn-mode pool
+    ~400 ms and shipping tables back ~7% of their build time, so even two workers
+    only break even at ~90k cells (a full 300x300 build). Per-event repairs never
+    get there.
+    """
+    CLUSTER_SIZE = 16
+    POOL_MIN_CELLS = 90000
+
+    def __init__(self, maze, workers=0, cluster_size=CLUSTER_SIZE):
+        self.maze = maze
+        self.workers = min(workers, os.cpu_count() or 1)
+        self.executor = None
+        self.size = cluster_size
+        self.bounds = {}
+        for br in range(math.ceil(maze.height / cluster_size)):
+            for bc in range(math.ceil(maze.width / cluster_size)):
+                self.bounds[(br, bc)] = (br * cluster_size, min((br + 1) * cluster_size, maze.height),
+                                         bc * cluster_size, min((bc + 1) * cluster_size, maze.width))
+        self.pair_reps = {} # (A, B) with A < B -> [(a, b)] kept transitions, a in A
+        self.entrances = {} # block -> set(cell id)
+        self.inter = {} # block -> {entrance: [(cell in other block, step cost)]}
+        self.tables = {} # block -> {entrance: dist}
+        self.intra = {} # entrance -> [(entrance in same block, cost)]
+        self.rebuilt_blocks = 0
+
+        codes = maze.type_codes()
+        for pair in self.all_pairs():
+            self.pair_reps[pair] = self.border_reps(codes, *pair)
+        for key in self.bounds:
+            self.refresh_entrances(key, codes)
+        self.rebuild_blocks(list(self.bounds), codes)
+        self.version = maze.version
+
+    def is_current(self):
+        return self.version == self.maze.version
+
+    def block_of(self, i):
+        r, c = divmod(i, self.maze.width)
+        return (r // self.size, c // self.size)
+
+    def neighbor_blocks(self, key):
+        br, bc = key
+        for dr, dc in DIRECTIONS:
+            other = (br + dr, bc + dc)
+            if other in self.bounds:
+                yield other
+
+    def all_pairs(self):
+        return {min(a, b) + max(a, b) for a in self.bounds for b in self.neighbor_blocks(a)}
+
+    # ==========================================
+    # Entrances
+    # ==========================================
+
+    def border_reps(self, codes, ar, ac, br, bc):
+        """Kept transitions between block A = (ar, ac) and block B = (br, bc)"""
+        width = self.maze.width
+        a0, a1, a2, a3 = self.bounds[(ar, ac)]
+        b0, b1, b2, b3 = self.bounds[(br, bc)]
+        transitions = []
+        # Only A's cells within one step of B can cross
+        for r in range(max(a0, b0 - 1), min(a1, b1 + 1)):
+            for c in range(max(a2, b2 - 1), min(a3, b3 + 1)):
+                a = r * width + c
+                if codes[a] == WALL:
+                    continue
+                for dr, dc in DIRECTIONS:
+                    nr, nc = r + dr, c + dc
+                    if b0 <= nr < b1 and b2 <= nc < b3 and codes[nr * width + nc] != WALL:
+                        transitions.append((a, nr * width + nc))
+
+        def close(i, j):
+            (ir, ic), (jr, jc) = divmod(i, width), divmod(j, width)
+            return max(abs(ir - jr), abs(ic - jc)) <= 1
+
+        reps = []
+        unassigned = sorted(transitions)
+        while unassigned:
+            cluster = [unassigned.pop(0)]
+            for t in cluster:
+                near = [u for u in unassigned if close(t[0], u[0]) and close(t[1], u[1])]
+                for u in near:
+                    unassigned.remove(u)
+                cluster.extend(near)
+            cluster.sort()
+            straight = [t for t in cluster if t[1] - t[0] in (width, -width, 1, -1)]
+            pick = straight or cluster
+            reps.append(pick[len(pick) // 2])
+        return reps
+
+    def pairs_of(self, key):
+        for other in self.neighbor_blocks(key):
+            yield min(key, other) + max(key, other)
+
+    def refresh_entrances(self, key, codes):
+        """Recollect key's entrances and inter edges from its border pairs.
+        Returns True if the entrance set changed."""
+        width = self.maze.width
+        entrances, inter = set(), {}
+        for pair in self.pairs_of(key):
+            mine = 0 if pair[:2] == key else 1
+            for t in self.pair_reps[pair]:
+                e, x = t[mine], t[1 - mine]
+                er, ec = divmod(e, width)
+                xr, xc = divmod(x, width)
+                code = codes[x]
+                cost = DIAGONAL_STEP_COST[code] if er != xr and ec != xc else STRAIGHT_STEP_COST[code]
+                entrances.add(e)
+                inter.setdefault(e, []).append((x, cost))
+        changed = entrances != self.entrances.get(key)
+        self.entrances[key] = entrances
+        self.inter[key] = inter
+        return changed
+
+    # ==========================================
+    # Intra-block tables
+    # ==========================================
+
+    def rebuild_blocks(self, keys, codes):
+        jobs = [(self.bounds[key], sorted(self.entrances[key])) for key in keys]
+        width = self.maze.width
+        cells = sum((r1 - r0) * (c1 - c0) for (r0, r1, c0, c1), _ in jobs)
+        if self.workers > 1 and cells >= self.POOL_MIN_CELLS:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers)
+            data = bytes(codes)
+            step = math.ceil(len(jobs) / self.workers)
+            chunks = [jobs[i:i + step] for i in range(0, len(jobs), step)]
+            results = [t for part in self.executor.map(tables_for_blocks, [data] * len(chunks),
+                                                       [width] * len(chunks), chunks) for t in part]
+        else:
+            results = [block_tables(codes, width, bounds, sources) for bounds, sources in jobs]
+
+        for key, tables in zip(keys, results):
+            for e in self.tables.get(key, ()):
+                self.intra.pop(e, None)
+            self.tables[key] = tables
+            entrances = self.entrances[key]
+            for e, dist in tables.items():
+                self.intra[e] = [(f, dist[f]) for f in entrances if f != e and f in dist]
+        self.rebuilt_blocks += len(keys)
+
+    def close(self):
+        """Shut the worker pool down (if one was started)"""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def update(self, nodes):
+        """Cells in nodes changed type: repair only the blocks around them"""
+        codes = self.maze.type_codes()
+        changed_blocks, pairs = set(), set()
+        for node in nodes:
+            key = self.block_of(node.id)
+            changed_blocks.add(key)
+            pairs.update(self.pairs_of(key))
+        for pair in pairs:
+            self.pair_reps[pair] = self.border_reps(codes, *pair)
+
+        dirty = set(changed_blocks)
+        for pair in pairs:
+            for key in (pair[:2], pair[2:]):
+                if key not in dirty and self.refresh_entrances(key, codes):
+                    dirty.add(key)
+        for key in changed_blocks:
+            self.refresh_entrances(key, codes)
+        self.rebuild_blocks(sorted(dirty), codes)
+        self.version = self.maze.version
+        return dirty
+
+    # ==========================================
+    # Queries
+    # ==========================================
+
+    def search(self, start, goal, on_expand=None):
+        """Cell ids after start up to goal (like GreedyAI.full_path, as ids), or None"""
+        if start == goal:
+            return []
+        codes = self.maze.type_codes()
+        width = self.maze.width
+        s_block, g_block = self.block_of(start), self.block_of(goal)
+        start_table = block_tables(codes, width, self.bounds[s_block], [start])[start]
+        goal_tables = self.tables[g_block]
+        gr, gc = divmod(goal, width)
+
+        def h(i):
+            r, c = divmod(i, width)
+            return math.sqrt((r - gr)**2 + (c - gc)**2)
+
+        def edges(u):
+            block = self.block_of(u)
+            if u == start:
+                dist = start_table
+                out = [(f, dist[f]) for f in self.entrances[s_block] if f != u and f in dist]
+                if goal in dist:
+                    out.append((goal, dist[goal]))
+            else:
+                out = list(self.intra.get(u, ()))
+                if block == g_block and goal in goal_tables[u]:
+                    out.append((goal, goal_tables[u][goal]))
+            out.extend(self.inter[block].get(u, ()))
+            return out
+
+        cost_so_far = {start: 0}
+        came_from = {start: None}
+        frontier = [(h(start), 0, start)]
+        count = 1
+        while frontier:
+            _, _, u = heapq.heappop(frontier)
+            if on_expand is not None:
+                on_expand(u)
+            if u == goal:
+                return self.refine(came_from, start, goal, on_expand)
+            d = cost_so_far[u]
+            for w, cost in edges(u):
+                nd = d + cost
+                if nd < cost_so_far.get(w, INF):
+                    cost_so_far[w] = nd
+                    came_from[w] = u
+                    heapq.heappush(frontier, (nd + h(w), count, w))
+                    count += 1
+        return None
+
+    def refine(self, came_from, start, goal, on_expand=None):
+        """Abstract hops -> grid cell ids after start: A* on the grid, confined to the
+        blocks the abstract path passes through (a corridor a few blocks wide)"""
+        corridor = set()
+        cur = goal
+        while cur is not None:
+            corridor.add(self.block_of(cur))
+            cur = came_from[cur]
+
+        codes = self.maze.type_codes()
+        width, height = self.maze.width, self.maze.height
+        size = self.size
+        gr, gc = divmod(goal, width)
+        cost_so_far = {start: 0}
+        parent = {start: None}
+        frontier = [(0, start)]
+        while frontier:
+            _, u = heapq.heappop(frontier)
+            if u == goal:
+                break
+            if on_expand is not None:
+                on_expand(u)
+            d = cost_so_far[u]
+            r, c = divmod(u, width)
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if not (0 <= nr < height and 0 <= nc < width) or (nr // size, nc // size) not in corridor:
+                    continue
+                j = nr * width + nc
+                code = codes[j]
+                if code == WALL:
+                    continue
+                nd = d + (DIAGONAL_STEP_COST[code] if dr and dc else STRAIGHT_STEP_COST[code])
+                if nd < cost_so_far.get(j, INF):
+                    cost_so_far[j] = nd
+                    parent[j] = u
+                    heapq.heappush(frontier, (nd + math.sqrt((nr - gr)**2 + (nc - gc)**2), j))
+
+        path = []
+        x = goal
+        while x != start:
+            path.append(x)
+            x = parent[x]
+        path.reverse()
+        return path
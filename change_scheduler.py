@@ -0,0 +1,35 @@
+import heapq
+import itertools
+
+
+class ChangeScheduler:
+    """
+    Pending maze changes keyed by absolute due time (a min-heap).
+
+    Instead of counting every timer down every frame, a change is pushed with the
+    time its current phase ends; pop_due(now) hands back just the changes whose
+    phase is over, as one batch in due order (ties in scheduling order).
+    """
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, due, change):
+        heapq.heappush(self.heap, (due, next(self.counter), change))
+
+    def pop_due(self, now):
+        heap = self.heap
+        batch = []
+        while heap and heap[0][0] <= now:
+            batch.append(heapq.heappop(heap)[2])
+        return batch
+
+    def next_due(self):
+        """Earliest due time, or None when nothing is pending"""
+        return self.heap[0][0] if self.heap else None
+
+    def clear(self):
+        self.heap = []
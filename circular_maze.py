@@ -1,12 +1,23 @@
 import math
 import random
 from collections import deque
+from ring_alignment import earliest_arrival
+
+try:
+    import numpy as np # Optional: vectorized DP layers
+except ImportError:
+    np = None
 
 class CircularNode:
     """Node in a polar coordinate system with edge-based walls."""
-    def __init__(self, ring, sector, cost=1):
+    __slots__ = ('r', 'c', 'id', 'cost', 'type', 'walls', 'dp_cost', 'best_action',
+                 'times_evaluated', 'visited_by_ai', 'visited_by_player',
+                 'explored_by_ai', 'heuristic_value', 'neighbors')
+
+    def __init__(self, ring, sector, cost=1, node_id=-1):
         self.r = ring    # Ring Index (0=Center, 1=Inner... N-1=Outer)
         self.c = sector  # Sector Index (0..Sectors-1)
+        self.id = node_id  # ring * sectors + sector; also the (precomputed) hash
         self.cost = cost
         self.type = '.' # Default type (for compatibility with existing rendering checks)
         
@@ -23,14 +34,88 @@ class CircularNode:
         self.times_evaluated = 0
         self.visited_by_ai = False
         self.visited_by_player = False
+        self.explored_by_ai = False
+        self.heuristic_value = None
         self.neighbors = {} 
 
     def __repr__(self):
         return f"Node(R{self.r}, S{self.c})"
 
+    def __hash__(self):
+        # Equality stays identity-based: the center node shares (0, 0) with grid[0][0]
+        return self.id
+
     def __lt__(self, other):
         return self.dp_cost < other.dp_cost
 
+class NodeWalls:
+    """A grid node's walls, read from and written to the maze's wall buffers
+    (same ['cw'] / ['in'] interface the per-node dict had)"""
+    __slots__ = ('maze', 'id')
+
+    def __init__(self, maze, node_id):
+        self.maze = maze
+        self.id = node_id
+
+    def buffer(self, key):
+        if key == 'cw':
+            return self.maze.cw_walls
+        if key == 'in':
+            return self.maze.in_walls
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        return self.buffer(key)[self.id] == 1
+
+    def __setitem__(self, key, blocked):
+        self.buffer(key)[self.id] = 1 if blocked else 0
+        self.maze.walls_version += 1 # Pre-rendered rings are stale
+
+    def __repr__(self):
+        return f"{{'cw': {self['cw']}, 'in': {self['in']}}}"
+
+class PolarGeometry:
+    """
+    Screen layout of a CircularMaze for one window size, computed once.
+    Ring r is the band [r * ring_step, (r + 1) * ring_step] around (cx, cy).
+    Angles are sampled `samples` times per sector starting at the top (-90 deg),
+    with ring rotation left out: unit[i] is the (cos, sin) of sample i, so a
+    ring drawn from it is unrotated and its offset is applied afterwards as a
+    single angle (offset * angle_step degrees).
+    """
+    SAMPLES = 10 # Arc points per sector
+
+    def __init__(self, screen_size, num_rings, sectors):
+        w, h = screen_size
+        self.size = (w, h)
+        self.cx, self.cy = w // 2, h // 2 + 30 # Center point with header offset
+        self.max_radius = min(w, h) // 2 - 50
+        self.ring_step = self.max_radius // (num_rings + 0.5)
+        self.sectors = sectors
+        self.angle_step = 360 / sectors
+        steps = sectors * self.SAMPLES
+        self.unit = [(math.cos(a), math.sin(a))
+                     for a in (math.radians(-90 + i * 360 / steps) for i in range(steps + 1))]
+        # Radians of each sector's middle, before rotation
+        self.sector_mid = [math.radians(-90 + (s + 0.5) * self.angle_step) for s in range(sectors)]
+
+    def arc(self, start, count, radius, origin):
+        """count + 1 points of the arc from sample `start`, around origin"""
+        ox, oy = origin
+        unit = self.unit
+        return [(ox + unit[i][0] * radius, oy + unit[i][1] * radius) for i in range(start, start + count + 1)]
+
+    def band(self, s, inner, outer, origin):
+        """Closed outline of sector s between two radii (outer arc, then inner arc back)"""
+        start = s * self.SAMPLES
+        return self.arc(start, self.SAMPLES, outer, origin) + self.arc(start, self.SAMPLES, inner, origin)[::-1]
+
+    def spoke(self, s, inner, outer, origin):
+        """Segment along the clockwise edge of sector s between two radii"""
+        ox, oy = origin
+        ux, uy = self.unit[(s + 1) * self.SAMPLES]
+        return (ox + ux * inner, oy + uy * inner), (ox + ux * outer, oy + uy * outer)
+
 class RingConfig:
     def __init__(self, sectors, speed):
         self.sectors = sectors
@@ -64,7 +149,7 @@ class CircularMaze:
         self.generate_maze_structure()
         
         # Center is a single special node (not part of grid)
-        self.center_node = CircularNode(0, 0)
+        self.center_node = CircularNode(0, 0, node_id=num_rings * sectors)
         self.center_node.type = 'G'
         
         # Start at Outer Ring, sector 0
@@ -77,13 +162,26 @@ class CircularMaze:
         self.width = sectors
         self.height = num_rings
         
+        # Array overhead only pays off past a few hundred cells
+        self.dp_engine = 'numpy' if np is not None and num_rings * sectors >= self.DP_NUMPY_MIN_CELLS else 'python'
+        self.reset_dp_cache()
+        
     def generate_grid(self):
-        """Generate polar grid. Ring 0 is special center node, rings 1...N-1 are in grid."""
+        """Generate polar grid. Ring 0 is special center node, rings 1...N-1 are in grid.
+        Walls live in two flat buffers indexed r*S+s (1 = blocked): cw_walls between
+        (r, s) and (r, s+1), in_walls between (r, s) and the ring inside; node.walls
+        is a view over them."""
+        count = self.num_rings * self.sectors_per_ring
+        self.walls_version = 0 # Bumped by every NodeWalls write
+        self.geometry = None # PolarGeometry of the last screen size asked for
+        self.cw_walls = bytearray(b'\x01') * count
+        self.in_walls = bytearray(b'\x01') * count
         self.grid = []
         for r in range(self.num_rings):
             row = []
             for s in range(self.sectors_per_ring):
-                node = CircularNode(r, s)
+                node = CircularNode(r, s, node_id=r * self.sectors_per_ring + s)
+                node.walls = NodeWalls(self, node.id)
                 row.append(node)
             self.grid.append(row)
 
@@ -91,64 +189,55 @@ class CircularMaze:
         """
         Recursive Backtracker to generate valid labyrinth.
         Starts from Center (0,0) and carves out.
+        Runs on cell indices r*S+s and the wall buffers (walls start all True).
         """
-        # Reset walls to all True (already default)
-        
-        stack = []
-        visited = set()
+        S, R = self.sectors_per_ring, self.num_rings
+        cw, inner = self.cw_walls, self.in_walls
+        visited = bytearray(R * S)
         
         # Start from ring 1 (first actual ring, since ring 0 is single center node)
-        start_sector = random.randint(0, self.sectors_per_ring - 1)
-        start = self.grid[1][start_sector]
-        visited.add((1, start_sector))
-        stack.append(start)
+        start_sector = random.randint(0, S - 1)
+        start = S + start_sector
+        visited[start] = 1
+        stack = [start]
         
         while stack:
             current = stack[-1]
-            r, c = current.r, current.c
+            r, c = divmod(current, S)
+            base = r * S
             
             # Get unvisited neighbors (static connectivity for generation)
             # We assume static alignment (offset=0) for generation
             candidates = []
-            
-            # 1. CW
-            n_cw = self.grid[r][(c + 1) % self.sectors_per_ring]
-            if (n_cw.r, n_cw.c) not in visited:
+            n_cw = base + (c + 1) % S # 1. CW
+            if not visited[n_cw]:
                 candidates.append(('cw', n_cw))
-                
-            # 2. CCW
-            n_ccw = self.grid[r][(c - 1) % self.sectors_per_ring]
-            if (n_ccw.r, n_ccw.c) not in visited:
+            n_ccw = base + (c - 1) % S # 2. CCW
+            if not visited[n_ccw]:
                 candidates.append(('ccw', n_ccw))
-                
-            # 3. Out (r -> r+1)
-            if r < self.num_rings - 1:
-                n_out = self.grid[r+1][c] # Assume aligned at start
-                if (n_out.r, n_out.c) not in visited:
-                    candidates.append(('out', n_out))
-                    
-            # 4. In (r -> r-1) - stop at ring 1 (center is separate node)
-            if r > 1:
-                n_in = self.grid[r-1][c] # Assume aligned at start
-                if (n_in.r, n_in.c) not in visited:
-                    candidates.append(('in', n_in))
+            if r < R - 1: # 3. Out (r -> r+1), aligned at start
+                if not visited[current + S]:
+                    candidates.append(('out', current + S))
+            if r > 1: # 4. In (r -> r-1) - stop at ring 1 (center is separate node)
+                if not visited[current - S]:
+                    candidates.append(('in', current - S))
             
             if candidates:
                 # Choose random neighbor
-                direction, next_node = random.choice(candidates)
+                direction, nxt = random.choice(candidates)
                 
                 # Remove wall
                 if direction == 'cw':
-                    current.walls['cw'] = False # Wall is on current (r,c) facing CW
+                    cw[current] = 0 # Wall is on current (r,c) facing CW
                 elif direction == 'ccw':
-                    next_node.walls['cw'] = False # Wall is on neighbor (r, c-1) facing CW
+                    cw[nxt] = 0 # Wall is on neighbor (r, c-1) facing CW
                 elif direction == 'in':
-                    current.walls['in'] = False # Wall on current (r,c) facing In
+                    inner[current] = 0 # Wall on current (r,c) facing In
                 elif direction == 'out':
-                    next_node.walls['in'] = False # Wall on neighbor (r+1, c) facing In
+                    inner[nxt] = 0 # Wall on neighbor (r+1, c) facing In
                 
-                visited.add((next_node.r, next_node.c))
-                stack.append(next_node)
+                visited[nxt] = 1
+                stack.append(nxt)
             else:
                 stack.pop()
                 
@@ -157,7 +246,7 @@ class CircularMaze:
         num_entries = random.randint(1, min(3, self.sectors_per_ring // 4))  # 1-3 entries
         entry_sectors = random.sample(range(self.sectors_per_ring), num_entries)
         for sector in entry_sectors:
-            self.grid[1][sector].walls['in'] = False  # Open path to center
+            inner[S + sector] = 0  # Open path to center
         
         # Open the 'in' wall for center to ensure it's accessible from any angle?
         # Actually recursive backtracker guarantees one path. 
@@ -170,15 +259,14 @@ class CircularMaze:
         
         # Post-processing: Add some loops (remove random walls)
         # to make it less of a perfect tree and more of a maze with options
-        for _ in range(int(self.num_rings * self.sectors_per_ring * 0.1)):
-            r = random.randint(0, self.num_rings - 1)
-            c = random.randint(0, self.sectors_per_ring - 1)
-            node = self.grid[r][c]
+        for _ in range(int(R * S * 0.1)):
+            r = random.randint(0, R - 1)
+            c = random.randint(0, S - 1)
             # Randomly open a wall
             if random.random() > 0.5:
-                node.walls['cw'] = False
+                cw[r * S + c] = 0
             elif r > 0 and random.random() > 0.5:
-                node.walls['in'] = False
+                inner[r * S + c] = 0
 
     def update(self, dt):
         """Update rotation physics"""
@@ -198,22 +286,21 @@ class CircularMaze:
         neighbors = []
         r, c = node.r, node.c
         S = self.sectors_per_ring
-        current_node = self.grid[r][c]
+        i = r * S + c
+        cw_walls, in_walls = self.cw_walls, self.in_walls
         
         # 1. Intra-Ring (CW/CCW)
-        # Check walls['cw'] of current and neighbor
+        # Check the cw walls of current and neighbor
         
         # CW Neighbor (r, c+1)
-        # Path exists if current.walls['cw'] is False
-        if not current_node.walls['cw']:
-            n_cw = self.grid[r][(c + 1) % S]
-            neighbors.append((n_cw, 1))
+        # Path exists if current's cw wall is open
+        if not cw_walls[i]:
+            neighbors.append((self.grid[r][(c + 1) % S], 1))
             
         # CCW Neighbor (r, c-1)
-        # Path exists if neighbor.walls['cw'] is False
-        n_ccw = self.grid[r][(c - 1) % S]
-        if not n_ccw.walls['cw']:
-            neighbors.append((n_ccw, 1))
+        # Path exists if neighbor's cw wall is open
+        if not cw_walls[r * S + (c - 1) % S]:
+            neighbors.append((self.grid[r][(c - 1) % S], 1))
             
         # 2. Inter-Ring (In/Out)
         # Depends on Alignment + Walls['in']
@@ -221,12 +308,12 @@ class CircularMaze:
         # Inner (r -> r-1)
         if r > 0:
             # We want to move from (r, c) to (r-1, ?).
-            # This is blocked if current_node.walls['in'] is True.
-            # CRITICAL: walls['in'] rotates with the ring!
+            # This is blocked if current's in wall is set.
+            # CRITICAL: the in wall rotates with the ring!
             # But 'node' is the logical grid slot. 
             # So if self.grid[r][c] has a wall, it rotates with sector c.
             
-            if not current_node.walls['in']:
+            if not in_walls[i]:
                 if r == 1:
                     # Ring 1 connects directly to center (single node)
                     neighbors.append((self.center_node, 1))
@@ -243,8 +330,7 @@ class CircularMaze:
                     s_in_float = (global_angle_r - off_inner) % S
                     s_in = round(s_in_float) % S
                     
-                    diff = abs(s_in - s_in_float)
-                    if diff > 0.5: diff = 1.0 - diff 
+                    diff = abs(round(s_in_float) - s_in_float) # Before the wrap to 0
                     
                     if diff < 0.4: # Aligned
                         target = self.grid[r-1][s_in]
@@ -264,14 +350,12 @@ class CircularMaze:
             s_out_float = (global_angle_r - off_outer) % S
             s_out = round(s_out_float) % S
             
-            diff = abs(s_out - s_out_float)
-            if diff > 0.5: diff = 1.0 - diff
+            diff = abs(round(s_out_float) - s_out_float) # Before the wrap to 0
             
             if diff < 0.4:
-                 target = self.grid[r+1][s_out]
                  # Valid if target does NOT have an inner wall
-                 if not target.walls['in']:
-                     neighbors.append((target, 1))
+                 if not in_walls[(r + 1) * S + s_out]:
+                     neighbors.append((self.grid[r+1][s_out], 1))
 
         return neighbors
 
@@ -285,16 +369,13 @@ class CircularMaze:
         
         # Intra-ring
         if dr == 0:
-            target_c = (node.c + dc) % self.sectors_per_ring
-            target = self.grid[node.r][target_c]
-            
-            # check connectivity using get_neighbors logic 
-            # (simpler: just check if target is in neighbors)
-            # This handles the wall checks
-            nbs = self.get_neighbors(node)
-            if target in nbs:
-                return target
-            return None
+            S = self.sectors_per_ring
+            target = self.grid[node.r][(node.c + dc) % S]
+            if dc == 1: # Through our own cw wall
+                return target if not self.cw_walls[node.r * S + node.c] else None
+            if dc == -1: # Through the neighbor's cw wall
+                return target if not self.cw_walls[target.id] else None
+            return target if target in self.get_neighbors(node) else None
             
         # Inter-ring
         neighbors = self.get_weighted_neighbors(node)
@@ -303,86 +384,187 @@ class CircularMaze:
                 return n
         return None
 
+    # ==========================================
+    # Time-expanded DP
+    # At a given time every ring pair (r, r-1) is either misaligned everywhere
+    # or aligned with one integer sector shift, so a DP layer only depends on
+    # the walls, the shifts at its time step and the layer after it. Layers are
+    # cached by that suffix of shifts: ring motion is periodic, so the same
+    # phases come back and most frames reuse every layer; when a shift changes
+    # at step t, only layers 0..t are recomputed.
+    # With NumPy (dp_engine 'numpy') a layer is a (rings, sectors) int array:
+    # moves along a ring are np.roll's of the next layer, moves between rings
+    # gathers at the per-step shifts, and every option is one masked minimum.
+    # ==========================================
+
+    DP_HORIZON = 15
+    DP_CACHE_LIMIT = 4096 # Cached layers kept before the cache is cleared
+    DP_BLOCKED = 1 << 30 # "No move" in the NumPy layers (values stay exact ints)
+    DP_NUMPY_MIN_CELLS = 512
+
+    def reset_dp_cache(self):
+        """Call after changing walls (or dp_engine): cached DP layers assume the current ones"""
+        S, R = self.sectors_per_ring, self.num_rings
+        self.dp_cw_open = [w == 0 for w in self.cw_walls]
+        self.dp_in_open = [w == 0 for w in self.in_walls]
+        terminal = [0] * S + [r * 2 for r in range(1, R) for _ in range(S)]
+        self.dp_cache_engine = self.dp_engine
+        if self.dp_engine == 'numpy':
+            cw = np.frombuffer(bytes(self.cw_walls), dtype=np.uint8).reshape(R, S) == 0
+            self.dp_masks = {
+                'cw': cw,
+                'ccw': np.roll(cw, 1, axis=1), # (r, s) -> (r, s-1) needs s-1's cw wall open
+                'in': np.frombuffer(bytes(self.in_walls), dtype=np.uint8).reshape(R, S) == 0,
+                'sectors': np.arange(S),
+                'speeds': np.array([cfg.speed for cfg in self.ring_configs]),
+            }
+            terminal = np.array(terminal, dtype=np.int64).reshape(R, S)
+        self.dp_suffix_ids = {} # (shifts at t, id of the suffix after t) -> suffix id
+        self.dp_layers = [terminal] # suffix id -> values (r*S+s), id 0 = heuristic at T
+        self.dp_top = None # Suffix id whose layer 0 is in the nodes' dp_cost
+        self.dp_layers_computed = 0
+
+    def pair_shift(self, r, t):
+        """Sector shift s_inner - s_outer aligning ring r with ring r-1 at time t ahead, or None"""
+        S = self.sectors_per_ring
+        d = ((self.offsets[r] + self.ring_configs[r].speed * t)
+             - (self.offsets[r - 1] + self.ring_configs[r - 1].speed * t)) % S
+        k = round(d)
+        return k % S if abs(k - d) < 0.4 else None
+
+    def dp_layer(self, shifts, nxt):
+        """Values at one time step from the values at the next (shifts[r - 2] aligns r with r-1)"""
+        S, R = self.sectors_per_ring, self.num_rings
+        cw_open, in_open = self.dp_cw_open, self.dp_in_open
+        layer = [0] * (R * S)
+        for r in range(1, R):
+            base = r * S
+            inner = shifts[r - 2] if r > 1 else None
+            outer = shifts[r - 1] if r < R - 1 else None
+            for s in range(S):
+                i = base + s
+                best = nxt[i] # Wait
+                if cw_open[i] and nxt[base + (s + 1) % S] < best:
+                    best = nxt[base + (s + 1) % S]
+                j = base + (s - 1) % S
+                if cw_open[j] and nxt[j] < best:
+                    best = nxt[j]
+                if in_open[i]:
+                    if r == 1:
+                        best = 0 # The center
+                    elif inner is not None and nxt[i - S - s + (s + inner) % S] < best:
+                        best = nxt[i - S - s + (s + inner) % S]
+                if outer is not None:
+                    j = base + S + (s - outer) % S
+                    if in_open[j] and nxt[j] < best:
+                        best = nxt[j]
+                layer[i] = 1 + best
+        return layer
+
+    def dp_steps_numpy(self, T):
+        """(cache key, (shifts, aligned)) per time step, all steps at once: row t holds
+        ring pairs (2, 1), (3, 2), ... at time t ahead"""
+        S, masks = self.sectors_per_ring, self.dp_masks
+        pos = np.array(self.offsets)[None, :] + masks['speeds'][None, :] * np.arange(T, dtype=float)[:, None]
+        d = (pos[:, 2:] - pos[:, 1:-1]) % S
+        k = np.round(d)
+        aligned = np.abs(k - d) < 0.4
+        k = np.where(aligned, k.astype(np.int64) % S, -1)
+        return [(k[t].tobytes(), (k[t], aligned[t])) for t in range(T)]
+
+    def dp_layer_numpy(self, shifts, nxt):
+        """dp_layer on (rings, sectors) arrays"""
+        k, aligned = shifts
+        masks, R, BLOCKED = self.dp_masks, self.num_rings, self.DP_BLOCKED
+        best = nxt.copy() # Wait
+        np.minimum(best, np.where(masks['cw'], np.roll(nxt, -1, axis=1), BLOCKED), out=best)
+        np.minimum(best, np.where(masks['ccw'], np.roll(nxt, 1, axis=1), BLOCKED), out=best)
+        best[1][masks['in'][1]] = 0 # Ring 1 -> the center
+        if R > 2:
+            sectors, aligned = masks['sectors'], aligned[:, None]
+            # Rings 2.. inward: (r, s) -> (r-1, s + k)
+            cols = (sectors[None, :] + k[:, None]) % self.sectors_per_ring
+            inner = np.take_along_axis(nxt[1:R - 1], cols, axis=1)
+            np.minimum(best[2:], np.where(masks['in'][2:] & aligned, inner, BLOCKED), out=best[2:])
+            # Rings ..R-2 outward: (r, s) -> (r+1, s - k), through the target's 'in' wall
+            cols = (sectors[None, :] - k[:, None]) % self.sectors_per_ring
+            outer = np.take_along_axis(nxt[2:], cols, axis=1)
+            open_out = np.take_along_axis(masks['in'][2:], cols, axis=1) & aligned
+            np.minimum(best[1:R - 1], np.where(open_out, outer, BLOCKED), out=best[1:R - 1])
+        best += 1
+        best[0] = 0 # Center ring
+        return best
+
     def run_dp(self):
-        """Time-Expanded DP (Optimized)"""
-        T = 15 
-        values = {}
-        
-        # Base cases
-        for t in range(T + 1):
-             for s in range(self.sectors_per_ring):
-                 values[(t, 0, s)] = 0
+        """Time-Expanded DP (Optimized): cost-to-center over DP_HORIZON one-second steps"""
+        T = self.DP_HORIZON
+        if len(self.dp_layers) > self.DP_CACHE_LIMIT or self.dp_cache_engine != self.dp_engine:
+            self.reset_dp_cache()
+        ids, layers = self.dp_suffix_ids, self.dp_layers
+        if self.dp_engine == 'numpy':
+            steps, layer_of = self.dp_steps_numpy(T), self.dp_layer_numpy
+        else:
+            steps, layer_of = [], self.dp_layer
+            for t in range(T):
+                shifts = tuple(self.pair_shift(r, t * 1.0) for r in range(2, self.num_rings))
+                steps.append((shifts, shifts))
         
-        # Fill heuristic
-        for r in range(1, self.num_rings):
-            for s in range(self.sectors_per_ring):
-                values[(T, r, s)] = r * 2
-                
-        # Backwards Induction
+        # Backwards Induction, reusing every layer whose suffix of shifts was seen before
+        suffix = 0
         for t in range(T - 1, -1, -1):
-            for r in range(1, self.num_rings):
-                for s in range(self.sectors_per_ring):
-                    node = self.grid[r][s]
-                    
-                    wait_cost = 1 + values.get((t+1, r, s), float('inf'))
-                    
-                    move_costs = []
-                    for neigh, cost in self.get_weighted_neighbors(node, future_time=t*1.0):
-                         val = cost + values.get((t+1, neigh.r, neigh.c), float('inf'))
-                         move_costs.append(val)
-                    
-                    best = min(wait_cost, min(move_costs) if move_costs else float('inf'))
-                    values[(t, r, s)] = best
-                    
-        for r in range(self.num_rings):
-            for s in range(self.sectors_per_ring):
-                self.grid[r][s].dp_cost = values.get((0, r, s), float('inf'))
+            step_key, shifts = steps[t]
+            key = (step_key, suffix)
+            suffix = ids.get(key)
+            if suffix is None:
+                layers.append(layer_of(shifts, layers[key[1]]))
+                self.dp_layers_computed += 1
+                suffix = ids[key] = len(layers) - 1
+        
+        if suffix != self.dp_top:
+            self.dp_top = suffix
+            values = layers[suffix]
+            if self.dp_engine == 'numpy':
+                values = values.ravel().tolist()
+            S = self.sectors_per_ring
+            for r in range(self.num_rings):
+                for s in range(S):
+                    self.grid[r][s].dp_cost = values[r * S + s]
                 
     # Compatibility Methods
     def bfs_analysis(self): pass
     def generate_heuristic_map(self): pass
     def a_star_optimal(self):
-        """Return DP cost from start"""
-        # Run DP once to populate
+        """Exact time to reach the center from start (earliest-arrival search, no horizon)"""
+        # Run DP once to populate the dp_cost overlay
         self.run_dp()
-        self.optimal_path_length = self.start_node.dp_cost
+        self.optimal_path_length, self.optimal_plan = self.earliest_arrival()
         return self.optimal_path_length
 
+    def earliest_arrival(self, start=None, move_time=1.0):
+        """(arrival time, [(depart time, from node, to node)]) of the fastest wait-and-move
+        plan from start to the center, from the current offsets (see ring_alignment)"""
+        return earliest_arrival(self, start, move_time)
+
+    def screen_geometry(self, screen_size):
+        """PolarGeometry for this window size (rebuilt only when the size changes)"""
+        geo = self.geometry
+        if geo is None or geo.size != tuple(screen_size):
+            geo = self.geometry = PolarGeometry(screen_size, self.num_rings, self.sectors_per_ring)
+        return geo
+
     def get_screen_pos(self, node, screen_size):
         """
         Convert logical Node(r, c) to screen coordinates (x, y).
         Aligns perfectly with draw_circular_maze.
         """
-        w, h = screen_size
-        cx, cy = w // 2, h // 2 + 30 
-        
-        # Consistent radius calculation with draw_circular_maze
-        max_radius = min(w, h) // 2 - 50
-        num_rings = self.num_rings
-        ring_step = max_radius // (num_rings + 0.5)
-        
+        geo = self.screen_geometry(screen_size)
         pr, pc = node.r, node.c
-        S = self.sectors_per_ring
-        
-        # Calculate Angle
-        # Player rotates with the ring!
-        angle_step = 360 / S
-        
-        # Current ring offset (in sectors)
-        offset_sectors = self.offsets[pr]
-        
-        # Total angle in degrees (0 is Top for calculation here? or follow draw logic?)
-        # Main.py logic:
-        # start_deg = -90 + (s * angle_step) + (offset * angle_step)
-        # center of sector = start_deg + angle_step/2
-        
-        sector_center_deg = -90 + (pc * angle_step) + (offset_sectors * angle_step) + (angle_step / 2)
-        p_rad = math.radians(sector_center_deg)
-        
+        # Middle of the sector, turned with its ring (offsets are in sectors)
+        p_rad = geo.sector_mid[pc] + math.radians(self.offsets[pr] * geo.angle_step)
         # Radius: Center of the ring band
-        p_dist = (pr * ring_step) + (ring_step / 2)
+        p_dist = (pr * geo.ring_step) + (geo.ring_step / 2)
         
-        px = cx + math.cos(p_rad) * p_dist
-        py = cy + math.sin(p_rad) * p_dist
+        px = geo.cx + math.cos(p_rad) * p_dist
+        py = geo.cy + math.sin(p_rad) * p_dist
         
         return int(px), int(py)
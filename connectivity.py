@@ -0,0 +1,175 @@
+from collections import deque
+
+
+class ConnectivityOracle:
+    """
+    Which walkable cells can still reach each other, maintained across wall changes.
+
+    Union-find over "elements": every walkable cell points at an element and
+    the roots carry live component sizes.
+    - A wall disappearing only ever merges components: new element, union with
+      the walkable neighbors.
+    - A wall appearing can split one. If the cell was in at most one biconnected
+      block nothing splits. Otherwise each block it belonged to leaves a separate
+      piece behind; breadth-first searches from one seed per piece run in lockstep
+      until only one is still going, and just the finished (smaller) pieces move
+      to fresh elements. Without block information the whole component is relabeled.
+
+    connected(a, b) and component_size(a) take Nodes and cost a couple of find()s.
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.parent = []
+        self.size = [] # Live cells per root element
+        self.label = {} # cell id -> element
+        self.relabeled = 0 # Cells moved to new elements by splits (repair work)
+        self.rebuild()
+
+    def rebuild(self):
+        maze = self.maze
+        self.parent, self.size, self.label = [], [], {}
+        for i in range(maze.width * maze.height):
+            if maze.cell_code(i) != ord('#') and i not in self.label:
+                self.flood(i)
+        self.version = maze.version
+
+    def is_current(self):
+        """Only trust answers if every type change since the build went through update()"""
+        return self.version == self.maze.version
+
+    def new_element(self, live):
+        e = len(self.parent)
+        self.parent.append(e)
+        self.size.append(live)
+        return e
+
+    def find(self, e):
+        parent = self.parent
+        root = e
+        while parent[root] != root:
+            root = parent[root]
+        while parent[e] != root: # Path compression
+            parent[e], e = root, parent[e]
+        return root
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+    def flood(self, seed):
+        """Label seed's whole component with one fresh element"""
+        e = self.new_element(0)
+        label = self.label
+        label[seed] = e
+        queue = deque([seed])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            for w in self.maze.neighbor_ids(u):
+                if label.get(w) != e:
+                    label[w] = e
+                    queue.append(w)
+        self.size[e] = count
+        return count
+
+    # ==========================================
+    # Updates
+    # ==========================================
+
+    def update(self, node, blocks=None):
+        """node just changed walkability. blocks: cell sets of the biconnected blocks
+        node belonged to before a wall appeared on it (enables the local repair)."""
+        v = node.id
+        if node.type != '#':
+            if v not in self.label:
+                self.add_cell(v)
+        elif v in self.label:
+            self.remove_cell(v, blocks)
+        if len(self.parent) > 4 * self.maze.width * self.maze.height:
+            self.rebuild() # Dead elements pile up after many splits
+        self.version = self.maze.version
+
+    def add_cell(self, v):
+        e = self.new_element(1)
+        self.label[v] = e
+        for w in self.maze.neighbor_ids(v):
+            e = self.union(e, self.label[w])
+
+    def remove_cell(self, v, blocks):
+        root = self.find(self.label.pop(v))
+        self.size[root] -= 1
+        if blocks is not None and len(blocks) <= 1:
+            return # Not an articulation point: the component stays in one piece
+
+        if blocks is None:
+            # No block structure: relabel every piece of the old component
+            self.size[root] = 0
+            for w in self.walkable_around(v):
+                if self.find(self.label[w]) == root:
+                    self.relabeled += self.flood(w)
+            return
+
+        # Each block minus v is still connected: any of its other cells seeds its piece
+        claimed = {}
+        searches = []
+        for k, block in enumerate(blocks):
+            seed = next(i for i in block if i != v)
+            claimed[seed] = k
+            searches.append((k, deque([seed]), [seed]))
+
+        # Lockstep BFS: the piece still growing when all others are done keeps the old label
+        active = searches
+        while len(active) > 1:
+            still = []
+            for k, queue, cells in active:
+                u = queue.popleft()
+                for w in self.maze.neighbor_ids(u):
+                    if w not in claimed:
+                        claimed[w] = k
+                        cells.append(w)
+                        queue.append(w)
+                if queue:
+                    still.append((k, queue, cells))
+            active = still
+
+        keep = active[0][0] if active else None
+        for k, _, cells in searches:
+            if k == keep:
+                continue
+            e = self.new_element(len(cells))
+            for i in cells:
+                self.label[i] = e
+            self.size[root] -= len(cells)
+            self.relabeled += len(cells)
+
+    def walkable_around(self, v):
+        """Walkable cells next to v (v itself may already be a wall, with no edges left)"""
+        maze = self.maze
+        r, c = divmod(v, maze.width)
+        return [nr * maze.width + nc
+                for nr in (r - 1, r, r + 1) for nc in (c - 1, c, c + 1)
+                if 0 <= nr < maze.height and 0 <= nc < maze.width and (nr, nc) != (r, c)
+                and maze.cell_code(nr * maze.width + nc) != ord('#')]
+
+    # ==========================================
+    # Queries
+    # ==========================================
+
+    def component_of(self, node):
+        e = self.label.get(node.id)
+        return None if e is None else self.find(e)
+
+    def connected(self, a, b):
+        ca = self.component_of(a)
+        return ca is not None and ca == self.component_of(b)
+
+    def component_size(self, node):
+        root = self.component_of(node)
+        return 0 if root is None else self.size[root]
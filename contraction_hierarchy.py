@@ -0,0 +1,216 @@
+import heapq
+
+INF = float('inf')
+
+
+class ContractionHierarchy:
+    """
+    Contraction-hierarchy distance oracle over a static Maze's weighted graph
+    (the same directed CSR step costs a_star_optimal searches).
+
+    Preprocessing contracts cells one at a time, cheapest first (edge difference:
+    shortcuts added minus edges removed, plus a bit for contracted neighbors).
+    Removing v adds a shortcut u -> w (cost c(u,v) + c(v,w)) unless a witness search
+    finds a path at least as cheap that avoids v.
+    A query is a bidirectional Dijkstra that only climbs: the forward side follows
+    edges to higher-ranked cells, the backward side reversed edges to higher-ranked
+    cells. Shortcuts remember their middle cell so paths unpack back to grid steps.
+
+    query(s, t) -> (cost, [Node, ...]) from s to t inclusive, (inf, None) if unreachable
+    search(s, t) -> the same query with its meeting cell and both search spaces (cell ids)
+    query_many(pairs) -> list of those, for batch evaluation
+    """
+    WITNESS_SETTLE_LIMIT = 60 # Bounded witness searches: a few extra shortcuts are harmless
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.version = maze.version
+        self.rank = {}
+        self.middle = {} # (u, w) -> contracted cell the shortcut u -> w skips
+        self.up = {} # v -> [(w, cost)] with rank[w] > rank[v]
+        self.down = {} # v -> [(u, cost)] for edges u -> v with rank[u] > rank[v]
+        self.shortcuts = 0
+        self.build()
+
+    # ==========================================
+    # Preprocessing
+    # ==========================================
+
+    def build(self):
+        maze = self.maze
+        out_edges, in_edges = {}, {}
+        for v in range(maze.width * maze.height):
+            if maze.cell_code(v) == ord('#'):
+                continue
+            out_edges[v] = dict(maze.edges(v))
+            in_edges.setdefault(v, {})
+            for w, cost in out_edges[v].items():
+                in_edges.setdefault(w, {})[v] = cost
+
+        contracted_neighbors = dict.fromkeys(out_edges, 0)
+        queue = [(self.edge_difference(v, out_edges, in_edges, contracted_neighbors), v) for v in out_edges]
+        heapq.heapify(queue)
+        order = 0
+
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: priorities go stale as neighbors get contracted
+            priority = self.edge_difference(v, out_edges, in_edges, contracted_neighbors)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, v))
+                continue
+
+            self.rank[v] = order
+            order += 1
+            for u, w, cost in self.shortcuts_for(v, out_edges, in_edges):
+                if cost < out_edges[u].get(w, INF):
+                    if w not in out_edges[u]:
+                        self.shortcuts += 1
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    self.middle[(u, w)] = v
+
+            # Remaining edges of v all point at higher ranks: keep them for queries
+            self.up[v] = list(out_edges[v].items())
+            for u, cost in in_edges[v].items():
+                self.down.setdefault(v, []).append((u, cost))
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+            del out_edges[v]
+            del in_edges[v]
+
+    def edge_difference(self, v, out_edges, in_edges, contracted_neighbors):
+        added = len(self.shortcuts_for(v, out_edges, in_edges))
+        return added - len(out_edges[v]) - len(in_edges[v]) + contracted_neighbors[v]
+
+    def shortcuts_for(self, v, out_edges, in_edges):
+        """Shortcuts [(u, w, cost)] needed to contract v now"""
+        needed = []
+        outgoing = out_edges[v]
+        for u, c1 in in_edges[v].items():
+            targets = {w: c1 + c2 for w, c2 in outgoing.items() if w != u}
+            if not targets:
+                continue
+            witness = self.witness_search(u, v, max(targets.values()), out_edges)
+            for w, cost in targets.items():
+                if witness.get(w, INF) > cost:
+                    needed.append((u, w, cost))
+        return needed
+
+    def witness_search(self, source, skip, limit, out_edges):
+        """Bounded Dijkstra from source in the remaining graph, avoiding skip"""
+        dist = {source: 0}
+        heap = [(0, source)]
+        settled = 0
+        while heap and settled < self.WITNESS_SETTLE_LIMIT:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            if d > limit:
+                break
+            settled += 1
+            for y, cost in out_edges[x].items():
+                if y == skip:
+                    continue
+                nd = d + cost
+                if nd < dist.get(y, INF):
+                    dist[y] = nd
+                    heapq.heappush(heap, (nd, y))
+        return dist
+
+    # ==========================================
+    # Queries
+    # ==========================================
+
+    def is_current(self):
+        return self.version == self.maze.version
+
+    def distance(self, s, t):
+        """(cost, meeting cell, forward parents, backward parents) between cell ids"""
+        if s == t:
+            return 0, s, {s: None}, {t: None}
+        dist = ({s: 0}, {t: 0})
+        parents = ({s: None}, {t: None})
+        heaps = ([(0, s)], [(0, t)])
+        graphs = (self.up, self.down)
+        best, meet = INF, None
+
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                d, x = heapq.heappop(heap)
+                if d >= best:
+                    heap.clear() # Nothing on this side can improve best any more
+                    continue
+                if d > dist[side][x]:
+                    continue
+                mine, other = dist[side], dist[1 - side]
+                if x in other and d + other[x] < best:
+                    best, meet = d + other[x], x
+                for y, cost in graphs[side].get(x, ()):
+                    nd = d + cost
+                    if nd < mine.get(y, INF):
+                        mine[y] = nd
+                        parents[side][y] = x
+                        heapq.heappush(heap, (nd, y))
+                        if y in other and nd + other[y] < best:
+                            best, meet = nd + other[y], y
+        return best, meet, parents[0], parents[1]
+
+    def unpack(self, u, w, out):
+        """Append the grid cells of edge u -> w (excluding u) to out"""
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            v = self.middle.get((a, b))
+            if v is None:
+                out.append(b)
+            else:
+                stack.append((v, b))
+                stack.append((a, v))
+        return out
+
+    def search(self, s, t):
+        """One query, everything it found: (cost, meeting cell, forward parents,
+        backward parents, [cell ids from s to t] or None)"""
+        cost, meet, forward, backward = self.distance(s, t)
+        if meet is None:
+            return INF, None, forward, backward, None
+        # Forward chain s -> meet, then backward chain meet -> t (edges point to t)
+        chain = []
+        x = meet
+        while x is not None:
+            chain.append(x)
+            x = forward[x]
+        chain.reverse()
+        x = meet
+        while backward[x] is not None:
+            chain.append(backward[x])
+            x = backward[x]
+
+        path = [s]
+        for a, b in zip(chain, chain[1:]):
+            self.unpack(a, b, path)
+        return cost, meet, forward, backward, path
+
+    def query_ids(self, s, t):
+        """(cost, [cell ids from s to t]) or (inf, None)"""
+        cost, _, _, _, path = self.search(s, t)
+        return cost, path
+
+    def query(self, start, goal):
+        """Cost and unpacked Node path between two Nodes"""
+        cost, path = self.query_ids(start.id, goal.id)
+        if path is None:
+            return INF, None
+        return cost, [self.maze.node_at(i) for i in path]
+
+    def query_many(self, pairs):
+        """Batch API: [(start_node, goal_node), ...] -> [(cost, path), ...]"""
+        return [self.query(start, goal) for start, goal in pairs]
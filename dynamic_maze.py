@@ -1,90 +1,119 @@
+import contextlib
+import itertools
 import random
 import time
 from collections import deque, defaultdict
-from game_classes import Maze, Node
+from game_classes import Maze, Node, CELL_COSTS
 from region_logic import RegionLogic
+from connectivity import ConnectivityOracle
+from change_scheduler import ChangeScheduler
+from maze_history import MazeHistory
 
 class DynamicMaze(Maze):
     """
     A maze that changes over time (Harry Potter style).
     Implements Tarjan's Algorithm for structural analysis and region-based navigation.
     """
-    def __init__(self, grid_layout=None, width=10, height=10, seed=None):
+    def __init__(self, grid_layout=None, width=10, height=10, seed=None, clock=time.time):
         super().__init__(grid_layout, width, height, seed)
+        self.clock = clock # Event timing source: wall clock in the game, simulated time headless
+        self.rng = random # Event randomness; a seeded random.Random makes runs repeatable
         
         self.articulation_points = set()
         self.regions = {}  # node -> region_id
         self.region_list = [] # List of sets of nodes
         self.region_connectivity = defaultdict(set) # region_id -> set of connected region_ids
         
-        self.last_update_time = time.time()
+        self.last_update_time = self.clock()
         self.update_interval = 4.0  # Slower updates to allow for animation time
+        self.event_interval = (3.0, 8.0) # Range the next interval is drawn from
         self.last_event_description = "Maze Stable"
         self.last_event_node = None
-        self.pending_changes = []
-        self.recent_edge_changes = [] # (node, type, timer) for graph animation
+        self.sim_time = 0.0 # Sum of the dt values process_updates has seen
+        self.scheduler = ChangeScheduler() # Pending changes by the time their phase ends
+        self.change_seq = itertools.count()
+        self.last_transitions = {'ANIMATING': [], 'APPLIED': []} # Batches from the last process_updates
+        self.batch_seq = itertools.count(1)
+        self.open_batch = None # Set inside change_batch(): changes scheduled there land together
+        self.coalesce_window = 0.2 # Apply changes due this soon after the frame's first one with it
+        self.last_change_set = None # What the last structural update changed, in one piece
+        self.blocks_rebuilt = 0
+        self.pending_changes = [] # Also builds the per-node index (see the property below)
+        self.edge_flashes = deque() # (node, type, expires at) for graph animation, oldest first
+        self.last_changed_nodes = [] # Nodes whose type flipped in the last process_updates
+        self.block_graph = None # HPA* abstraction over 16x16 clusters, built on demand
+        self.history = MazeHistory(self.type_codes()) # Every applied change, seekable by revision
+        self.revision = 0 # Revision the cells currently show (history.head unless checked out)
         
         # Initial Analysis
         self.analyze_structure()
 
-    # ... (skipping methods) ...
+    # ==========================================
+    # Pending-change index
+    # pending_by_node: node -> its pending changes (queue order)
+    # warning_nodes / animating_nodes: nodes with a change in that state
+    # unstable_nodes: nodes about to become walls (WARNING ADD_WALL / SHIFT)
+    # The planner and the renderer look nodes up here instead of scanning the list.
+    # ==========================================
 
-    def process_updates(self, dt):
-        """
-        Advances animation timers and applies changes when ready.
-        Returns True if a structural change happened (requires re-pathing).
-        """
-        structure_changed = False
-        remaining_changes = []
-        
-        # Update edge animation timers
-        self.recent_edge_changes = [
-            (n, t, timer - dt) 
-            for n, t, timer in self.recent_edge_changes 
-            if timer - dt > 0
-        ]
-        
-        for change in self.pending_changes:
-            change['timer'] -= dt
-            
-            if change['state'] == 'WARNING':
-                if change['timer'] <= 0:
-                    change['state'] = 'ANIMATING'
-                    change['timer'] = change['anim_duration']
-                remaining_changes.append(change)
-                
-            elif change['state'] == 'ANIMATING':
-                if change['timer'] <= 0:
-                    # Apply Change
-                    node = change['node']
-                    if change['type'] == 'ADD_WALL':
-                        node.type = '#'
-                        node.cost = float('inf')
-                        # Edge Removed (technically edges to neighbors are removed)
-                        self.recent_edge_changes.append((node, 'REMOVE', 1.0)) 
-                    elif change['type'] == 'REMOVE_WALL':
-                        node.type = '.'
-                        node.cost = 1
-                        # Edge Added
-                        self.recent_edge_changes.append((node, 'ADD', 1.0))
-                    
-                    structure_changed = True
-                else:
-                    remaining_changes.append(change)
-        
-        self.pending_changes = remaining_changes
-        
-        if structure_changed:
-            self.analyze_structure()
-            
-        return structure_changed
+    @property
+    def pending_changes(self):
+        return self._pending_changes
+
+    @pending_changes.setter
+    def pending_changes(self, changes):
+        """Replace the queue; each change's 'timer' is read as the time left in its phase"""
+        self._pending_changes = changes
+        self.scheduler.clear()
+        for change in changes:
+            change.setdefault('seq', next(self.change_seq))
+            change['due'] = self.sim_time + change['timer']
+            self.scheduler.push(change['due'], change)
+        self.reindex_pending_changes()
+
+    def reindex_pending_changes(self):
+        self.pending_by_node = {}
+        self.warning_nodes = set()
+        self.animating_nodes = set()
+        self.unstable_nodes = set()
+        for change in self._pending_changes:
+            self.index_change(change)
+
+    def index_change(self, change):
+        node = change['node']
+        self.pending_by_node.setdefault(node, []).append(change)
+        self.index_node_state(node)
+
+    def index_node_state(self, node):
+        """Re-derive node's membership in the per-state sets from its pending changes"""
+        changes = self.pending_by_node.get(node, ())
+        for nodes, wanted in ((self.warning_nodes, lambda c: c['state'] == 'WARNING'),
+                              (self.animating_nodes, lambda c: c['state'] == 'ANIMATING'),
+                              (self.unstable_nodes, lambda c: c['state'] == 'WARNING' and c['type'] in ('ADD_WALL', 'SHIFT'))):
+            if any(wanted(c) for c in changes):
+                nodes.add(node)
+            else:
+                nodes.discard(node)
+
+    def remaining_time(self, change):
+        """Seconds left in the change's current phase (WARNING or ANIMATING)"""
+        return max(0.0, change['due'] - self.sim_time)
+
+    @property
+    def recent_edge_changes(self):
+        """(node, type, seconds left) of recent edge flashes, for the graph views"""
+        now = self.sim_time
+        return [(n, t, expires - now) for n, t, expires in self.edge_flashes if expires > now]
+
+    def is_goal_reachable(self, node=None):
+        """Whether the goal can still be reached from node (default: the start)"""
+        if self.goal_node is None:
+            return False
+        return self.connectivity.connected(node or self.start_node, self.goal_node)
 
     def is_node_unstable(self, node):
         """Returns True if node is about to become a wall (WARNING phase)."""
-        for change in self.pending_changes:
-            if change['node'] == node and change['state'] == 'WARNING' and change['type'] in ('ADD_WALL', 'SHIFT'):
-                return True
-        return False
+        return node in self.unstable_nodes
         
     def setup_block_partitions(self):
         """Part 1 & 2: Adaptive Block-Based Divide & Conquer setup"""
@@ -130,26 +159,227 @@ class DynamicMaze(Maze):
         # Rebuild full graph for initial state
         self.build_graph()
         
+        # Biconnected components (blocks) are kept up to date incrementally afterwards
+        self.bcc_cells = {i for i in range(self.width * self.height) if self.cell_code(i) != ord('#')}
+        self.bccs = {} # block id -> set(cell id)
+        self.bccs_of = defaultdict(set) # cell id -> ids of the blocks containing it
+        self.next_bcc_id = 0
+        for block in RegionLogic.compute_biconnected_components(self):
+            self.add_bcc(block)
+        self.articulation_points = {self.node_at(i) for i, ids in self.bccs_of.items() if len(ids) > 1}
+        self.connectivity = ConnectivityOracle(self)
+        
         # Compute regions globally initially for standard logic compatibility
-        self.articulation_points = RegionLogic.compute_articulation_points(self)
         self.regions, self.region_connectivity, self.region_list_map = RegionLogic.compute_regions(self, self.articulation_points)
-        
+        self.region_connectivity = defaultdict(set, self.region_connectivity)
+        self.next_region_id = max(self.region_list_map, default=0) + 1
+        self.rebuild_region_list()
+
+    def rebuild_region_list(self):
         self.region_list = []
         sorted_ids = sorted(self.region_list_map.keys())
         for rid in sorted_ids:
             self.region_list.append(set(self.region_list_map[rid]))
 
+    # ==========================================
+    # Incremental biconnectivity
+    # A wall flip inserts or deletes one vertex. Only the blocks containing it
+    # (deletion) or lying on block-cut tree paths between its neighbors (insertion)
+    # change; APs are the cells in two or more blocks.
+    # ==========================================
+
+    def add_bcc(self, cells):
+        bid = self.next_bcc_id
+        self.next_bcc_id += 1
+        self.bccs[bid] = cells
+        for i in cells:
+            self.bccs_of[i].add(bid)
+        return bid
+
+    def remove_bcc(self, bid):
+        cells = self.bccs.pop(bid)
+        for i in cells:
+            self.bccs_of[i].discard(bid)
+        return cells
+
+    def update_biconnectivity(self, node):
+        """Patch blocks and APs after node changed walkability.
+        Returns the cell ids whose AP status flipped (plus the cell itself)."""
+        v = node.id
+        walkable = node.type != '#'
+        if walkable == (v in self.bcc_cells):
+            return set()
+        
+        if walkable:
+            self.bcc_cells.add(v)
+            touched = self.insert_cell(v)
+        else:
+            self.bcc_cells.discard(v)
+            touched = self.delete_cell(v)
+            self.bccs_of.pop(v, None)
+        
+        changed = {v}
+        touched.add(v)
+        for i in touched:
+            n = self.node_at(i)
+            is_ap = len(self.bccs_of.get(i, ())) > 1
+            if is_ap != (n in self.articulation_points):
+                if is_ap:
+                    self.articulation_points.add(n)
+                else:
+                    self.articulation_points.discard(n)
+                changed.add(i)
+        return changed
+
+    def delete_cell(self, v):
+        """Blocks not containing v are untouched; each block that did is re-split without v"""
+        touched = set()
+        for bid in list(self.bccs_of.get(v, ())):
+            cells = self.remove_bcc(bid)
+            cells.discard(v)
+            touched |= cells
+            for block in RegionLogic.compute_biconnected_components(self, cells):
+                self.add_bcc(block)
+        return touched
+
+    def insert_cell(self, v):
+        """New cycles through v merge every block on the block-cut tree paths between
+        v's neighbors; a neighbor in a component of its own just gets a bridge to v."""
+        touched = set()
+        anchors = {}
+        for u in self.neighbor_ids(v):
+            ids = self.bccs_of.get(u, ())
+            # Cells in exactly one block are represented by it in the block-cut tree
+            anchor = ('b', next(iter(ids))) if len(ids) == 1 else ('c', u)
+            anchors.setdefault(anchor, []).append(u)
+        
+        remaining = set(anchors)
+        while remaining:
+            root = remaining.pop()
+            parent = {root: None}
+            queue = deque([root])
+            found = [root]
+            while queue and len(found) <= len(remaining):
+                kind, x = queue.popleft()
+                if kind == 'b':
+                    nxt = [('c', i) for i in self.bccs[x] if len(self.bccs_of[i]) > 1]
+                else:
+                    nxt = [('b', b) for b in self.bccs_of[x]]
+                for t in nxt:
+                    if t not in parent:
+                        parent[t] = (kind, x)
+                        queue.append(t)
+                        if t in remaining:
+                            found.append(t)
+            
+            group = [u for a in found for u in anchors[a]]
+            remaining.difference_update(found)
+            if len(group) == 1:
+                self.add_bcc({v, group[0]}) # Bridge
+                touched.add(group[0])
+                continue
+            
+            # Union of the tree paths from every anchor back to the root
+            merged = {v}
+            on_paths = set()
+            for a in found:
+                while a is not None and a not in on_paths:
+                    on_paths.add(a)
+                    a = parent[a]
+            for kind, x in on_paths:
+                if kind == 'b':
+                    merged |= self.remove_bcc(x)
+            merged.update(group)
+            touched |= merged
+            self.add_bcc(merged)
+        return touched
+
+    def update_regions(self, changed):
+        """Re-flood only the regions next to cells whose wall/AP status changed"""
+        node_at = self.node_at
+        seeds = set()
+        for i in changed:
+            seeds.add(i)
+            seeds.update(self.neighbor_ids(i))
+            if self.cell_code(i) == ord('#'):
+                # A new wall has no walkable edges left: look at the raw grid around it
+                r, c = divmod(i, self.width)
+                for dr in (-1, 0, 1):
+                    for dc in (-1, 0, 1):
+                        if 0 <= r + dr < self.height and 0 <= c + dc < self.width:
+                            seeds.add((r + dr) * self.width + c + dc)
+        
+        for rid in {self.regions[node_at(i)] for i in seeds if node_at(i) in self.regions}:
+            for n in self.region_list_map.pop(rid):
+                seeds.add(n.id)
+                del self.regions[n]
+            for other in self.region_connectivity.pop(rid, ()):
+                self.region_connectivity[other].discard(rid)
+        
+        aps = self.articulation_points
+        new_ids = []
+        for i in seeds:
+            node = node_at(i)
+            if node.type == '#' or node in aps or node in self.regions:
+                continue
+            rid = self.next_region_id
+            self.next_region_id += 1
+            members = [node]
+            bordering_aps = set()
+            self.regions[node] = rid
+            queue = deque([i])
+            while queue:
+                u = queue.popleft()
+                for w in self.neighbor_ids(u):
+                    n = node_at(w)
+                    if n in aps:
+                        bordering_aps.add(w)
+                    elif n not in self.regions:
+                        self.regions[n] = rid
+                        members.append(n)
+                        queue.append(w)
+            self.region_list_map[rid] = members
+            self.region_connectivity[rid] = set()
+            new_ids.append((rid, bordering_aps))
+        
+        # Regions touching the same AP are connected
+        for rid, bordering_aps in new_ids:
+            for w in bordering_aps:
+                for x in self.neighbor_ids(w):
+                    other = self.regions.get(node_at(x))
+                    if other is not None and other != rid:
+                        self.region_connectivity[rid].add(other)
+                        self.region_connectivity[other].add(rid)
+        self.rebuild_region_list()
+
+    def build_block_graph(self, workers=0):
+        """Entrance graph over 16x16 clusters for HPA* queries. Once built, process_updates
+        keeps it current by rebuilding only the clusters around each change."""
+        graph = self.block_graph
+        if graph is None or not graph.is_current():
+            from block_graph import BlockGraph
+            if graph is not None:
+                graph.close()
+            self.block_graph = BlockGraph(self, workers)
+        return self.block_graph
+
     def update_local_block(self, node):
         """Part 3: Recompute only the affected block and adjacent boundaries"""
-        br = node.r // self.block_size
-        bc = node.c // self.block_size
-        block = self.blocks.get((br, bc))
+        self.rebuild_block((node.r // self.block_size, node.c // self.block_size))
+
+    def rebuild_block(self, key):
+        block = self.blocks.get(key)
         
         if not block: return
+        self.blocks_rebuilt += 1
+        
+        # 0. Patch the CSR rows touched by this cell (it and its 8 neighbours)
+        self.refresh_adjacency()
         
         # 1. Update local adjacency for nodes IN THIS BLOCK ONLY
         for n in block['nodes']:
             if n.type == '#':
+                self.adjacency_list.pop(n, None)
                 continue
             
             # Rebuild adjacency just for this node
@@ -161,31 +391,32 @@ class DynamicMaze(Maze):
         # The prompt requires only local block recalculations and global stitching.
         # The stitching above via get_neighbors already hooks to cross-block nodes.
         
-        # DO NOT recompute global Regions/APs here to satisfy requirement Part 3 & 4.
+        # Global Regions/APs are patched incrementally by process_updates instead
+        # (update_biconnectivity / update_regions), never recomputed from scratch here.
 
     def update_structure(self):
         """
         Called every frame. Checks if it's time to queue a dynamic event.
         """
-        current_time = time.time()
+        current_time = self.clock()
         if current_time - self.last_update_time > self.update_interval:
             self.queue_dynamic_event()
             self.last_update_time = current_time
-            # Randomize next interval (3s to 8s)
-            self.update_interval = random.uniform(3.0, 8.0)
+            # Randomize next interval (3s to 8s by default)
+            self.update_interval = self.rng.uniform(*self.event_interval)
 
     def queue_dynamic_event(self):
         """
         Queues a random wall add/remove/shift event with warning phase.
         """
-        event_type = random.choice(['ADD', 'REMOVE', 'SHIFT', 'MASS'])
+        event_type = self.rng.choice(['ADD', 'REMOVE', 'SHIFT', 'MASS'])
         width, height = self.width, self.height
         
         # Helper to get valid node
         def get_random_node(type_filter=None):
             for _ in range(10):
-                r = random.randint(1, height - 2)
-                c = random.randint(1, width - 2)
+                r = self.rng.randint(1, height - 2)
+                c = self.rng.randint(1, width - 2)
                 node = self.grid[r][c]
                 if node in (self.start_node, self.goal_node): continue
                 if type_filter and node.type != type_filter: continue
@@ -214,85 +445,182 @@ class DynamicMaze(Maze):
                 # Find an open neighbor
                 neighbors = [n for n in self.get_neighbors(node) if n.type == '.' and n not in (self.start_node, self.goal_node)]
                 if neighbors:
-                    target = random.choice(neighbors)
-                    # Sequence: Remove old wall, Add new wall
-                    self.schedule_change(node, 'REMOVE_WALL', "Wall Shifting...", 1.5)
-                    self.schedule_change(target, 'ADD_WALL', "Wall Shifting...", 1.5)
+                    target = self.rng.choice(neighbors)
+                    # Sequence: Remove old wall, Add new wall (one batch: applied in the same frame)
+                    with self.change_batch():
+                        self.schedule_change(node, 'REMOVE_WALL', "Wall Shifting...", 1.5)
+                        self.schedule_change(target, 'ADD_WALL', "Wall Shifting...", 1.5)
                     
         elif event_type == 'MASS':
             # Trigger multiple events
-            count = random.randint(2, 4)
+            count = self.rng.randint(2, 4)
             self.last_event_description = "CHAOS SURGE!"
-            for _ in range(count):
-                if random.random() < 0.5:
-                    node = get_random_node('.')
-                    if node: self.schedule_change(node, 'ADD_WALL', "Chaos Surge!", 1.0)
-                else:
-                    node = get_random_node('#')
-                    if node: self.schedule_change(node, 'REMOVE_WALL', "Chaos Surge!", 1.0)
+            with self.change_batch():
+                for _ in range(count):
+                    if self.rng.random() < 0.5:
+                        node = get_random_node('.')
+                        if node: self.schedule_change(node, 'ADD_WALL', "Chaos Surge!", 1.0)
+                    else:
+                        node = get_random_node('#')
+                        if node: self.schedule_change(node, 'REMOVE_WALL', "Chaos Surge!", 1.0)
+
+    @contextlib.contextmanager
+    def change_batch(self):
+        """Transaction for a burst of changes: everything scheduled inside shares one
+        batch id and animation length, so the burst is applied in a single frame, as a
+        single structural update (one block rebuild each, one replan)."""
+        if self.open_batch is not None:
+            yield self.open_batch['id'] # Nested: join the outer batch
+            return
+        self.open_batch = {'id': next(self.batch_seq), 'anim_duration': self.rng.uniform(0.5, 1.5)}
+        try:
+            yield self.open_batch['id']
+        finally:
+            self.open_batch = None
 
     def schedule_change(self, node, type, desc, duration):
-        self.pending_changes.append({
+        change = {
             'node': node,
             'type': type,
             'state': 'WARNING',
-            'timer': 1.0, # Fast warning (1s)
-            'anim_duration': random.uniform(0.5, 1.5), # Fast animation
-            'total_duration': duration
-        })
+            'timer': 1.0, # Fast warning (1s); length of the current phase, see remaining_time()
+            'anim_duration': self.rng.uniform(0.5, 1.5) if self.open_batch is None else self.open_batch['anim_duration'], # Fast animation
+            'total_duration': duration,
+            'seq': next(self.change_seq),
+            'batch': None if self.open_batch is None else self.open_batch['id'],
+        }
+        change['due'] = self.sim_time + change['timer']
+        self._pending_changes.append(change)
+        self.scheduler.push(change['due'], change)
+        self.index_change(change)
         self.last_event_description = desc
         self.last_event_node = node
 
     def process_updates(self, dt):
         """
-        Advances animation timers and applies changes when ready.
-        Returns True if a structural change happened (requires re-pathing).
+        Advances the clock by dt and moves due changes along WARNING -> ANIMATING -> applied.
+        Only changes whose phase ended are touched; last_transitions holds this
+        frame's batches. Returns True if a structural change happened (requires re-pathing).
         """
-        structure_changed = False
-        remaining_changes = []
-        affected_nodes = set()
+        self.sim_time += dt
+        now = self.sim_time
         
-        # Update edge animation timers
-        self.recent_edge_changes = [
-            (n, t, timer - dt) 
-            for n, t, timer in self.recent_edge_changes 
-            if timer - dt > 0
-        ]
+        # Expire edge animations (they all last 1s, so the oldest are at the front)
+        flashes = self.edge_flashes
+        while flashes and flashes[0][2] <= now:
+            flashes.popleft()
         
-        for change in self.pending_changes:
-            change['timer'] -= dt
-            
-            if change['state'] == 'WARNING':
-                if change['timer'] <= 0:
-                    change['state'] = 'ANIMATING'
-                    change['timer'] = change['anim_duration']
-                remaining_changes.append(change)
-                
-            elif change['state'] == 'ANIMATING':
-                if change['timer'] <= 0:
-                    # Apply Change
-                    node = change['node']
-                    if change['type'] == 'ADD_WALL':
-                        node.type = '#'
-                        node.cost = float('inf')
-                        # Edge Removed (technically edges to neighbors are removed)
-                        self.recent_edge_changes.append((node, 'REMOVE', 1.0)) 
-                    elif change['type'] == 'REMOVE_WALL':
-                        node.type = '.'
-                        node.cost = 1
-                        # Edge Added
-                        self.recent_edge_changes.append((node, 'ADD', 1.0))
-                    
-                    affected_nodes.add(node)
-                    structure_changed = True
+        due = self.scheduler.pop_due(now)
+        if self.coalesce_window > 0 and any(c['state'] == 'ANIMATING' for c in due):
+            # A structural update happens this frame anyway: pull in animations ending soon
+            for change in self.scheduler.pop_due(now + self.coalesce_window):
+                if change['state'] == 'ANIMATING':
+                    due.append(change)
                 else:
-                    remaining_changes.append(change)
+                    self.scheduler.push(change['due'], change)
+        to_animate = [c for c in due if c['state'] == 'WARNING']
+        to_apply = sorted((c for c in due if c['state'] == 'ANIMATING'), key=lambda c: c['seq'])
+        self.last_transitions = {'ANIMATING': to_animate, 'APPLIED': to_apply}
+        self.last_changed_nodes = []
         
-        self.pending_changes = remaining_changes
+        for change in to_animate:
+            change['state'] = 'ANIMATING'
+            change['timer'] = change['anim_duration']
+            change['due'] = now + change['anim_duration']
+            self.scheduler.push(change['due'], change)
+            self.index_node_state(change['node'])
         
-        if structure_changed:
-            # Recompute local adjacency for affected blocks only
-            for node in affected_nodes:
-                self.update_local_block(node)
+        if not to_apply:
+            return False
+        
+        affected_nodes = set()
+        structure_cells = set() # Cells whose wall / AP status flipped
+        if self.revision != self.history.head:
+            # Viewing the past: new changes land on the present
+            affected_nodes.update(self.set_cells(self.history.changes_between(self.revision, self.history.head), structure_cells))
+        for change in to_apply:
+            # Apply Change
+            node = change['node']
+            if change['type'] == 'ADD_WALL':
+                structure_cells |= self.set_cell_type(node, '#')
+                # Edge Removed (technically edges to neighbors are removed)
+                flashes.append((node, 'REMOVE', now + 1.0))
+            elif change['type'] == 'REMOVE_WALL':
+                structure_cells |= self.set_cell_type(node, '.')
+                # Edge Added
+                flashes.append((node, 'ADD', now + 1.0))
+            self.revision = self.history.record(node.id, ord(node.type), self.version)
             
-        return structure_changed
\ No newline at end of file
+            affected_nodes.add(node)
+            
+            remaining = [c for c in self.pending_by_node[node] if c is not change]
+            if remaining:
+                self.pending_by_node[node] = remaining
+            else:
+                del self.pending_by_node[node]
+            self.index_node_state(node)
+        
+        applied = {id(c) for c in to_apply}
+        self._pending_changes = [c for c in self._pending_changes if id(c) not in applied]
+        self.last_changed_nodes = list(affected_nodes)
+        self.last_change_set = {
+            'nodes': self.last_changed_nodes,
+            'added_walls': [n for n in self.last_changed_nodes if n.type == '#'],
+            'removed_walls': [n for n in self.last_changed_nodes if n.type != '#'],
+            'batches': sorted({c['batch'] for c in to_apply if c.get('batch') is not None}),
+        }
+        
+        self.finish_update(affected_nodes, structure_cells)
+        return True
+
+    def set_cell_type(self, node, value):
+        """Flip one cell between wall and open, repairing connectivity and biconnectivity.
+        Returns the cells whose wall / AP status flipped (for update_regions)."""
+        # Connectivity repair needs the blocks the cell was in before the change
+        blocks = [self.bccs[b] for b in self.bccs_of.get(node.id, ())] if value == '#' else None
+        node.type = value
+        node.cost = CELL_COSTS.get(ord(value), 1) # Traps / powerups get their cost back on checkout
+        self.connectivity.update(node, blocks)
+        return self.update_biconnectivity(node)
+
+    def set_cells(self, codes, structure_cells):
+        """set_cell_type for {cell id: code}; returns the nodes touched"""
+        nodes = []
+        for i, code in codes.items():
+            node = self.node_at(i)
+            structure_cells |= self.set_cell_type(node, chr(code))
+            nodes.append(node)
+        return nodes
+
+    def finish_update(self, nodes, structure_cells):
+        """Second half of a structural update: blocks, regions and the HPA* graph"""
+        # Recompute local adjacency once per affected block
+        for key in {(n.r // self.block_size, n.c // self.block_size) for n in nodes}:
+            self.rebuild_block(key)
+        self.update_regions(structure_cells)
+        if self.block_graph is not None:
+            self.block_graph.update(nodes)
+
+    # ==========================================
+    # Versions
+    # ==========================================
+
+    def seek(self, version):
+        """Revision holding every change made up to maze.version `version` (O(log n))"""
+        return self.history.revision_at(version)
+
+    def checkout(self, revision):
+        """
+        Show the maze as it was at `revision` (history.head = the present) without
+        re-simulating: only the cells that differ are flipped, and regions, blocks
+        and connectivity follow incrementally. Nothing is logged; the next applied
+        change returns the cells to the present first.
+        """
+        if revision == self.revision:
+            return []
+        structure_cells = set()
+        nodes = self.set_cells(self.history.changes_between(self.revision, revision), structure_cells)
+        self.revision = revision
+        self.finish_update(nodes, structure_cells)
+        self.last_changed_nodes = nodes
+        return nodes
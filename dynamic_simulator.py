@@ -0,0 +1,169 @@
+import contextlib
+import heapq
+import io
+import math
+import random
+import time
+from game_classes import GreedyAI
+
+
+def percentile(values, q):
+    """Nearest-rank percentile (q in 0..100) of a list of numbers, 0 when empty"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class DynamicSimulator:
+    """
+    Headless, accelerated-time driver for DynamicMaze replanning benchmarks.
+
+    The maze's event clock is switched to its own simulated time (sim_time, advanced
+    by process_updates), so a run of thousands of events takes seconds instead of
+    hours. Every tick does what GameController.run does for the AI: queue events,
+    advance pending changes by dt, replan on a structural change (notify_changes
+    when the agent has it, compute_path otherwise) and move the AI ai_speed times
+    per simulated second. An AI that reaches the goal is respawned at the start.
+
+    Like the game, agents without notify_changes skip the replan when
+    needs_replan says the change set misses their route (skip_untouched).
+    Per replan it records wall-clock latency, nodes expanded and, with measure_drift,
+    the cost drift: cost of the new plan minus the optimal cost from the AI's cell.
+    Both are charged the warning penalty the planners add (GreedyAI.penalize_unstable),
+    so routing around a cell that is about to close is not counted as drift.
+    """
+    def __init__(self, maze, agent_class, dt=1 / 60, ai_speed=2.5, event_interval=(3.0, 8.0),
+                 seed=None, measure_drift=True, quiet=True, skip_untouched=True):
+        self.maze = maze
+        self.agent_class = agent_class
+        self.dt = dt
+        self.ai_speed = ai_speed
+        self.measure_drift = measure_drift
+        self.quiet = quiet # Swallow the agents' "No path found" prints
+        self.skip_untouched = skip_untouched # Only replan when the change set touches the route
+        self.step_edges = GreedyAI.penalize_unstable(maze.edges, maze.node_at, maze.is_node_unstable)
+
+        maze.clock = lambda: maze.sim_time
+        if seed is not None:
+            maze.rng = random.Random(seed)
+        maze.event_interval = event_interval
+        maze.last_update_time = maze.sim_time
+        maze.update_interval = maze.rng.uniform(*event_interval)
+
+        self.events = 0
+        self.changes = 0
+        self.arrivals = 0
+        self.failed_replans = 0
+        self.skipped_replans = 0
+        self.latencies = []
+        self.expanded = []
+        self.drift = []
+        self.moves_due = 0.0
+        self.wall_time = 0.0
+        self.agent = self.spawn()
+
+    def spawn(self):
+        with self.output():
+            return self.agent_class(self.maze.start_node, self.maze.goal_node, self.maze)
+
+    def output(self):
+        return contextlib.redirect_stdout(io.StringIO()) if self.quiet else contextlib.nullcontext()
+
+    def run(self, events=None, seconds=None):
+        """Step until `events` events were queued or `seconds` of simulated time passed"""
+        if events is None and seconds is None:
+            raise ValueError("run() needs an event count or a simulated duration")
+        t0 = time.perf_counter()
+        end = None if seconds is None else self.maze.sim_time + seconds
+        while (events is None or self.events < events) and (end is None or self.maze.sim_time < end):
+            self.step()
+        self.wall_time += time.perf_counter() - t0
+        return self.report()
+
+    def step(self):
+        maze, agent = self.maze, self.agent
+        queued_at = maze.last_update_time
+        maze.update_structure()
+        if maze.last_update_time != queued_at:
+            self.events += 1
+
+        if maze.process_updates(self.dt):
+            self.changes += len(maze.last_changed_nodes)
+            if hasattr(agent, 'notify_changes') or not self.skip_untouched or agent.needs_replan(maze.last_change_set):
+                self.replan()
+            else:
+                self.skipped_replans += 1
+
+        self.moves_due += self.dt * self.ai_speed
+        while self.moves_due >= 1:
+            self.moves_due -= 1
+            if agent.finished or agent.path_index >= len(agent.full_path):
+                break
+            agent.choose_move(maze)
+        if agent.current_node == maze.goal_node:
+            self.arrivals += 1
+            self.agent = self.spawn()
+
+    def replan(self):
+        agent, maze = self.agent, self.maze
+        visited = agent.metrics.nodes_visited
+        with self.output():
+            t = time.perf_counter()
+            if hasattr(agent, 'notify_changes'):
+                agent.notify_changes(maze.last_changed_nodes)
+            else:
+                agent.compute_path()
+            self.latencies.append(time.perf_counter() - t)
+        self.expanded.append(agent.metrics.nodes_visited - visited)
+
+        if agent.finished and agent.current_node != maze.goal_node:
+            self.failed_replans += 1
+        elif self.measure_drift:
+            optimal = self.optimal_cost(agent.current_node.id, maze.goal_node.id)
+            if optimal != math.inf:
+                self.drift.append(self.plan_cost(agent) - optimal)
+
+    def plan_cost(self, agent):
+        """Search-step cost of the agent's remaining plan"""
+        cost, prev = 0, agent.current_node.id
+        for node in agent.full_path[agent.path_index:]:
+            cost += dict(self.step_edges(prev)).get(node.id, math.inf)
+            prev = node.id
+        return cost
+
+    def optimal_cost(self, source, target):
+        dist = {source: 0}
+        heap = [(0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u == target:
+                return d
+            if d > dist[u]:
+                continue
+            for v, cost in self.step_edges(u):
+                nd = d + cost
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return math.inf
+
+    def report(self):
+        latency_ms = [t * 1000 for t in self.latencies]
+        return {
+            'agent': getattr(self.agent, 'algorithm_name', self.agent_class.__name__),
+            'sim_time': self.maze.sim_time,
+            'wall_time': self.wall_time,
+            'events': self.events,
+            'changes': self.changes,
+            'replans': len(self.latencies),
+            'failed_replans': self.failed_replans,
+            'skipped_replans': self.skipped_replans,
+            'arrivals': self.arrivals,
+            'latency_ms': {q: percentile(latency_ms, q) for q in (50, 95, 99)},
+            'expanded': {q: percentile(self.expanded, q) for q in (50, 95, 99)},
+            'cost_drift': {
+                'mean': sum(self.drift) / len(self.drift) if self.drift else 0,
+                'max': max(self.drift, default=0),
+            },
+        }
@@ -1,7 +1,9 @@
 import random
 import heapq
 import math
+from array import array
 from collections import deque, defaultdict
+from collections.abc import Mapping
 from region_logic import RegionLogic
 
 # ... (rest of imports)
@@ -19,6 +21,9 @@ class PriorityQueue:
     def empty(self):
         return len(self.elements) == 0
     
+    def __len__(self):
+        return len(self.elements)
+    
     def put(self, item, priority):
         # Use count as tie-breaker to avoid comparing items directly if priorities match
         heapq.heappush(self.elements, (priority, self.count, item))
@@ -27,14 +32,116 @@ class PriorityQueue:
     def get(self):
         return heapq.heappop(self.elements)[2]
 
+
+# Search costs are multiples of 0.001 (1, 1.414, +3 trap, -2 powerup, 0.1 clamp),
+# so scaling by 1000 turns every step cost into an exact integer
+SEARCH_COST_SCALE = 1000
+
+class BucketQueue:
+    """Radix (Dial-style) bucket queue over integer-scaled priorities.
+    Same put/get/empty interface as PriorityQueue. Costs stay floats everywhere else:
+    put() quantizes each priority to round(priority * scale). Step costs are multiples
+    of 1/1000, so at the default scale this only absorbs float drift in Dijkstra keys;
+    A* keys with Euclidean terms are ordered to within 1/scale. Priorities must be >= 0 and
+    (roughly) monotone, as in Dijkstra / A*: a priority below the last popped one is
+    served next, as if it had been pushed at that level.
+    Bucket i holds keys whose highest differing bit from the last popped key is bit i-1,
+    so put is O(1) and each entry is redistributed at most ~log2(max key) times."""
+    def __init__(self, scale=SEARCH_COST_SCALE):
+        self.scale = scale
+        self.buckets = [[] for _ in range(64)]
+        self.current = deque() # keys == last, FIFO like the heap's tie-breaker
+        self.last = 0
+        self.size = 0
+    
+    def empty(self):
+        return self.size == 0
+    
+    def __len__(self):
+        return self.size
+    
+    def put(self, item, priority):
+        key = int(priority * self.scale + 0.5)
+        self.size += 1
+        if key <= self.last:
+            self.current.append(item)
+            return
+        b = (key ^ self.last).bit_length()
+        if b >= len(self.buckets):
+            self.buckets.extend([] for _ in range(b + 1 - len(self.buckets)))
+        self.buckets[b].append((key, item))
+    
+    def get(self):
+        if not self.current:
+            # Empty the lowest non-empty bucket: its minimum becomes the new level,
+            # everything else drops into strictly lower buckets
+            buckets = self.buckets
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries = buckets[i]
+            buckets[i] = []
+            last = min([key for key, _ in entries])
+            self.last = last
+            for key, item in entries:
+                if key == last:
+                    self.current.append(item)
+                else:
+                    buckets[(key ^ last).bit_length()].append((key, item))
+        self.size -= 1
+        return self.current.popleft()
+
+
+def make_queue(queue_type='heap'):
+    """Frontier for cost-ordered searches: 'heap' (heapq) or 'bucket' (BucketQueue)"""
+    if queue_type == 'bucket':
+        return BucketQueue()
+    return PriorityQueue()
+
 # game_classes.py
 
+# Compact storage: one byte per cell type (ord of the layout char) indexed by r*width+c
+WALL = ord('#')
+OPEN = ord('.')
+TRAP = ord('T')
+POWERUP = ord('P')
+CELL_COSTS = {WALL: float('inf'), ord('S'): 0, ord('T'): 3, ord('P'): -2}  # anything else costs 1
+
+# Search step cost by target type byte: 1 (1.414 diagonal) + trap/powerup penalty,
+# clamped to 0.1 to prevent negative edge weights (Negative Cycles)
+_PENALTY = {TRAP: 3, POWERUP: -2}
+STRAIGHT_STEP_COST = [max(0.1, 1 + _PENALTY.get(code, 0)) for code in range(256)]
+DIAGONAL_STEP_COST = [max(0.1, 1.414 + _PENALTY.get(code, 0)) for code in range(256)]
+# Actual move cost (what the player / AI is charged): same without the clamp
+STRAIGHT_MOVE_COST = [1 + _PENALTY.get(code, 0) for code in range(256)]
+DIAGONAL_MOVE_COST = [1.414 + _PENALTY.get(code, 0) for code in range(256)]
+# Search step cost onto a node about to change (WARNING phase): +50 to the raw cost,
+# then the clamp (an unstable powerup costs 49, not 0.1 + 50)
+UNSTABLE_PENALTY = 50
+UNSTABLE_STRAIGHT_STEP_COST = [max(0.1, cost + UNSTABLE_PENALTY) for cost in STRAIGHT_MOVE_COST]
+UNSTABLE_DIAGONAL_STEP_COST = [max(0.1, cost + UNSTABLE_PENALTY) for cost in DIAGONAL_MOVE_COST]
+
+# 8 directions for richer graph connectivity (Cardinals, then Diagonals)
+DIRECTIONS = [
+    (-1, 0), (1, 0), (0, -1), (0, 1),
+    (-1, -1), (-1, 1), (1, -1), (1, 1)
+]
+
 class Node:
     """Graph node with enhanced tracking for algorithm analysis"""
-    def __init__(self, r, c, node_type='.', cost=1):
+    # Fixed attribute layout (no per-node __dict__): large mazes hold a lot of these
+    __slots__ = ('r', 'c', 'id', 'maze', '_type', 'cost', '_hash',
+                 'visited_by_player', 'visited_by_ai', 'explored_by_ai',
+                 'times_evaluated', 'heuristic_value')
+
+    def __init__(self, r, c, node_type='.', cost=1, maze=None):
         self.r = r
         self.c = c
-        self.type = node_type  # '.', '#', 'T', 'P', 'S', 'G'
+        # Integer id = r*width+c, the index into the maze buffers / CSR (-1 if not in a maze)
+        self.id = r * maze.width + c if maze is not None else -1
+        self._hash = hash((r, c))  # Computed once; dict/set probes hit it constantly
+        self.maze = maze  # Owning Maze (notified when the type changes)
+        self._type = node_type  # '.', '#', 'T', 'P', 'S', 'G'
         self.cost = cost
         self.visited_by_player = False
         self.visited_by_ai = False
@@ -43,22 +150,130 @@ class Node:
         self.explored_by_ai = False  # Considered but not visited
         self.times_evaluated = 0  # How many times AI evaluated this node
         self.heuristic_value = None  # Last calculated heuristic
+    
+    @property
+    def type(self):
+        return self._type
+    
+    @type.setter
+    def type(self, value):
+        self._type = value
+        # Wall changes invalidate the maze adjacency index
+        if self.maze is not None:
+            self.maze.mark_dirty(self)
         
     def __repr__(self):
         return f"Node({self.r}, {self.c}, {self.type})"
     
     def __eq__(self, other):
-        if not isinstance(other, Node):
-            return False
-        return self.r == other.r and self.c == other.c
+        if self is other:
+            return True
+        return isinstance(other, Node) and self.r == other.r and self.c == other.c
     
     def __hash__(self):
-        return hash((self.r, self.c))
+        return self._hash
 
     def __lt__(self, other):
         return self.cost < other.cost
 
 
+class CellNode(Node):
+    """Node view over a cell of a compact Maze.
+    type/cost are read from (and written back to) the maze buffers, so the
+    view is only materialized when something asks for it via get_node."""
+    __slots__ = ()
+
+    def __init__(self, maze, r, c):
+        super().__init__(r, c, None, maze.cell_costs[r * maze.width + c], maze)
+
+    @property
+    def type(self):
+        return chr(self.maze.cell_types[self.id])
+
+    @type.setter
+    def type(self, value):
+        self.maze.cell_types[self.id] = ord(value)
+        self.maze.mark_dirty(self)
+
+    @property
+    def cost(self):
+        return self.maze.cell_costs[self.id]
+
+    @cost.setter
+    def cost(self, value):
+        self.maze.cell_costs[self.id] = value
+
+
+class _CellCodes:
+    """Indexable type-byte view used when patching CSR rows"""
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __getitem__(self, i):
+        return self.maze.cell_code(i)
+
+
+class CompactRow:
+    """One row of a compact Maze, indexable like the old list of Nodes"""
+    def __init__(self, maze, r):
+        self.maze = maze
+        self.r = r
+
+    def __len__(self):
+        return self.maze.width
+
+    def __getitem__(self, c):
+        if c < 0:
+            c += self.maze.width
+        if not 0 <= c < self.maze.width:
+            raise IndexError(c)
+        return self.maze.node_at(self.r * self.maze.width + c)
+
+    def __iter__(self):
+        for c in range(self.maze.width):
+            yield self[c]
+
+
+class CompactGrid:
+    """grid[r][c] facade for compact mazes (Nodes are created lazily)"""
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __len__(self):
+        return self.maze.height
+
+    def __getitem__(self, r):
+        if r < 0:
+            r += self.maze.height
+        if not 0 <= r < self.maze.height:
+            raise IndexError(r)
+        return CompactRow(self.maze, r)
+
+    def __iter__(self):
+        for r in range(self.maze.height):
+            yield CompactRow(self.maze, r)
+
+
+class CompactAdjacency(Mapping):
+    """adjacency_list for compact mazes: node -> [(neighbor, edge_weight)], computed from the buffers on access"""
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __getitem__(self, node):
+        if node.type == '#':
+            raise KeyError(node)
+        return [(neighbor, neighbor.cost) for neighbor in self.maze.get_neighbors(node)]
+
+    def __iter__(self):
+        types = self.maze.cell_types
+        for i in range(len(types)):
+            if types[i] != WALL:
+                yield self.maze.node_at(i)
+
+    def __len__(self):
+        return self.maze.get_total_walkable_nodes()
+
+
 class PerformanceMetrics:
     """Track algorithm performance for educational analysis"""
     def __init__(self):
@@ -102,7 +317,7 @@ class PerformanceMetrics:
 
 class Maze:
     """Graph-based maze with enhanced features"""
-    def __init__(self, grid_layout=None, width=10, height=10, seed=None):
+    def __init__(self, grid_layout=None, width=10, height=10, seed=None, compact=False):
         self.grid = []
         self.start_node = None
         self.goal_node = None
@@ -110,8 +325,32 @@ class Maze:
         self.height = 0
         self.seed = seed or random.randint(0, 999999)
         
+        # Compact mode keeps cell type/cost in flat buffers (r*width+c) and only
+        # creates Node objects on demand. Needed for mazes of a few hundred+ cells per side.
+        self.compact = compact
+        self.cell_types = None  # bytearray (compact mode only)
+        self.cell_costs = None  # array('f') (compact mode only)
+        self._node_cache = {}
+        self._flat_nodes = []  # index -> Node (regular mode)
+        self._codes = None  # type-byte snapshot of the Node grid (regular mode)
+        self._codes_dirty = set()  # Cells whose type changed since _codes was patched
+        
         # Graph structure representation
         self.adjacency_list = {}  # node -> [(neighbor, edge_weight)]
+        self.landmarks = None  # ALT distance tables (build_landmarks)
+        self.contraction_hierarchy = None  # Distance oracle (build_contraction_hierarchy)
+        self.junction_graph = None  # Corridor-contracted graph (build_junction_graph)
+        
+        # CSR neighbor index: row i spans csr_targets[csr_offsets[i]:csr_offsets[i+1]],
+        # csr_costs holds the search step cost of each edge. Rebuilt per maze version;
+        # cells whose type changed since are re-derived into _csr_patch rows.
+        self.version = 0
+        self.csr_version = -1
+        self.csr_offsets = None
+        self.csr_targets = None
+        self.csr_costs = None
+        self._csr_patch = {}
+        self._dirty = set()
         
         if grid_layout:
             self.parse_layout(grid_layout)
@@ -128,43 +367,26 @@ class Maze:
         self.height = len(lines)
         self.width = len(lines[0])
         
+        types = bytearray(b'#') * (self.width * self.height)
         for r, line in enumerate(lines):
-            row = []
-            for c, char in enumerate(line.strip()):
-                cost = 1
-                if char == 'T': cost = 3
-                elif char == 'P': cost = -2
-                elif char == '#': cost = float('inf')
-                
-                node = Node(r, c, char, cost)
-                row.append(node)
-                
-                if char == 'S':
-                    self.start_node = node
-                    node.cost = 0
-                elif char == 'G':
-                    self.goal_node = node
-            self.grid.append(row)
+            row = line.strip()[:self.width].encode()
+            types[r * self.width:r * self.width + len(row)] = row
+        
+        self.load_cells(types)
     
     def generate_random(self, width, height):
         """Generate random maze using DFS (creates graph structure)"""
         self.width = width
         self.height = height
         
-        # Initialize all walls
-        self.grid = []
-        for r in range(height):
-            row = []
-            for c in range(width):
-                node = Node(r, c, '#', float('inf'))
-                row.append(node)
-            self.grid.append(row)
+        # Initialize all walls (flat buffer, index = r*width+c)
+        types = bytearray(b'#') * (width * height)
         
         # DFS maze generation (creates graph paths)
         stack = [(0, 0)]
-        visited = set([(0, 0)])
-        self.grid[0][0].type = '.'
-        self.grid[0][0].cost = 1
+        visited = bytearray(width * height)
+        visited[0] = 1
+        types[0] = OPEN
         
         while stack:
             current_r, current_c = stack[-1]
@@ -175,15 +397,13 @@ class Maze:
             found_next = False
             for dr, dc in directions:
                 nr, nc = current_r + dr, current_c + dc
-                if 0 <= nr < height and 0 <= nc < width and (nr, nc) not in visited:
+                if 0 <= nr < height and 0 <= nc < width and not visited[nr * width + nc]:
                     # Carve path (create graph edge)
                     wall_r, wall_c = current_r + dr // 2, current_c + dc // 2
-                    self.grid[wall_r][wall_c].type = '.'
-                    self.grid[wall_r][wall_c].cost = 1
-                    self.grid[nr][nc].type = '.'
-                    self.grid[nr][nc].cost = 1
+                    types[wall_r * width + wall_c] = OPEN
+                    types[nr * width + nc] = OPEN
                     
-                    visited.add((nr, nc))
+                    visited[nr * width + nc] = 1
                     stack.append((nr, nc))
                     found_next = True
                     break
@@ -192,108 +412,293 @@ class Maze:
                 stack.pop()
         
         # Set start and goal
-        self.start_node = self.grid[0][0]
-        self.start_node.type = 'S'
-        self.start_node.cost = 0
-        
-        self.goal_node = self.grid[height-1][width-1]
-        self.goal_node.type = 'G'
-        self.goal_node.cost = 1
+        goal = (height - 1) * width + (width - 1)
+        types[0] = ord('S')
+        types[goal] = ord('G')
         
         # Ensure goal is reachable
-        if self.goal_node.type == '#':
-            self.goal_node.type = 'G'
+        if types[goal] == WALL:
+            types[goal] = ord('G')
             for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
                 nr, nc = height-1+dr, width-1+dc
                 if 0 <= nr < height and 0 <= nc < width:
-                    self.grid[nr][nc].type = '.'
-                    self.grid[nr][nc].cost = 1
+                    types[nr * width + nc] = OPEN
         
-                # Add loops (increase graph connectivity)
+        # Add loops (increase graph connectivity)
         for r in range(1, height-1):
             for c in range(1, width-1):
+                i = r * width + c
                 # Increased loop probability to 10% to create more cycles
                 # This reduces the number of Articulation Points, making them more significant
-                if self.grid[r][c].type == '#' and random.random() < 0.10:
-                    open_neighbors = sum(1 for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]
-                                       if self.grid[r+dr][c+dc].type != '#')
+                if types[i] == WALL and random.random() < 0.10:
+                    open_neighbors = ((types[i - width] != WALL) + (types[i + width] != WALL) +
+                                      (types[i - 1] != WALL) + (types[i + 1] != WALL))
                     if open_neighbors >= 2:
-                        self.grid[r][c].type = '.'
-                        self.grid[r][c].cost = 1
+                        types[i] = OPEN
         
         # Add traps and powerups (weighted graph edges)
-        for r in range(height):
-            for c in range(width):
-                node = self.grid[r][c]
-                if node.type == '.' and (r,c) != (0,0) and (r,c) != (height-1, width-1):
-                    rand = random.random()
-                    if rand < 0.06:
-                        node.type = 'T'
-                        node.cost = 3
-                    elif rand < 0.10:
-                        node.type = 'P'
-                        node.cost = -2
+        for i in range(width * height):
+            if types[i] == OPEN and i != 0 and i != goal:
+                rand = random.random()
+                if rand < 0.06:
+                    types[i] = ord('T')
+                elif rand < 0.10:
+                    types[i] = ord('P')
+        
+        self.load_cells(types)
+    
+    def load_cells(self, types):
+        """Attach a flat type buffer: keep it (compact) or materialize the Node grid"""
+        n = self.width * self.height
+        start = types.rfind(b'S')
+        goal = types.rfind(b'G')
+        self._codes = None
+        
+        if self.compact:
+            self.cell_types = types
+            self.cell_costs = array('f', [1.0]) * n
+            for code, cost in CELL_COSTS.items():
+                i = types.find(code)
+                while i != -1:
+                    self.cell_costs[i] = cost
+                    i = types.find(code, i + 1)
+            self._node_cache = {}
+            self.grid = CompactGrid(self)
+            self.start_node = self.node_at(start) if start != -1 else None
+            self.goal_node = self.node_at(goal) if goal != -1 else None
+            return
+        
+        self.grid = []
+        self._flat_nodes = []
+        for r in range(self.height):
+            row = []
+            for c in range(self.width):
+                code = types[r * self.width + c]
+                row.append(Node(r, c, chr(code), CELL_COSTS.get(code, 1), self))
+            self.grid.append(row)
+            self._flat_nodes.extend(row)
+        
+        if start != -1:
+            self.start_node = self.grid[start // self.width][start % self.width]
+        if goal != -1:
+            self.goal_node = self.grid[goal // self.width][goal % self.width]
     
     def build_graph(self):
         """Build explicit adjacency list representation of the graph"""
+        self.build_csr()
+        
+        if self.compact:
+            # Computed from the CSR index on access instead of one list per cell
+            self.adjacency_list = CompactAdjacency(self)
+            return
+        
         self.adjacency_list = {}
         
-        for r in range(self.height):
-            for c in range(self.width):
-                node = self.grid[r][c]
-                if node.type == '#':
-                    continue
-                
-                neighbors = self.get_neighbors(node)
-                self.adjacency_list[node] = [(neighbor, neighbor.cost) for neighbor in neighbors]
+        for node in self._flat_nodes:
+            if node.type == '#':
+                continue
+            
+            neighbors = self.get_neighbors(node)
+            self.adjacency_list[node] = [(neighbor, neighbor.cost) for neighbor in neighbors]
+    
+    def cell_code(self, i):
+        """Type byte of cell i (works in both storage modes)"""
+        if self.compact:
+            return self.cell_types[i]
+        return ord(self._flat_nodes[i].type)
+    
+    def scan_row(self, types, i):
+        """Walkable neighbors of cell i as [(index, step_cost)], scanning the type buffer.
+        Step cost = 1 (or 1.414 diagonal) + trap/powerup penalty, clamped to 0.1."""
+        width = self.width
+        r, c = divmod(i, width)
+        row = []
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.height and 0 <= nc < width:
+                j = nr * width + nc
+                code = types[j]
+                if code != WALL:
+                    row.append((j, DIAGONAL_STEP_COST[code] if dr and dc else STRAIGHT_STEP_COST[code]))
+        return row
+    
+    def type_codes(self):
+        """Flat type-byte buffer (r*width+c) for the current maze version.
+        Compact mazes return their live buffer; Node grids a snapshot built once and
+        patched in place for the cells changed since (mark_dirty), like the CSR rows."""
+        if self.compact:
+            return self.cell_types
+        if self._codes is None:
+            self._codes = bytearray(ord(n.type) for n in self._flat_nodes)
+            self._codes_dirty = set()
+        elif self._codes_dirty:
+            codes, nodes = self._codes, self._flat_nodes
+            for i in self._codes_dirty:
+                codes[i] = ord(nodes[i].type)
+            self._codes_dirty = set()
+        return self._codes
+    
+    def build_csr(self):
+        """Build the CSR neighbor index for the current maze version"""
+        types = self.type_codes()
+        width, height = self.width, self.height
+        n = width * height
+        offsets = array('i', [0]) * (n + 1)
+        targets = array('i')
+        costs = array('d')
+        add_target, add_cost = targets.append, costs.append
+        
+        for i in range(n):
+            if types[i] != WALL:
+                r, c = divmod(i, width)
+                if 0 < r < height - 1 and 0 < c < width - 1:
+                    # Interior cell: same order as DIRECTIONS, no bounds checks
+                    for j in (i - width, i + width, i - 1, i + 1):
+                        code = types[j]
+                        if code != WALL:
+                            add_target(j)
+                            add_cost(STRAIGHT_STEP_COST[code])
+                    for j in (i - width - 1, i - width + 1, i + width - 1, i + width + 1):
+                        code = types[j]
+                        if code != WALL:
+                            add_target(j)
+                            add_cost(DIAGONAL_STEP_COST[code])
+                else:
+                    for j, cost in self.scan_row(types, i):
+                        add_target(j)
+                        add_cost(cost)
+            offsets[i + 1] = len(targets)
+        
+        self.csr_offsets, self.csr_targets, self.csr_costs = offsets, targets, costs
+        self._csr_patch = {}
+        self._dirty = set()
+        self.csr_version = self.version
+    
+    def mark_dirty(self, node):
+        """Called when a cell changes type: bump the version, patch lazily"""
+        self.version += 1
+        self._dirty.add(node.id)
+        if self._codes is not None:
+            self._codes_dirty.add(node.id)
+    
+    def refresh_adjacency(self):
+        """Bring the CSR index up to date with the current version.
+        A type change affects the cell's own row and its 8 neighbors' rows; those rows
+        are re-derived into _csr_patch. Large batches just rebuild the whole index."""
+        if self.csr_offsets is None or len(self._dirty) > max(64, (self.width * self.height) // 16):
+            self.build_csr()
+            return
+        
+        patch_cells = set()
+        for i in self._dirty:
+            r, c = divmod(i, self.width)
+            patch_cells.add(i)
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < self.height and 0 <= nc < self.width:
+                    patch_cells.add(nr * self.width + nc)
+        
+        types = _CellCodes(self)
+        for i in patch_cells:
+            self._csr_patch[i] = self.scan_row(types, i) if types[i] != WALL else []
+        
+        self._dirty = set()
+        self.csr_version = self.version
+    
+    def edges(self, i):
+        """(neighbor index, step cost) pairs of cell i, read from the CSR index"""
+        if self._dirty:
+            self.refresh_adjacency()
+        row = self._csr_patch.get(i)
+        if row is not None:
+            return row
+        a, b = self.csr_offsets[i], self.csr_offsets[i + 1]
+        return zip(self.csr_targets[a:b], self.csr_costs[a:b])
+    
+    def reverse_edges(self, j):
+        """(i, cost of i -> j) for every walkable neighbor i of cell j.
+        Walkability is symmetric but costs are not: stepping onto j pays j's penalty."""
+        width = self.width
+        code = self.type_codes()[j]
+        straight, diagonal = STRAIGHT_STEP_COST[code], DIAGONAL_STEP_COST[code]
+        jr, jc = divmod(j, width)
+        return [(i, straight if (i // width == jr or i % width == jc) else diagonal)
+                for i in self.neighbor_ids(j)]
+    
+    def neighbor_ids(self, i):
+        """Walkable neighbor indices of cell i"""
+        return [j for j, _ in self.edges(i)]
+    
+    def get_edges(self, node):
+        """Weighted adjacency of a node: [(neighbor, step_cost)]"""
+        node_at = self.node_at
+        return [(node_at(j), cost) for j, cost in self.edges(node.id)]
     
     def get_node(self, r, c):
         """Get node at grid position"""
         if 0 <= r < self.height and 0 <= c < self.width:
+            if self.compact:
+                return self.node_at(r * self.width + c)
             return self.grid[r][c]
         return None
     
+    def node_at(self, i):
+        """Get node by flat index r*width+c (materializes the view in compact mode)"""
+        if not self.compact:
+            return self._flat_nodes[i]
+        node = self._node_cache.get(i)
+        if node is None:
+            node = CellNode(self, i // self.width, i % self.width)
+            self._node_cache[i] = node
+        return node
+    
     def get_neighbors(self, node):
         """Get all neighbors (graph adjacency)"""
-        neighbors = []
-        # 8 directions for richer graph connectivity
-        directions = [
-            (-1, 0), (1, 0), (0, -1), (0, 1),  # Cardinals
-            (-1, -1), (-1, 1), (1, -1), (1, 1)  # Diagonals
-        ]
-        
-        for dr, dc in directions:
-            nr, nc = node.r + dr, node.c + dc
-            neighbor = self.get_node(nr, nc)
-            if neighbor and neighbor.type != '#':
-                neighbors.append(neighbor)
-        return neighbors
+        node_at = self.node_at
+        return [node_at(j) for j, _ in self.edges(node.id)]
     
     def heuristic(self, node, heuristic_type='euclidean'):
         """Calculate heuristic for greedy algorithm"""
+        # Landmark (ALT) bounds when they were built for this maze version
+        if heuristic_type == 'landmarks' and self.landmarks is not None and self.landmarks.is_current():
+            return self.landmarks.estimate(node.id, self.goal_node.id)
         # Enforce Euclidean only
         return math.sqrt((node.r - self.goal_node.r)**2 + (node.c - self.goal_node.c)**2)
     
+    def build_landmarks(self, k=8):
+        """ALT preprocessing: pick k landmarks and store distances to/from each.
+        Optional; pays off when the same maze is searched many times."""
+        from landmarks import Landmarks
+        self.landmarks = Landmarks(self, k)
+        return self.landmarks
+    
+    def build_contraction_hierarchy(self):
+        """Contraction-hierarchy preprocessing for exact batch queries on a static maze.
+        Reuses the existing hierarchy while the maze version is unchanged."""
+        ch = self.contraction_hierarchy
+        if ch is None or not ch.is_current():
+            from contraction_hierarchy import ContractionHierarchy
+            self.contraction_hierarchy = ContractionHierarchy(self)
+        return self.contraction_hierarchy
+    
+    def build_junction_graph(self):
+        """Corridor chains collapsed into weighted junction-to-junction edges
+        (start and goal kept as junctions). Cached per maze version."""
+        graph = self.junction_graph
+        if graph is None or not graph.is_current():
+            from junction_graph import JunctionGraph
+            self.junction_graph = JunctionGraph(self)
+        return self.junction_graph
+    
     def calculate_optimal_path(self):
         """Calculate optimal path length using BFS (unweighted graph)"""
         if not self.start_node or not self.goal_node:
             return 0
         
-        queue = deque([(self.start_node, 0)])
-        visited = {self.start_node}
-        
-        while queue:
-            node, dist = queue.popleft()
-            
-            if node == self.goal_node:
-                return dist
-            
-            for neighbor in self.get_neighbors(node):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, dist + 1))
-        
-        return float('inf')  # No path exists
+        # Bidirectional BFS on cell indices over the CSR index (no Node objects needed)
+        from bidirectional_search import BidirectionalSearch
+        hops, _ = BidirectionalSearch(self).bfs(self.start_node.id, self.goal_node.id)
+        return hops  # inf when no path exists
     
     def bfs_analysis(self):
         """BFS for Structural Analysis (Distance Map)"""
@@ -329,44 +734,25 @@ class Maze:
                     self.heuristic_map[node] = dist
                     self.max_heuristic_dist = max(self.max_heuristic_dist, dist)
 
-    def a_star_optimal(self):
-        """A* for Optimal Reference Cost"""
+    def a_star_optimal(self, queue_type='heap'):
+        """Optimal Reference Cost: bidirectional A* on the landmark bounds when
+        build_landmarks has run for this version, else bidirectional Dijkstra"""
         if not self.start_node or not self.goal_node: return 0
         
-        frontier = PriorityQueue()
-        frontier.put(self.start_node, 0)
-        
-        cost_so_far = {}
-        cost_so_far[self.start_node] = 0
-        
-        while not frontier.empty():
-            current = frontier.get()
-            
-            if current == self.goal_node:
-                break
-            
-            for neighbor in self.get_neighbors(current):
-                # Calculate edge cost
-                edge_cost = 1
-                if abs(current.r - neighbor.r) + abs(current.c - neighbor.c) == 2:
-                    edge_cost = 1.414
-                
-                penalty = 0
-                if neighbor.type == 'T': penalty = 3
-                elif neighbor.type == 'P': penalty = -2
-                
-                # Prevent negative edge weights to avoid infinite loops (Negative Cycles)
-                new_cost = cost_so_far[current] + max(0.1, edge_cost + penalty)
-                
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self.heuristic(neighbor)
-                    frontier.put(neighbor, priority)
-        
-        return cost_so_far.get(self.goal_node, 0)
+        # Step costs come pre-clamped (>= 0.1) from the CSR index, which
+        # prevents negative edge weights / infinite loops (Negative Cycles).
+        # No Euclidean potential: a powerup step costs 0.1, less than its length,
+        # so that estimate is inconsistent and the reference would not be exact
+        from bidirectional_search import BidirectionalSearch
+        landmarks = self.landmarks if self.landmarks is not None and self.landmarks.is_current() else None
+        cost, path = BidirectionalSearch(self, queue_type).a_star(self.start_node.id, self.goal_node.id,
+                                                                  heuristic=False, landmarks=landmarks)
+        return cost if path else 0
 
     def get_total_walkable_nodes(self):
         """Count total nodes in graph (excluding walls)"""
+        if self.compact:
+            return len(self.cell_types) - self.cell_types.count(WALL)
         return sum(1 for r in range(self.height) for c in range(self.width) 
                   if self.grid[r][c].type != '#')
 
@@ -471,14 +857,38 @@ class Huffman:
         ratio = ((1 - compressed_bits / original_bits) * 100) if original_bits > 0 else 0
         return {"original_bits": original_bits, "compressed_bits": compressed_bits, "ratio": round(ratio, 1)}
 
+def move_cost(a, b):
+    """Game cost of stepping a -> b: 1 (1.414 diagonal) + trap/powerup penalty, unclamped
+    (the real score change; searches use the clamped STRAIGHT/DIAGONAL_STEP_COST)"""
+    code = ord(b.type)
+    if abs(a.r - b.r) + abs(a.c - b.c) == 2:
+        return DIAGONAL_MOVE_COST[code]
+    return STRAIGHT_MOVE_COST[code]
+
+
+def search_step_cost(a, b):
+    """Search cost of stepping a -> b (clamped to 0.1), for mazes without a CSR index"""
+    code = ord(b.type)
+    if abs(a.r - b.r) + abs(a.c - b.c) == 2:
+        return DIAGONAL_STEP_COST[code]
+    return STRAIGHT_STEP_COST[code]
+
+
+def _same_node(node):
+    """to_node for searches keyed by Node objects"""
+    return node
+
+
 class GreedyAI:
     """Greedy Best-First Search AI with enhanced metrics"""
-    def __init__(self, start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='best_first'):
+    def __init__(self, start_node, goal_node, maze, heuristic_type='euclidean', algorithm_type='best_first',
+                 queue_type='heap'):
         self.current_node = start_node
         self.goal_node = goal_node
         self.maze = maze
         self.heuristic_type = heuristic_type
         self.algorithm_type = algorithm_type
+        self.queue_type = queue_type # 'heap' or 'bucket' frontier for Dijkstra / A*
         
         self.total_cost = 0
         self.steps = 0
@@ -498,6 +908,14 @@ class GreedyAI:
     def heuristic(self, node):
         return self.maze.heuristic(node, self.heuristic_type)
 
+    def unstable_cells(self):
+        """Ids of the walkable cells about to become walls (DynamicMaze WARNING phase),
+        sorted. Read from the maze's unstable_nodes index: O(pending changes), not O(grid)."""
+        unstable = getattr(self.maze, 'unstable_nodes', None)
+        if not unstable:
+            return []
+        return sorted(node.id for node in unstable if node.type != '#')
+
     def compute_path(self):
         # Reset path tracking when re-calculating (crucial for dynamic updates)
         self.path_index = 0
@@ -508,118 +926,217 @@ class GreedyAI:
         else:
             self.compute_path_best_first()
 
+    def search_space(self, start, goal):
+        """What the search loops run on: integer node ids on indexed mazes (cheap
+        dict/set keys), Node objects otherwise.
+        Returns (start_key, goal_key, expand, to_node); expand(key) yields (key, step_cost)."""
+        if hasattr(self.maze, 'edges'):
+            goal_key = goal.id if goal is not None else None
+            return start.id, goal_key, self.maze.edges, self.maze.node_at
+        return start, goal, self.edges_from_neighbors, _same_node
+
+    # ==========================================
+    # Search kernels: one tight loop per algorithm, picked once per search
+    # (no per-expansion branching on algorithm_type). Step costs come from the
+    # maze's per-version CSR cost table (or edges_from_neighbors off-grid).
+    # ==========================================
+
+    def goal_cut_off(self):
+        """True when the maze's connectivity oracle (DynamicMaze) already knows the
+        goal is unreachable from the current node, so a search would only fail"""
+        oracle = getattr(self.maze, 'connectivity', None)
+        return (oracle is not None and self.goal_node is not None and oracle.is_current()
+                and not oracle.connected(self.current_node, self.goal_node))
+
     def compute_path_best_first(self):
-        frontier = PriorityQueue()
-        frontier.put(self.current_node, 0)
-        
-        came_from = {}
-        cost_so_far = {} # For A* and Dijkstra
+        if self.goal_cut_off():
+            print(f"No path found for AI ({self.algorithm_type}): goal is walled off")
+            self.finished = True
+            return
+        start, goal, expand, to_node = self.search_space(self.current_node, self.goal_node)
         
-        came_from[self.current_node] = None
-        cost_so_far[self.current_node] = 0
+        # Dynamic Logic: Avoid Unstable Nodes (Warning Phase)
+        is_unstable = getattr(self.maze, 'is_node_unstable', None)
+        if is_unstable is not None:
+            expand = self.penalize_unstable(expand, to_node, is_unstable)
         
         self.visited_nodes.add(self.current_node)
+        kernel = self.KERNELS.get(self.algorithm_type, 'kernel_best_first')
+        came_from, found = getattr(self, kernel)(start, goal, expand, to_node)
         
-        current = None
+        if found:
+            self.full_path = self.reconstruct_keys(came_from, start, goal, to_node)
+            self.calculate_path_stats()
+        else:
+            print(f"No path found for AI ({self.algorithm_type})")
+            self.finished = True # Prevent infinite wait
+
+    KERNELS = {
+        'dijkstra': 'kernel_dijkstra',
+        'a_star': 'kernel_a_star',
+        'best_first': 'kernel_best_first',
+    }
+
+    @staticmethod
+    def penalize_unstable(expand, to_node, is_unstable):
+        """Wrap expand: +50 on nodes about to change (high penalty to discourage use unless necessary).
+        The penalty goes on the raw step cost before the 0.1 clamp (UNSTABLE_*_STEP_COST)."""
+        def penalized(key):
+            edges = []
+            node = None
+            for n, cost in expand(key):
+                target = to_node(n)
+                if is_unstable(target):
+                    node = node or to_node(key)
+                    code = ord(target.type)
+                    diagonal = target.r != node.r and target.c != node.c
+                    cost = UNSTABLE_DIAGONAL_STEP_COST[code] if diagonal else UNSTABLE_STRAIGHT_STEP_COST[code]
+                edges.append((n, cost))
+            return edges
+        return penalized
+
+    def kernel_dijkstra(self, start, goal, expand, to_node):
+        frontier = make_queue(self.queue_type)
+        put, get = frontier.put, frontier.get
+        put(start, 0)
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        visited, metrics = self.visited_nodes, self.metrics
         
         while not frontier.empty():
-            current = frontier.get()
-            self.visited_nodes.add(current) # Track visited
-            self.metrics.record_visit(current)
+            current = get()
+            current_node = to_node(current)
+            visited.add(current_node)
+            metrics.record_visit(current_node)
+            if current == goal:
+                return came_from, True
             
-            if current == self.goal_node:
-                break
-            
-            for neighbor in self.maze.get_neighbors(current):
-                # Calculate new cost (g_score)
-                # Edge weight logic (1 for normal, 1.414 for diagonal, + penalties)
-                edge_cost = 1
-                if abs(current.r - neighbor.r) + abs(current.c - neighbor.c) == 2:
-                    edge_cost = 1.414
-                
-                # Note: In the game loop, penalties are applied on move. 
-                # For pathfinding, we should consider them if we want "aware" algorithms like A*
-                # But Greedy usually ignores them. 
-                # Let's make A* and Dijkstra aware of costs (Traps/Powerups)
-                penalty = 0
-                if neighbor.type == 'T': penalty = 3
-                elif neighbor.type == 'P': penalty = -2
-                
-                # Dynamic Logic: Avoid Unstable Nodes (Warning Phase)
-                if hasattr(self.maze, 'is_node_unstable') and self.maze.is_node_unstable(neighbor):
-                    penalty += 50 # High penalty to discourage use unless necessary
+            base = cost_so_far[current]
+            for neighbor, step_cost in expand(current):
+                new_cost = base + step_cost
+                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                    cost_so_far[neighbor] = new_cost
+                    metrics.record_evaluation(to_node(neighbor), new_cost)
+                    put(neighbor, new_cost)
+                    came_from[neighbor] = current
+        return came_from, False
 
-                # Prevent negative edges for Dijkstra/A* stability
-                step_cost = max(0.1, edge_cost + penalty)
-                new_cost = cost_so_far[current] + step_cost
-                
+    def kernel_a_star(self, start, goal, expand, to_node):
+        frontier = make_queue(self.queue_type)
+        put, get = frontier.put, frontier.get
+        put(start, 0)
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        visited, metrics, heuristic = self.visited_nodes, self.metrics, self.heuristic
+        
+        while not frontier.empty():
+            current = get()
+            current_node = to_node(current)
+            visited.add(current_node)
+            metrics.record_visit(current_node)
+            if current == goal:
+                return came_from, True
+            
+            base = cost_so_far[current]
+            for neighbor, step_cost in expand(current):
+                new_cost = base + step_cost
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
-                    
-                    # Priority Calculation
-                    priority = 0
-                    if self.algorithm_type == 'dijkstra':
-                        priority = new_cost
-                    elif self.algorithm_type == 'a_star':
-                        priority = new_cost + self.heuristic(neighbor)
-                    else: # Greedy Best-First
-                        priority = self.heuristic(neighbor)
-                    
-                    self.metrics.record_evaluation(neighbor, priority)
-                    frontier.put(neighbor, priority)
+                    neighbor_node = to_node(neighbor)
+                    priority = new_cost + heuristic(neighbor_node)
+                    metrics.record_evaluation(neighbor_node, priority)
+                    put(neighbor, priority)
                     came_from[neighbor] = current
+        return came_from, False
+
+    def kernel_best_first(self, start, goal, expand, to_node):
+        # Greedy ignores costs (Traps/Powerups); it only re-queues a node when a
+        # cheaper route to it shows up, like the cost-aware modes
+        frontier = []
+        push, pop = heapq.heappush, heapq.heappop
+        frontier.append((0, 0, start))
+        count = 1
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        visited, metrics, heuristic = self.visited_nodes, self.metrics, self.heuristic
         
-        if current == self.goal_node:
-            path = []
-            curr = self.goal_node
-            while curr != self.current_node:
-                path.append(curr)
-                curr = came_from[curr]
-            path.reverse()
-            self.full_path = path
-            self.calculate_path_stats()
-        else:
-            print(f"No path found for AI ({self.algorithm_type})")
-            self.finished = True # Prevent infinite wait
+        while frontier:
+            current = pop(frontier)[2]
+            current_node = to_node(current)
+            visited.add(current_node)
+            metrics.record_visit(current_node)
+            if current == goal:
+                return came_from, True
+            
+            base = cost_so_far[current]
+            for neighbor, step_cost in expand(current):
+                new_cost = base + step_cost
+                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                    cost_so_far[neighbor] = new_cost
+                    neighbor_node = to_node(neighbor)
+                    priority = heuristic(neighbor_node)
+                    metrics.record_evaluation(neighbor_node, priority)
+                    push(frontier, (priority, count, neighbor))
+                    count += 1
+                    came_from[neighbor] = current
+        return came_from, False
+
+    @staticmethod
+    def reconstruct_keys(came_from, start, goal, to_node):
+        """Walk came_from back from goal; returns the Nodes after start, in order"""
+        path = []
+        curr = goal
+        while curr != start:
+            path.append(to_node(curr))
+            curr = came_from[curr]
+        path.reverse()
+        return path
+
+    def edges_from_neighbors(self, node):
+        """(neighbor, step_cost) for mazes without an adjacency index (e.g. CircularMaze)"""
+        return [(neighbor, search_step_cost(node, neighbor)) for neighbor in self.maze.get_neighbors(node)]
 
     def compute_path_hill_climbing(self):
         """Pure Greedy (Hill Climbing) - No backtracking, can get stuck"""
-        current = self.current_node
+        start, goal, expand, to_node = self.search_space(self.current_node, self.goal_node)
+        current = start
         path = []
         visited = {current}
+        visited_nodes, metrics, heuristic = self.visited_nodes, self.metrics, self.heuristic
         
-        while current != self.goal_node:
-            self.visited_nodes.add(current)
-            self.metrics.record_visit(current)
+        while current != goal:
+            current_node = to_node(current)
+            visited_nodes.add(current_node)
+            metrics.record_visit(current_node)
             
-            neighbors = self.maze.get_neighbors(current)
             best_neighbor = None
             best_h = float('inf')
             
             # Find best unvisited neighbor
-            for neighbor in neighbors:
+            for neighbor, _ in expand(current):
                 if neighbor not in visited:
-                    h = self.heuristic(neighbor)
-                    self.metrics.record_evaluation(neighbor, h)
+                    neighbor_node = to_node(neighbor)
+                    h = heuristic(neighbor_node)
+                    metrics.record_evaluation(neighbor_node, h)
                     if h < best_h:
                         best_h = h
                         best_neighbor = neighbor
             
-            if best_neighbor:
-                path.append(best_neighbor)
+            if best_neighbor is not None:
+                path.append(to_node(best_neighbor))
                 visited.add(best_neighbor)
                 current = best_neighbor
             else:
                 # Dead end - Algorithm Fails (No Backtracking)
-                self.metrics.record_dead_end()
-                print(f"Hill Climbing stuck at {current}")
+                metrics.record_dead_end()
+                print(f"Hill Climbing stuck at {current_node}")
                 break
                 
         # Always set the path found so far, even if incomplete
         self.full_path = path
         
 
-        if current == self.goal_node:
+        if current == goal:
             self.calculate_path_stats()
         else:
             # Do NOT set finished=True here. Let the AI walk the partial path first.
@@ -633,15 +1150,7 @@ class GreedyAI:
         
         current = self.path[0] # Start node
         for next_node in self.full_path:
-            move_cost = 1
-            if abs(current.r - next_node.r) + abs(current.c - next_node.c) == 2:
-                move_cost = 1.414
-            
-            penalty = 0
-            if next_node.type == 'T': penalty = 3
-            elif next_node.type == 'P': penalty = -2
-            
-            self.solution_cost += move_cost + penalty
+            self.solution_cost += move_cost(current, next_node)
             current = next_node
 
     def choose_move(self, maze):
@@ -650,24 +1159,16 @@ class GreedyAI:
         if self.path_index < len(self.full_path):
             next_node = self.full_path[self.path_index]
             
-            # Calculate cost
-            move_cost = 1
-            if abs(self.current_node.r - next_node.r) + abs(self.current_node.c - next_node.c) == 2:
-                move_cost = 1.414
-            
-            penalty = 0
-            if next_node.type == 'T': penalty = 3
-            elif next_node.type == 'P': penalty = -2
-            
             # Log Action
-            if penalty == 3: self.action_log += "T"
-            elif penalty == -2: self.action_log += "P"
+            next_type = next_node.type
+            if next_type == 'T': self.action_log += "T"
+            elif next_type == 'P': self.action_log += "P"
             else: self.action_log += "M"
             
+            self.total_cost += move_cost(self.current_node, next_node)
             self.current_node = next_node
             self.path.append(next_node)
             self.steps += 1
-            self.total_cost += move_cost + penalty
             self.path_index += 1
             
             if self.current_node == self.goal_node:
@@ -680,17 +1181,88 @@ class GreedyAI:
                  print(error_msg)
                  raise RuntimeError(error_msg)
             self.finished = True
-    
+
     def get_efficiency_vs_optimal(self, optimal_cost):
         if self.total_cost == 0: return 0
         return optimal_cost / self.total_cost
+
+    # ==========================================
+    # Route index: which structural changes touch the remaining plan
+    # Route position k is full_path[k - 1]; position 0 is the cell the plan
+    # started from (None if the plan was indexed after moving). The AI stands on
+    # position path_index, so the remaining route is positions > path_index.
+    # ==========================================
+
+    route_margin = 0 # Also replan for walls this many cells (Chebyshev) off the route
+
+    def route_index(self):
+        """(positions, prefix): cell id -> route position for the route and its
+        route_margin corridor, and the search cost from position 0 to each position.
+        Rebuilt only when full_path was replaced."""
+        cached = getattr(self, '_route', None)
+        if cached is not None and cached[0] is self.full_path and cached[1] == len(self.full_path):
+            return cached[2], cached[3]
+        route = [self.current_node if self.path_index == 0 else None] + list(self.full_path)
+        positions, prefix = {}, [0]
+        for k, node in enumerate(route):
+            if k:
+                prev = route[k - 1]
+                prefix.append(prefix[-1] + (search_step_cost(prev, node) if prev is not None else 0))
+            if node is not None:
+                positions.setdefault(node.id, k)
+        margin = self.route_margin
+        if margin:
+            width, height = self.maze.width, self.maze.height
+            for node in route:
+                if node is None:
+                    continue
+                k = positions[node.id]
+                for r in range(max(0, node.r - margin), min(height, node.r + margin + 1)):
+                    for c in range(max(0, node.c - margin), min(width, node.c + margin + 1)):
+                        positions.setdefault(r * width + c, k)
+        self._route = (self.full_path, len(self.full_path), positions, prefix)
+        return positions, prefix
+
+    def needs_replan(self, change_set):
+        """
+        Whether a DynamicMaze change set (last_change_set) can affect this AI's plan,
+        in O(changes): a new wall on the remaining route (or its margin corridor),
+        a removed wall that splices two remaining route cells together for less
+        than the route between them, or any opening while the AI has no path.
+        """
+        if change_set is None:
+            return True
+        if self.finished:
+            # Stuck without a route: only an opening can help, if it reconnects the goal
+            return (self.current_node != self.goal_node and bool(change_set['removed_walls'])
+                    and not self.goal_cut_off())
+        positions, prefix = self.route_index()
+        here = self.path_index
+        for node in change_set['added_walls']:
+            if positions.get(node.id, -1) > here:
+                return True
+        for node in change_set['removed_walls']:
+            # Remaining route cells next to the opening, by position
+            touching = []
+            for n in self.maze.get_neighbors(node):
+                k = positions.get(n.id, -1)
+                if k >= here and self.route_node(k).id == n.id: # Not just in the margin
+                    touching.append((k, n))
+            for i, a in touching:
+                for j, b in touching:
+                    if i < j and search_step_cost(a, node) + search_step_cost(node, b) < prefix[j] - prefix[i] - 1e-9:
+                        return True
+        return False
+
+    def route_node(self, k):
+        return self.full_path[k - 1] if k else self.current_node
 class HierarchicalAI(GreedyAI):
     """
     Divide & Conquer AI: Plans path via Regions/Islands first, then navigates locally.
     Uses an Augmented Graph (Regions + Articulation Points) to handle complex connectivity.
     """
-    def __init__(self, start_node, goal_node, maze):
-        super().__init__(start_node, goal_node, maze, algorithm_type='hierarchical')
+    def __init__(self, start_node, goal_node, maze, queue_type='heap'):
+        super().__init__(start_node, goal_node, maze, algorithm_type='hierarchical', queue_type=queue_type)
         self.algorithm_name = "Divide & Conquer (Hierarchical)"
         self.high_level_plan = [] # List of (RegionID or AP-Node)
         self.waypoints = [] # List of physical Nodes to visit
@@ -828,43 +1400,36 @@ class HierarchicalAI(GreedyAI):
 
     def get_path_segment(self, start, end):
         """Local A* search between two nodes"""
-        frontier = PriorityQueue()
-        frontier.put(start, 0)
-        came_from = {start: None}
-        cost_so_far = {start: 0}
+        start_key, end_key, expand, to_node = self.search_space(start, end)
+        frontier = make_queue(self.queue_type)
+        frontier.put(start_key, 0)
+        came_from = {start_key: None}
+        cost_so_far = {start_key: 0}
         
         while not frontier.empty():
             current = frontier.get()
-            self.metrics.record_evaluation(current, 0) # Log for viz
+            self.metrics.record_evaluation(to_node(current), 0) # Log for viz
             
-            if current == end:
+            if current == end_key:
                 break
             
-            for neighbor in self.maze.get_neighbors(current):
-                # Standard cost + penalties
-                penalty = 0
-                if neighbor.type == 'T': penalty = 3
-                elif neighbor.type == 'P': penalty = -2
-                
-                new_cost = cost_so_far[current] + max(0.1, 1 + penalty)
+            # Standard cost + penalties, straight from the maze adjacency index
+            for neighbor, step_cost in expand(current):
+                new_cost = cost_so_far[current] + step_cost
                 
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self.heuristic_dist(neighbor, end)
+                    priority = new_cost + self.heuristic_dist(to_node(neighbor), end)
                     frontier.put(neighbor, priority)
                     came_from[neighbor] = current
         
-        if end not in came_from: return None
+        if end_key not in came_from: return None
         
         # Reconstruct
-        path = []
-        curr = end
-        while curr != start:
-            path.append(curr)
-            curr = came_from[curr]
-        path.append(start)
-        path.reverse()
-        return path
+        return [start] + self.reconstruct_keys(came_from, start_key, end_key, to_node)
 
     def heuristic_dist(self, a, b):
+        landmarks = getattr(self.maze, 'landmarks', None)
+        if landmarks is not None and landmarks.is_current():
+            return landmarks.estimate(a.id, b.id)
         return math.sqrt((a.r - b.r)**2 + (a.c - b.c)**2)
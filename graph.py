@@ -2,10 +2,15 @@ import math
 from config import WEIGHT_NORMAL
 
 class Node:
-    def __init__(self, x, y, weight=WEIGHT_NORMAL):
+    __slots__ = ('x', 'y', 'pos', 'id', '_hash', 'weight', 'heuristic', 'neighbors',
+                 'parent', 'visited', 'is_trap', 'is_powerup')
+
+    def __init__(self, x, y, weight=WEIGHT_NORMAL, node_id=-1):
         self.x = x
         self.y = y
         self.pos = (x, y)
+        self.id = node_id  # Insertion index in Graph.nodes
+        self._hash = hash(self.pos)
         self.weight = weight
         self.heuristic = 0
         self.neighbors = {}  # (nx, ny): weight
@@ -19,6 +24,14 @@ class Node:
     @property
     def c(self): return self.x
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return isinstance(other, Node) and self.pos == other.pos
+
+    def __hash__(self):
+        return self._hash
+
     def __lt__(self, other):
         return self.heuristic < other.heuristic
 
@@ -33,7 +46,7 @@ class Graph:
 
     def add_node(self, x, y, weight=WEIGHT_NORMAL):
         if (x, y) not in self.nodes:
-            self.nodes[(x, y)] = Node(x, y, weight)
+            self.nodes[(x, y)] = Node(x, y, weight, node_id=len(self.nodes))
         return self.nodes[(x, y)]
 
     def add_edge(self, pos1, pos2, weight=None):
@@ -0,0 +1,200 @@
+import heapq
+import math
+import time
+
+INF = float('inf')
+
+
+class JunctionGraph:
+    """
+    Corridor contraction of a Maze. Cells that no shortest path needs are dropped
+    first (prune()); then every chain of cells with exactly two remaining neighbors
+    collapses into one edge between the junctions / dead ends at its ends.
+    Start and goal (and any cells in keep) always stay as junctions.
+
+    edges[u] = [(w, cost, length, cells)]
+      cost   - summed search step costs u -> w (same clamped costs as the CSR index;
+               directed, so w -> u is a separate edge with its own cost)
+      length - number of grid steps
+      cells  - corridor cell ids strictly between u and w, in walking order
+
+    search() runs BFS / DFS / Dijkstra / A* / Greedy Best-First on the contracted
+    graph and expands the answer back to a full list of Nodes.
+    """
+    def __init__(self, maze, keep=()):
+        self.maze = maze
+        self.version = maze.version
+        t0 = time.perf_counter()
+
+        width = maze.width
+        walkable = [i for i in range(width * maze.height) if maze.cell_code(i) != ord('#')]
+        step = {i: dict(maze.edges(i)) for i in walkable}
+        keep = set(keep)
+        for node in (maze.start_node, maze.goal_node):
+            if node is not None:
+                keep.add(node.id)
+        self.grid_edges = sum(len(s) for s in step.values())
+
+        neighbors = {i: set(step[i]) for i in walkable}
+        self.bypassed = self.prune(neighbors, step, keep)
+
+        self.junctions = {i for i in neighbors if len(neighbors[i]) != 2 or i in keep}
+        self.edges = {u: [] for u in self.junctions}
+
+        for u in self.junctions:
+            for first in neighbors[u]:
+                prev, cur = u, first
+                cells = []
+                cost = step[u][first]
+                while cur not in self.junctions:
+                    cells.append(cur)
+                    a, b = neighbors[cur]
+                    nxt = b if a == prev else a
+                    cost += step[cur][nxt]
+                    prev, cur = cur, nxt
+                    if cur == first:
+                        break # Isolated ring of corridor cells (no junction on it)
+                if cur != u and cur in self.junctions:
+                    self.edges[u].append((cur, cost, len(cells) + 1, tuple(cells)))
+
+        self.grid_nodes = len(walkable)
+        self.build_time = time.perf_counter() - t0
+
+    @staticmethod
+    def prune(neighbors, step, keep):
+        """Drop cells no shortest path needs. With diagonal moves, the corner cell of a
+        1-wide corridor is never worth stepping on (the diagonal past it is shorter),
+        yet it gives both of its neighbors degree 3 and so stops the chain there.
+        A cell v (not kept) goes if, for every ordered pair (u, w) of its remaining
+        neighbors, u -> w directly or through one other common neighbor costs no
+        more than u -> v -> w; dead ends pass trivially, so unkept dead-end branches
+        are trimmed away. Distances between the remaining cells are unchanged and
+        they stay connected. Removing v can make its neighbors removable, so they are
+        re-checked. Returns the number removed."""
+        removed = 0
+        pending = sorted(neighbors)
+        queued = set(pending)
+        while pending:
+            v = pending.pop()
+            queued.discard(v)
+            around = neighbors.get(v)
+            if around is None or v in keep:
+                continue
+            bypassable = True
+            for u in around:
+                for w in around:
+                    if u == w:
+                        continue
+                    limit = step[u][v] + step[v][w] + 1e-9
+                    if step[u].get(w, INF) <= limit:
+                        continue
+                    if any(step[u].get(x, INF) + step[x].get(w, INF) <= limit
+                           for x in around if x != u and x != w):
+                        continue
+                    bypassable = False
+                    break
+                if not bypassable:
+                    break
+            if not bypassable:
+                continue
+            del neighbors[v]
+            removed += 1
+            for u in around:
+                neighbors[u].discard(v)
+                if u not in queued:
+                    queued.add(u)
+                    pending.append(u)
+        return removed
+
+    def is_current(self):
+        return self.version == self.maze.version
+
+    def stats(self):
+        """Before/after sizes for reporting"""
+        return {
+            "nodes_before": self.grid_nodes,
+            "bypassed": self.bypassed,
+            "nodes_after": len(self.junctions),
+            "edges_before": self.grid_edges,
+            "edges_after": sum(len(e) for e in self.edges.values()),
+            "build_time": self.build_time,
+        }
+
+    def search(self, start, goal, algorithm='a_star', on_expand=None):
+        """Path of Nodes after start (like GreedyAI.full_path), or None.
+        algorithm: 'bfs' (fewest grid steps), 'dfs', 'dijkstra', 'a_star', 'best_first'.
+        on_expand(cell_id) is called for every junction taken off the frontier."""
+        s, g = start.id, goal.id
+        if s not in self.junctions or g not in self.junctions:
+            raise ValueError("start/goal must be junctions (pass them in keep)")
+        width = self.maze.width
+        gr, gc = divmod(g, width)
+
+        def h(i):
+            r, c = divmod(i, width)
+            return math.sqrt((r - gr)**2 + (c - gc)**2)
+
+        came_from = {s: None} # junction -> (previous junction, corridor cells)
+        if algorithm == 'dfs':
+            found = self.depth_first(s, g, came_from, on_expand)
+        else:
+            found = self.best_first(s, g, algorithm, h, came_from, on_expand)
+        if not found:
+            return None
+        return self.expand(came_from, s, g)
+
+    def depth_first(self, s, g, came_from, on_expand):
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            if on_expand is not None:
+                on_expand(u)
+            if u == g:
+                return True
+            for w, _, _, cells in reversed(self.edges[u]):
+                if w not in came_from:
+                    came_from[w] = (u, cells)
+                    stack.append(w)
+        return False
+
+    def best_first(self, s, g, algorithm, h, came_from, on_expand):
+        # bfs uses edge lengths: a corridor edge stands for `length` unit steps
+        weight = 2 if algorithm == 'bfs' else 1
+        costs = {s: 0}
+        frontier = [(0, 0, s, 0)]
+        count = 1 # Tie-breaker: equal priorities pop in insertion order
+        while frontier:
+            _, _, u, d = heapq.heappop(frontier)
+            if d > costs[u]:
+                continue
+            if on_expand is not None:
+                on_expand(u)
+            if u == g:
+                return True
+            for edge in self.edges[u]:
+                w, cells = edge[0], edge[3]
+                nd = d + edge[weight]
+                if w in costs and nd >= costs[w]:
+                    continue
+                # Greedy ignores costs in its priority but, like GreedyAI.kernel_best_first,
+                # still re-queues a junction when a cheaper route to it shows up
+                if algorithm == 'best_first':
+                    priority = h(w)
+                else:
+                    priority = nd + h(w) if algorithm == 'a_star' else nd
+                costs[w] = nd
+                came_from[w] = (u, cells)
+                heapq.heappush(frontier, (priority, count, w, nd))
+                count += 1
+        return False
+
+    def expand(self, came_from, s, g):
+        """Junction chain -> every grid Node after s"""
+        pieces = []
+        cur = g
+        while cur != s:
+            prev, cells = came_from[cur]
+            pieces.append(list(cells) + [cur])
+            cur = prev
+        node_at = self.maze.node_at
+        return [node_at(i) for piece in reversed(pieces) for i in piece]
@@ -0,0 +1,112 @@
+import heapq
+from array import array
+
+INF = float('inf')
+
+
+class Landmarks:
+    """
+    ALT preprocessing (A*, Landmarks, Triangle inequality) for a static Maze.
+
+    For every landmark L we keep two distance arrays over cell ids:
+      from_landmark[L][v] = d(L, v)   (forward Dijkstra from L)
+      to_landmark[L][v]   = d(v, L)   (Dijkstra on reversed edges)
+    Both are needed because edge costs are directed (the cost of a step is the
+    cost of the cell being entered).
+
+    The triangle inequality then gives lower bounds on d(v, t):
+      d(v, t) >= d(L, t) - d(L, v)
+      d(v, t) >= d(v, L) - d(t, L)
+    and the max over all landmarks is an admissible (and consistent) heuristic.
+    Landmarks are picked farthest-first, which tends to put them on the maze
+    border, "behind" most queries.
+    """
+    def __init__(self, maze, k=8):
+        self.maze = maze
+        self.version = maze.version
+        self.landmarks = []
+        self.from_landmark = []
+        self.to_landmark = []
+        self._target = None
+        self._target_terms = []
+
+        n = maze.width * maze.height
+        if maze.start_node is None:
+            return
+        # Farthest-first: start from the cell farthest from the start node, then keep
+        # taking the cell farthest from every landmark chosen so far
+        nearest = self.dijkstra(maze.start_node.id, maze.edges)
+        for _ in range(min(k, n)):
+            candidate, far = -1, 0
+            for i in range(n):
+                d = nearest[i]
+                if d != INF and d > far:
+                    candidate, far = i, d
+            if candidate == -1:
+                break
+            forward = self.dijkstra(candidate, maze.edges)
+            self.landmarks.append(candidate)
+            self.from_landmark.append(forward)
+            self.to_landmark.append(self.dijkstra(candidate, maze.reverse_edges))
+            nearest = array('d', map(min, nearest, forward))
+
+    def dijkstra(self, source, expand):
+        """Single-source distances over cell ids (INF where unreachable)"""
+        dist = array('d', [INF]) * (self.maze.width * self.maze.height)
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            for j, cost in expand(i):
+                nd = d + cost
+                if nd < dist[j]:
+                    dist[j] = nd
+                    heapq.heappush(heap, (nd, j))
+        return dist
+
+    def is_current(self):
+        """Distances are only valid for the maze version they were built on"""
+        return self.version == self.maze.version
+
+    def estimate(self, v, t):
+        """Lower bound on the search cost from cell v to cell t"""
+        if t != self._target:
+            # Per-target terms are reused for every node of the same search
+            self._target = t
+            self._target_terms = [(fwd, rev, fwd[t], rev[t])
+                                  for fwd, rev in zip(self.from_landmark, self.to_landmark)]
+        best = 0
+        for fwd, rev, lt, tl in self._target_terms:
+            lv, vl = fwd[v], rev[v]
+            # Skip landmarks that cannot reach / be reached (inf - inf)
+            if lt != INF and lv != INF and lt - lv > best:
+                best = lt - lv
+            if vl != INF and tl != INF and vl - tl > best:
+                best = vl - tl
+        return best
+
+    def bounds(self, s, t):
+        """v -> (lower bound on d(v, t), lower bound on d(s, v)): the two ALT estimates
+        a bidirectional search balances. Both are consistent, for any non-negative costs."""
+        terms = [(fwd, rev, fwd[t], rev[t], fwd[s], rev[s])
+                 for fwd, rev in zip(self.from_landmark, self.to_landmark)
+                 if fwd[t] != INF and rev[t] != INF and fwd[s] != INF and rev[s] != INF]
+
+        def bound(v):
+            to_goal = from_start = 0
+            for fwd, rev, lt, tl, ls, sl in terms:
+                lv, vl = fwd[v], rev[v]
+                if lv == INF or vl == INF:
+                    continue
+                if lt - lv > to_goal:
+                    to_goal = lt - lv
+                if vl - tl > to_goal:
+                    to_goal = vl - tl
+                if lv - ls > from_start:
+                    from_start = lv - ls
+                if sl - vl > from_start:
+                    from_start = sl - vl
+            return to_goal, from_start
+        return bound
@@ -14,6 +14,11 @@ from BFS.bfs import BFSAI
 from DFS.dfs import DFSAI
 from BFS.bfs import BFSAI
 from AStar.astar import AStarAI
+from JPS.jps import JPSAI
+from Bidirectional.bidirectional import BidirectionalAI
+from ContractionHierarchy.ch import ContractionHierarchyAI
+from Corridor.corridor import CorridorAI
+from DStarLite.dstar_lite import DStarLiteAI
 from circular_maze import CircularMaze
 
 from algorithm_visualizer import TarjanVisualizer, RegionVisualizer, ConquerVisualizer
@@ -54,6 +59,12 @@ TEXT_MAIN = (205, 214, 244)    # Off-white
 TEXT_SUB = (166, 173, 200)     # Muted text
 BORDER_COLOR = (88, 91, 112)   # Subtle border
 
+# Circular maze: stone labyrinth aesthetic
+CIRCULAR_WALL = (90, 90, 110)      # Dark blue-gray stone
+CIRCULAR_FLOOR = (60, 55, 50)      # Warm dark stone floor
+CIRCULAR_OUTLINE = (40, 35, 30)    # Darker outline for depth
+CIRCULAR_WALL_THICKNESS = 10       # Thick stone walls
+
 class GameController:
     def __init__(self):
         pygame.init()
@@ -80,6 +91,7 @@ class GameController:
         self.show_graph = False
         self.show_heuristics = False
         self.show_dp_viz = False  # K key toggle for DP cost visualization
+        self.circular_cache = None  # Pre-rendered circular maze rings (see circular_layers)
         self.show_annotations = False
         
         # Complexity Mode
@@ -164,7 +176,8 @@ class GameController:
                 "  R   : Restart Level",
                 "  G   : Toggle Graph Overlay",
                 "  H   : Toggle Heuristics",
-                "  A   : Toggle AI Annotations"
+                "  A   : Toggle AI Annotations",
+                "  I   : Dynamic level: Greedy AI <-> D* Lite"
             ]),
             ("LEGEND", [
                 "S : Start Node  |  G : Goal Node",
@@ -326,7 +339,8 @@ class GameController:
             },
             'game': {
                 'consumed_items': set(self.consumed_items),
-                'elapsed_time': self.elapsed_time
+                'elapsed_time': self.elapsed_time,
+                'revision': getattr(self.maze, 'revision', 0) # Maze state, for D&C replay
             }
         })
 
@@ -419,148 +433,109 @@ class GameController:
         self.screen.blit(hint, hint.get_rect(center=(w//2, h - 30)))
 
 
+    def circular_layers(self, geo):
+        """
+        Pre-rendered rings of the circular maze for one window size.
+        Each ring (its walls with the corridors carved in) is drawn once, unrotated,
+        on its own surface centered on the maze center; a frame only turns and blits
+        it. Rebuilt when the maze, the window size or the walls change.
+        """
+        key = (self.maze, geo.size, self.maze.walls_version)
+        layers = self.circular_cache
+        if layers is None or layers['key'] != key:
+            layers = self.circular_cache = {
+                'key': key,
+                'rings': [self.render_ring(geo, r) for r in range(self.maze.num_rings)],
+                'glow': {}, # r -> (dp costs it shows, surface)
+            }
+        return layers
+
+    def ring_surface(self, geo, r):
+        """Empty surface large enough for ring r, and its center"""
+        half = int((r + 1) * geo.ring_step + CIRCULAR_WALL_THICKNESS) + 2
+        return pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA), (half, half)
+
+    def render_ring(self, geo, r):
+        wall_thickness = CIRCULAR_WALL_THICKNESS
+        surf, origin = self.ring_surface(geo, r)
+        radius_inner = r * geo.ring_step
+        radius_outer = (r + 1) * geo.ring_step
+        S = self.maze.sectors_per_ring
+        samples = geo.SAMPLES
+        
+        # Walls: radial wall at the end of every sector, then the ring wall (arc between rings)
+        for s in range(S):
+            pygame.draw.line(surf, CIRCULAR_WALL, *geo.spoke(s, radius_inner, radius_outer, origin), wall_thickness)
+        if r > 0: # No inner wall for center
+            pts = geo.arc(0, S * samples - 1, radius_inner, origin)
+            pygame.draw.lines(surf, CIRCULAR_WALL, True, pts, wall_thickness)
+        
+        # Corridors carved where walls are open
+        for s in range(S):
+            node = self.maze.grid[r][s]
+            pts = geo.band(s, radius_inner + wall_thickness//2, radius_outer - wall_thickness//2, origin)
+            pygame.draw.polygon(surf, CIRCULAR_FLOOR, pts)
+            pygame.draw.polygon(surf, CIRCULAR_OUTLINE, pts, 2)  # Outline for depth
+            
+            # Carve CW opening (remove radial wall if open)
+            if not node.walls['cw']:
+                wp_inner, wp_outer = geo.spoke(s, radius_inner + wall_thickness//2, radius_outer - wall_thickness//2, origin)
+                pygame.draw.line(surf, CIRCULAR_FLOOR, wp_inner, wp_outer, wall_thickness + 4)
+            
+            # Carve In opening (remove ring wall if open)
+            if r > 0 and not node.walls['in']:
+                pts = geo.arc(s * samples, samples, radius_inner, origin)
+                pygame.draw.lines(surf, CIRCULAR_FLOOR, False, pts, wall_thickness + 4)
+        return surf
+
+    def render_ring_glow(self, geo, r, costs):
+        """DP cost glow (cyan/teal for low cost) of ring r, unrotated"""
+        wall_thickness = CIRCULAR_WALL_THICKNESS
+        surf, origin = self.ring_surface(geo, r)
+        for s, cost in enumerate(costs):
+            val = max(0, 20 - cost) / 20.0 if cost < float('inf') else 0
+            if val > 0:
+                color = (0, int(180 * val), int(200 * val), 80)
+                pts = geo.band(s, r * geo.ring_step + wall_thickness//2, (r + 1) * geo.ring_step - wall_thickness//2, origin)
+                pygame.draw.polygon(surf, color, pts)
+        return surf
+
+    def blit_ring(self, surf, r, geo):
+        """Blit a pre-rendered ring turned by its current offset"""
+        angle = self.maze.offsets[r] * geo.angle_step
+        if angle:
+            surf = pygame.transform.rotate(surf, -angle) # Screen angles grow clockwise
+        self.screen.blit(surf, surf.get_rect(center=(geo.cx, geo.cy)))
+
     def draw_circular_maze(self):
-        """Render circular maze as stone labyrinth with thick walls and carved corridors."""
+        """Render circular maze as stone labyrinth with thick walls and carved corridors.
+        Geometry and ring images are cached (see circular_layers): per frame this is
+        one rotated blit per ring, whatever the sector count."""
         w, h = self.screen.get_size()
-        cx, cy = w // 2, h // 2 + 30  # Center point with header offset
-        
-        max_radius = min(w, h) // 2 - 50
-        num_rings = self.maze.num_rings
-        ring_step = max_radius // (num_rings + 0.5)
-        
-        # Wall and corridor dimensions
-        wall_thickness = 10  # Thick stone walls
+        geo = self.maze.screen_geometry((w, h))
+        cx, cy = geo.cx, geo.cy
+        layers = self.circular_layers(geo)
         
-        # Color scheme: Stone labyrinth aesthetic
-        wall_color = (90, 90, 110)           # Dark blue-gray stone
-        corridor_floor = (60, 55, 50)        # Warm dark stone floor
-        corridor_outline = (40, 35, 30)      # Darker outline for depth
-        
-        # Helper function for polar coordinates
-        def get_pt(deg, radius):
-            """Convert polar (angle, radius) to screen (x, y)."""
-            rad = math.radians(deg)
-            return (cx + math.cos(rad) * radius, cy + math.sin(rad) * radius)
-        
-        # ========== LAYER 1: Draw all walls (full grid) ==========
-        # Draw complete wall grid first, then carve corridors
-        wall_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        
-        for r in range(num_rings):
-            radius_inner = r * ring_step
-            radius_outer = (r + 1) * ring_step
-            
-            S = self.maze.sectors_per_ring
-            angle_step = 360 / S
-            offset_angle = self.maze.offsets[r] * angle_step
-            
-            # Draw radial walls (all sectors)
-            for s in range(S):
-                start_deg = -90 + (s * angle_step) + offset_angle
-                end_deg = start_deg + angle_step
-                
-                # Radial wall at end of sector (clockwise edge)
-                wp_inner = get_pt(end_deg, radius_inner)
-                wp_outer = get_pt(end_deg, radius_outer)
-                pygame.draw.line(wall_surf, wall_color, wp_inner, wp_outer, wall_thickness)
-            
-            # Draw ring wall (arc between rings)
-            if r > 0:  # No inner wall for center
-                # Draw continuous arc for this ring
-                pts = []
-                for i in range(int(S * 10)):  # High precision arc
-                    deg = -90 + (i / (S * 10)) * 360 + offset_angle
-                    pts.append(get_pt(deg, radius_inner))
-                if len(pts) > 1:
-                    pygame.draw.lines(wall_surf, wall_color, True, pts, wall_thickness)
+        # ========== LAYER 1-2: Walls with carved corridors, turned per ring ==========
+        for r, surf in enumerate(layers['rings']):
+            self.blit_ring(surf, r, geo)
         
         # Draw outer boundary (always solid)
-        pygame.draw.circle(wall_surf, wall_color, (cx, cy), int(max_radius), wall_thickness)
-        
-        # ========== LAYER 2: Carve corridors where walls are open ==========
-        corridor_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        
-        for r in range(num_rings):
-            radius_inner = r * ring_step
-            radius_outer = (r + 1) * ring_step
-            
-            S = self.maze.sectors_per_ring
-            angle_step = 360 / S
-            offset_angle = self.maze.offsets[r] * angle_step
-            
-            for s in range(S):
-                node = self.maze.grid[r][s]
-                start_deg = -90 + (s * angle_step) + offset_angle
-                end_deg = start_deg + angle_step
-                
-                # Draw corridor floor for this sector
-                # Create polygon for corridor area
-                pts = []
-                # Outer arc
-                for i in range(11):
-                    pts.append(get_pt(start_deg + (i/10)*angle_step, radius_outer - wall_thickness//2))
-                # Inner arc (reverse)
-                for i in range(10, -1, -1):
-                    pts.append(get_pt(start_deg + (i/10)*angle_step, radius_inner + wall_thickness//2))
-                
-                # Draw corridor floor
-                pygame.draw.polygon(corridor_surf, corridor_floor, pts)
-                pygame.draw.polygon(corridor_surf, corridor_outline, pts, 2)  # Outline for depth
-                
-                # Carve CW opening (remove radial wall if open)
-                if not node.walls['cw']:
-                    # Draw corridor color over the wall
-                    wp_inner = get_pt(end_deg, radius_inner + wall_thickness//2)
-                    wp_outer = get_pt(end_deg, radius_outer - wall_thickness//2)
-                    pygame.draw.line(corridor_surf, corridor_floor, wp_inner, wp_outer, wall_thickness + 4)
-                
-                # Carve In opening (remove ring wall if open)
-                if r > 0 and not node.walls['in']:
-                    # Draw corridor color over the inner arc wall
-                    pts = []
-                    for i in range(11):
-                        pts.append(get_pt(start_deg + (i/10)*angle_step, radius_inner))
-                    pygame.draw.lines(corridor_surf, corridor_floor, False, pts, wall_thickness + 4)
-        
-        # Blit walls and corridors
-        self.screen.blit(wall_surf, (0, 0))
-        self.screen.blit(corridor_surf, (0, 0))
+        pygame.draw.circle(self.screen, CIRCULAR_WALL, (cx, cy), int(geo.max_radius), CIRCULAR_WALL_THICKNESS)
         
         # ========== LAYER 3: Draw DP cost glow overlay ==========
-        glow_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        
-        for r in range(num_rings):
-            radius_inner = r * ring_step
-            radius_outer = (r + 1) * ring_step
-            
-            S = self.maze.sectors_per_ring
-            angle_step = 360 / S
-            offset_angle = self.maze.offsets[r] * angle_step
-            
-            for s in range(S):
-                node = self.maze.grid[r][s]
-                start_deg = -90 + (s * angle_step) + offset_angle
-                end_deg = start_deg + angle_step
-                
-                # DP glow (cyan/teal for low cost) - Toggle with K key
-                if self.show_dp_viz and node.dp_cost < float('inf'):
-                    val = max(0, 20 - node.dp_cost) / 20.0
-                    if val > 0:
-                        color = (0, int(180 * val), int(200 * val), 80)
-                        pts = []
-                        # Outer arc
-                        for i in range(11):
-                            pts.append(get_pt(start_deg + (i/10)*angle_step, radius_outer - wall_thickness//2))
-                        # Inner arc
-                        for i in range(10, -1, -1):
-                            pts.append(get_pt(start_deg + (i/10)*angle_step, radius_inner + wall_thickness//2))
-                        pygame.draw.polygon(glow_surf, color, pts)
-        
-        self.screen.blit(glow_surf, (0, 0))
+        # Toggle with K key; a ring's glow is redrawn only when its costs change
+        if self.show_dp_viz:
+            for r in range(self.maze.num_rings):
+                costs = tuple(node.dp_cost for node in self.maze.grid[r])
+                cached = layers['glow'].get(r)
+                if cached is None or cached[0] != costs:
+                    cached = layers['glow'][r] = (costs, self.render_ring_glow(geo, r, costs))
+                self.blit_ring(cached[1], r, geo)
         
         # ========== LAYER 4: Draw Goal (Center) ==========
         # Draw glowing center goal
-        goal_radius = min(ring_step // 2, 20)
+        goal_radius = min(geo.ring_step // 2, 20)
         # Outer glow
         for i in range(3):
             alpha = 100 - i * 30
@@ -573,57 +548,23 @@ class GameController:
         pygame.draw.circle(self.screen, (200, 255, 200), (cx, cy), goal_radius, 3)
         self.draw_text("G", self.font, (20, 20, 20), (cx, cy), shadow=False)
         
-        # ========== LAYER 5: Draw Player ==========
-        if self.player and self.player.current_node:
-            pr = self.player.current_node.r
-            pc = self.player.current_node.c
-            
-            # Calculate Player position (center of corridor)
-            p_offset = self.maze.offsets[pr] * (360/self.maze.sectors_per_ring)
-            p_angle = -90 + (pc * (360/self.maze.sectors_per_ring)) + p_offset + (360/self.maze.sectors_per_ring)/2
-            p_rad = math.radians(p_angle)
-            p_dist = (pr * ring_step) + ring_step/2
-            
-            px = cx + math.cos(p_rad) * p_dist
-            py = cy + math.sin(p_rad) * p_dist
-            
-            # Player with glow
-            glow_r = 15
-            for i in range(3):
-                alpha = 80 - i * 25
-                r = glow_r + (3 - i) * 4
-                s = pygame.Surface((r*2+10, r*2+10), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*ACCENT_BLUE, alpha), (r+5, r+5), r)
-                self.screen.blit(s, (int(px - r - 5), int(py - r - 5)))
-            
-            pygame.draw.circle(self.screen, ACCENT_BLUE, (int(px), int(py)), 10)
-            pygame.draw.circle(self.screen, TEXT_MAIN, (int(px), int(py)), 10, 2)
-        
-        # ========== LAYER 6: Draw AI ==========
-        if self.ai and self.ai.current_node:
-            ar = self.ai.current_node.r
-            ac = self.ai.current_node.c
-            
-            # Calculate AI position (center of corridor)
-            a_offset = self.maze.offsets[ar] * (360/self.maze.sectors_per_ring)
-            a_angle = -90 + (ac * (360/self.maze.sectors_per_ring)) + a_offset + (360/self.maze.sectors_per_ring)/2
-            a_rad = math.radians(a_angle)
-            a_dist = (ar * ring_step) + ring_step/2
-            
-            ax = cx + math.cos(a_rad) * a_dist
-            ay = cy + math.sin(a_rad) * a_dist
+        # ========== LAYER 5-6: Draw Player and AI (center of their corridor) ==========
+        for agent, color in ((self.player, ACCENT_BLUE), (self.ai, ACCENT_ORANGE)):
+            if not (agent and agent.current_node):
+                continue
+            px, py = self.maze.get_screen_pos(agent.current_node, (w, h))
             
-            # AI with glow (orange)
+            # Agent with glow
             glow_r = 15
             for i in range(3):
                 alpha = 80 - i * 25
                 r = glow_r + (3 - i) * 4
                 s = pygame.Surface((r*2+10, r*2+10), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*ACCENT_ORANGE, alpha), (r+5, r+5), r)
-                self.screen.blit(s, (int(ax - r - 5), int(ay - r - 5)))
+                pygame.draw.circle(s, (*color, alpha), (r+5, r+5), r)
+                self.screen.blit(s, (px - r - 5, py - r - 5))
             
-            pygame.draw.circle(self.screen, ACCENT_ORANGE, (int(ax), int(ay)), 10)
-            pygame.draw.circle(self.screen, TEXT_MAIN, (int(ax), int(ay)), 10, 2)
+            pygame.draw.circle(self.screen, color, (px, py), 10)
+            pygame.draw.circle(self.screen, TEXT_MAIN, (px, py), 10, 2)
         
     def draw_grid(self):
         if isinstance(self.maze, CircularMaze):
@@ -650,35 +591,33 @@ class GameController:
                         continue
 
                 # Dynamic Maze Visualizations (Warning/Animation)
-                if isinstance(self.maze, DynamicMaze):
-                    for change in self.maze.pending_changes:
-                        if change['node'] == node:
-                            if change['state'] == 'WARNING':
-                                # Pulsing Yellow/Orange Overlay
-                                pulse = (math.sin(time.time() * 10) + 1) * 0.5
-                                alpha = int(100 * pulse)
-                                s = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                                color = (255, 165, 0, alpha) if change['type'] == 'ADD_WALL' else (0, 255, 255, alpha)
-                                s.fill(color)
-                                self.screen.blit(s, rect)
-                                pygame.draw.rect(self.screen, color[:3], rect, 2)
-                                
-                            elif change['state'] == 'ANIMATING':
-                                # Scaling Animation
-                                progress = 1.0 - (change['timer'] / 1.5) # 0 to 1
-                                if change['type'] == 'ADD_WALL':
-                                    # Growing Wall
-                                    size = int(TILE_SIZE * progress)
-                                    center_rect = pygame.Rect(0, 0, size, size)
-                                    center_rect.center = rect.center
-                                    pygame.draw.rect(self.screen, BG_SECONDARY, center_rect)
-                                elif change['type'] == 'REMOVE_WALL':
-                                    # Dissolving Wall (Fading out)
-                                    alpha = int(255 * (1 - progress))
-                                    s = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                                    s.fill((*BG_SECONDARY, alpha))
-                                    self.screen.blit(s, rect)
-                            break
+                if isinstance(self.maze, DynamicMaze) and node in self.maze.pending_by_node:
+                    change = self.maze.pending_by_node[node][0]
+                    if change['state'] == 'WARNING':
+                        # Pulsing Yellow/Orange Overlay
+                        pulse = (math.sin(time.time() * 10) + 1) * 0.5
+                        alpha = int(100 * pulse)
+                        s = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                        color = (255, 165, 0, alpha) if change['type'] == 'ADD_WALL' else (0, 255, 255, alpha)
+                        s.fill(color)
+                        self.screen.blit(s, rect)
+                        pygame.draw.rect(self.screen, color[:3], rect, 2)
+                        
+                    elif change['state'] == 'ANIMATING':
+                        # Scaling Animation
+                        progress = 1.0 - (self.maze.remaining_time(change) / 1.5) # 0 to 1
+                        if change['type'] == 'ADD_WALL':
+                            # Growing Wall
+                            size = int(TILE_SIZE * progress)
+                            center_rect = pygame.Rect(0, 0, size, size)
+                            center_rect.center = rect.center
+                            pygame.draw.rect(self.screen, BG_SECONDARY, center_rect)
+                        elif change['type'] == 'REMOVE_WALL':
+                            # Dissolving Wall (Fading out)
+                            alpha = int(255 * (1 - progress))
+                            s = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                            s.fill((*BG_SECONDARY, alpha))
+                            self.screen.blit(s, rect)
 
                 # Flash Effect for Dynamic Changes
                 if isinstance(self.maze, DynamicMaze) and self.maze.last_event_node == node:
@@ -1214,6 +1153,19 @@ class GameController:
                     if len(valid_neighbors) <= 1 and node != self.maze.start_node and node != self.maze.goal_node:
                         self.dead_end_nodes.add(node)
 
+    def toggle_incremental_ai(self):
+        """DYNAMIC level only: replace the AI, from where it stands, with D* Lite (repairs
+        its search after each structural change, see run) or back with the greedy planner"""
+        if not isinstance(self.maze, DynamicMaze) or not self.ai or self.ai.finished:
+            return
+        if isinstance(self.ai, DStarLiteAI):
+            agent, name = EuclideanAI, "Greedy Best-First (Euclidean)"
+        else:
+            agent, name = DStarLiteAI, "D* Lite (Incremental)"
+        self.ai = agent(self.ai.current_node, self.maze.goal_node, self.maze)
+        self.temp_msg = f"AI: {name}"
+        self.temp_msg_time = time.time()
+
     def prepare_multi_simulation(self):
         print("Preparing Multi-Simulation Agents...")
         self.simulation_agents = [
@@ -1223,7 +1175,12 @@ class GameController:
             HillClimbingAI(self.maze.start_node, self.maze.goal_node, self.maze),
             BFSAI(self.maze.start_node, self.maze.goal_node, self.maze),
             DFSAI(self.maze.start_node, self.maze.goal_node, self.maze),
-            AStarAI(self.maze.start_node, self.maze.goal_node, self.maze)
+            AStarAI(self.maze.start_node, self.maze.goal_node, self.maze),
+            JPSAI(self.maze.start_node, self.maze.goal_node, self.maze),
+            BidirectionalAI(self.maze.start_node, self.maze.goal_node, self.maze),
+            ContractionHierarchyAI(self.maze.start_node, self.maze.goal_node, self.maze),
+            CorridorAI(self.maze.start_node, self.maze.goal_node, self.maze),
+            DStarLiteAI(self.maze.start_node, self.maze.goal_node, self.maze)
         ]
         self.sim_names = [
             "Greedy Best-First (Euclidean)",
@@ -1232,7 +1189,12 @@ class GameController:
             "Pure Greedy (Hill Climbing)",
             "Breadth-First Search (BFS)",
             "Depth-First Search (DFS)",
-            "A* Search (Optimal)"
+            "A* Search (Optimal)",
+            "Jump Point Search (JPS)",
+            "Bidirectional A*",
+            "Contraction Hierarchy",
+            "A* (Junction Graph)",
+            "D* Lite (Incremental)"
         ]
         self.current_sim_index = 0
         print("Simulation Agents Ready")
@@ -1529,14 +1491,20 @@ class GameController:
         self.replay_index = 0
         self.replay_speed = 0.5
         
-        # Reset maze completely to evaluate dynamic replay correctly
-        # The true "Replay" mode handles purely visual coords, but for D&C we just re-run the trace.
-        for node in getattr(self.maze, 'nodes', getattr(self.maze, 'grid', [])):
-            if type(node) is list:
-                for n in node: 
-                    if n.type == '.' or n.type == '#': n.cost = 1 if n.type == '.' else float('inf')
-            else:
-                pass # Support flattened if needed
+        # Rewind the maze to the first frame; draw_dc_replay keeps it on the frame's revision
+        self.maze.checkout(self.frame_revision(self.history[0]))
+
+    def frame_revision(self, frame):
+        """Maze revision a history frame was recorded at (dynamic events: before the change)"""
+        if frame.get('type') == 'DYNAMIC_CHANGE':
+            return frame.get('before_revision', 0)
+        return frame.get('game', {}).get('revision', 0)
+
+    def leave_dc_replay(self):
+        """Return the maze from the replayed past to the present"""
+        if hasattr(self.maze, 'checkout'):
+            self.maze.checkout(self.maze.history.head)
+        self.state = PLAYING
 
     def draw_dc_replay(self):
         """Draws the Synchronized D&C Replay Step-by-Step Simulation Overlay."""
@@ -1548,6 +1516,8 @@ class GameController:
             
         current_frame = self.history[self.replay_index]
         is_dynamic_event = current_frame.get('type') == 'DYNAMIC_CHANGE'
+        if not (is_dynamic_event and self.dc_sim_stage == 4):
+            self.maze.checkout(self.frame_revision(current_frame)) # No-op unless the frame moved
 
         # 1. Background Rendering (Standard Replay rendering from history)
         # We need to manually draw the maze and entities based on the history state 
@@ -1683,13 +1653,8 @@ class GameController:
 
             # Phase Complete - Advance Replay Automatically
             elif self.dc_sim_stage == 4:
-                # Apply structural visual change on grid so it persists later in regular drawing
-                if change_type == 'ADD_WALL':
-                    node.type = '#'
-                    node.cost = float('inf')
-                else:
-                    node.type = '.'
-                    node.cost = 1
+                # Show the maze after the change (the history revision it produced)
+                self.maze.checkout(current_frame.get('revision', self.maze.history.head))
                 self.dc_sim_stage = 0
                 self.replay_index += 1 # Auto-advance past the pause
                 
@@ -1699,7 +1664,7 @@ class GameController:
         pygame.draw.rect(self.screen, (100, 100, 100), (20, h-60, bar_w, 10))
         pygame.draw.rect(self.screen, ACCENT_CYAN, (20, h-60, bar_w * progress, 10))
         self.draw_text(f"D&C REPLAY | Frame: {self.replay_index}/{len(self.history)-1} | Speed: {self.replay_speed}x", self.small_font, TEXT_MAIN, (w//2, h-35))
-        self.draw_text("Space: Pause | Arrows: Seek | Modifies Real Maze Visually", self.small_font, TEXT_SUB, (w//2, h-15))
+        self.draw_text("Space: Pause | Arrows: Seek | Maze Shown As It Was At Each Frame", self.small_font, TEXT_SUB, (w//2, h-15))
 
 
     def draw_replay(self):
@@ -1900,8 +1865,13 @@ class GameController:
                 if isinstance(self.maze, DynamicMaze):
                     self.maze.update_structure()
                     if self.maze.process_updates(dt):
-                        print("Structure Updated! Re-calculating AI path...")
-                        self.ai.compute_path()
+                        if hasattr(self.ai, 'notify_changes'):
+                            # Incremental agents repair their search instead of starting over
+                            print("Structure Updated! Re-calculating AI path...")
+                            self.ai.notify_changes(self.maze.last_changed_nodes)
+                        elif self.ai.needs_replan(self.maze.last_change_set):
+                            print("Structure Updated! Re-calculating AI path...")
+                            self.ai.compute_path()
                         if getattr(self.maze, 'last_event_node', None):
                             # Inject dynamic change into history for synchronized DC_REPLAY playback
                             node = self.maze.last_event_node
@@ -1909,7 +1879,9 @@ class GameController:
                             self.history.append({
                                 'type': 'DYNAMIC_CHANGE',
                                 'node': node,
-                                'change_type': change_type
+                                'change_type': change_type,
+                                'before_revision': self.maze.revision - len(self.maze.last_transitions['APPLIED']),
+                                'revision': self.maze.revision
                             })
                 elif isinstance(self.maze, CircularMaze):
                     self.maze.update(dt) # Continuous rotation
@@ -2017,6 +1989,8 @@ class GameController:
                     elif event.key == pygame.K_d: # Enable DC Replay Mode
                         self.state = DC_REPLAY
                         self.prepare_dc_replay()
+                    elif event.key == pygame.K_i: # DYNAMIC: swap greedy AI <-> D* Lite
+                        self.toggle_incremental_ai()
                     elif event.key == pygame.K_u or event.key == pygame.K_BACKSPACE:
                         self.backtrack()
                     elif event.key == pygame.K_ESCAPE: self.state = MENU
@@ -2120,7 +2094,7 @@ class GameController:
 
                 elif self.state == DC_REPLAY and event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        self.state = PLAYING
+                        self.leave_dc_replay()
                 
                 elif self.state == INSTRUCTIONS and event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
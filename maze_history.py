@@ -0,0 +1,92 @@
+from bisect import bisect_right
+from game_classes import WALL, OPEN
+
+# Byte -> its 8 bits, least significant first, as 0/1 bytes (unpacks a wall mask a byte at a time)
+_BITS = [bytes((b >> k) & 1 for k in range(8)) for b in range(256)]
+
+
+def pack_walls(codes):
+    """Bit-packed wall mask of a type-code buffer (bit i%8 of byte i//8 = cell i is a wall)"""
+    flags = bytes(codes).translate(bytes(1 if b == WALL else 0 for b in range(256)))
+    packed = bytearray((len(flags) + 7) // 8)
+    for i in range(8):
+        for j, bit in enumerate(flags[i::8]):
+            if bit:
+                packed[j] |= 1 << i
+    return bytes(packed)
+
+
+def unpack_walls(packed, count):
+    """pack_walls inverse: one 0/1 byte per cell"""
+    return b''.join(_BITS[b] for b in packed)[:count]
+
+
+class MazeHistory:
+    """
+    Append-only log of cell type changes with periodic compact snapshots.
+
+    Revision n is the maze after the first n logged changes (0 = as generated).
+    Every snapshot_every changes a snapshot is taken: the bit-packed wall mask plus
+    the few open cells whose code differs from the base layout's. codes_at(n)
+    unpacks the snapshot at or below n and replays at most snapshot_every - 1 log
+    entries, so any past state costs one snapshot decode, never a re-simulation.
+    Each entry also keeps the maze.version it produced: revision_at(version)
+    is a bisect.
+    """
+    def __init__(self, codes, snapshot_every=64):
+        self.base = bytes(codes)
+        # Open cells default to their base code, or '.' where the base had a wall
+        self.open_base = self.base.translate(bytes(OPEN if b == WALL else b for b in range(256)))
+        self.snapshot_every = snapshot_every
+        self.log = [] # (cell id, new code)
+        self.versions = [] # maze.version right after each entry (non-decreasing)
+        self.snapshots = [(pack_walls(self.base), {})] # One per snapshot_every entries
+        self.state = bytearray(self.base) # Codes at the head revision
+
+    @property
+    def head(self):
+        return len(self.log)
+
+    def record(self, cell, code, version):
+        """Log one change (the maze now has `code` at `cell`); returns the new head revision"""
+        self.log.append((cell, code))
+        self.versions.append(version)
+        self.state[cell] = code
+        if len(self.log) % self.snapshot_every == 0:
+            self.snapshots.append(self.snapshot(self.state))
+        return len(self.log)
+
+    def snapshot(self, codes):
+        open_base = self.open_base
+        overrides = {i: code for i, code in enumerate(codes) if code != WALL and code != open_base[i]}
+        return pack_walls(codes), overrides
+
+    def revision_at(self, version):
+        """Latest revision whose changes were all made at or before maze.version `version`"""
+        return bisect_right(self.versions, version)
+
+    def codes_at(self, revision):
+        """Type codes (bytearray, one per cell) of the maze at `revision`"""
+        if not 0 <= revision <= len(self.log):
+            raise IndexError(f"revision {revision} outside 0..{len(self.log)}")
+        if revision == len(self.log):
+            return bytearray(self.state)
+        k = revision // self.snapshot_every
+        packed, overrides = self.snapshots[k]
+        codes = bytearray(self.open_base)
+        walls = unpack_walls(packed, len(codes))
+        i = walls.find(1)
+        while i != -1:
+            codes[i] = WALL
+            i = walls.find(1, i + 1)
+        for i, code in overrides.items():
+            codes[i] = code
+        for cell, code in self.log[k * self.snapshot_every:revision]:
+            codes[cell] = code
+        return codes
+
+    def changes_between(self, a, b):
+        """{cell id: code at revision b} for every cell that differs between revisions a and b"""
+        cells = {cell for cell, _ in self.log[min(a, b):max(a, b)]}
+        source, target = self.codes_at(a), self.codes_at(b)
+        return {i: target[i] for i in sorted(cells) if target[i] != source[i]}
@@ -71,6 +71,68 @@ class RegionLogic:
             
         return articulation_points
 
+    @staticmethod
+    def compute_biconnected_components(maze, cells=None):
+        """
+        Tarjan's edge-stack algorithm over cell ids: every biconnected component
+        (block) of the walkable graph, or of the subgraph induced by cells.
+        A cell is an articulation point iff it belongs to two or more blocks.
+        Returns: list of set(cell id)
+        """
+        if cells is None:
+            cells = [i for i in range(maze.width * maze.height) if maze.cell_code(i) != ord('#')]
+            neighbors = maze.neighbor_ids
+        else:
+            cells = set(cells)
+            def neighbors(i):
+                return [j for j in maze.neighbor_ids(i) if j in cells]
+
+        discovery_time = {}
+        low_link = {}
+        blocks = []
+        time = 0
+
+        for root in cells:
+            if root in discovery_time:
+                continue
+            discovery_time[root] = low_link[root] = time
+            time += 1
+            # Iterative DFS to avoid recursion limit
+            stack = [(root, None, iter(neighbors(root)))]
+            edges = []
+
+            while stack:
+                u, p, it = stack[-1]
+                for v in it:
+                    if v == p:
+                        continue
+                    if v not in discovery_time:
+                        discovery_time[v] = low_link[v] = time
+                        time += 1
+                        edges.append((u, v))
+                        stack.append((v, u, iter(neighbors(v))))
+                        break
+                    if discovery_time[v] < discovery_time[u]:
+                        # Back edge to an ancestor
+                        low_link[u] = min(low_link[u], discovery_time[v])
+                        edges.append((u, v))
+                else:
+                    stack.pop()
+                    if p is None:
+                        continue
+                    low_link[p] = min(low_link[p], low_link[u])
+                    if low_link[u] >= discovery_time[p]:
+                        # p separates u's subtree: pop its block off the edge stack
+                        block = set()
+                        while True:
+                            a, b = edges.pop()
+                            block.add(a)
+                            block.add(b)
+                            if a == p and b == u:
+                                break
+                        blocks.append(block)
+        return blocks
+
     @staticmethod
     def compute_regions(maze, articulation_points):
         """
@@ -0,0 +1,196 @@
+import heapq
+import math
+
+INF = float('inf')
+
+
+class AlignmentTable:
+    """
+    When each ring lines up with the ring inside it, in closed form.
+
+    Ring pair (r, r-1) is aligned with sector shift k (sector s of ring r faces
+    sector s + k of ring r-1) while the relative offset
+        d(t) = (offsets[r] - offsets[r-1]) + (speed[r] - speed[r-1]) * t   (mod S)
+    is within 0.4 of k, the same rule as CircularMaze.get_weighted_neighbors.
+    Speeds are constant, so d moves linearly: each shift's window lasts
+    0.8 / |dv| seconds and comes back every S / |dv| seconds (the period).
+    The table stores, per pair, the period and each shift's window start in
+    [0, period), measured from the offsets at build time (t = 0); next_window
+    walks the windows of all shifts in time order.
+    """
+    EPS = 1e-9 # Windows are open intervals: depart just inside them
+
+    def __init__(self, maze):
+        S = maze.sectors_per_ring
+        self.sectors = S
+        self.pairs = {} # r -> (period, window length, [start per shift k]) or (None, None, [always?])
+        self.motion = {} # r -> (relative offset at t = 0, relative speed)
+        for r in range(2, maze.num_rings):
+            d0 = (maze.offsets[r] - maze.offsets[r - 1]) % S
+            dv = maze.ring_configs[r].speed - maze.ring_configs[r - 1].speed
+            self.motion[r] = (d0, dv)
+            if dv == 0:
+                # Rings turn together: aligned forever with one shift, or never
+                k = round(d0)
+                self.pairs[r] = (None, None, [abs(k - d0) < 0.4 and k % S == shift for shift in range(S)])
+                continue
+            period = S / abs(dv)
+            length = 0.8 / abs(dv)
+            starts = []
+            for k in range(S):
+                entry = k - 0.4 if dv > 0 else k + 0.4 # Where d(t) enters shift k's window
+                starts.append(((entry - d0) / dv) % period)
+            self.pairs[r] = (period, length, starts)
+
+    def depart(self, r, k, t):
+        """Earliest time >= t at which ring pair (r, r-1) is aligned with shift k (INF if never)"""
+        period, length, starts = self.pairs[r]
+        if period is None:
+            return t if starts[k] else INF
+        x = (t - starts[k]) % period
+        if x < length - self.EPS:
+            return t if x > self.EPS else t - x + self.EPS # In the window (or at its start)
+        return t + (period - x) + self.EPS
+
+    def next_window(self, r, t):
+        """(depart, shift, window end) for the window of pair r open at t, else the next
+        one to open; None if the pair never aligns again"""
+        d0, dv = self.motion[r]
+        S = self.sectors
+        d = (d0 + dv * t) % S
+        k = round(d)
+        if abs(k - d) < 0.4:
+            if dv == 0:
+                return t, k % S, INF
+            end = (k + 0.4 - d) / dv if dv > 0 else (d - (k - 0.4)) / -dv
+            return t, k % S, t + end - self.EPS
+        if dv == 0:
+            return None
+        if dv > 0:
+            j = math.ceil(d + 0.4) # d climbs to j - 0.4 (maybe right now)
+            start = t + (j - 0.4 - d) / dv
+        else:
+            j = math.floor(d - 0.4) # d falls to j + 0.4 (maybe right now)
+            start = t + (d - (j + 0.4)) / -dv
+        return start + self.EPS, j % S, start + 0.8 / abs(dv) - self.EPS
+
+
+def earliest_arrival(maze, start=None, move_time=1.0):
+    """
+    Time-dependent Dijkstra from start (default maze.start_node) to the center.
+    Waiting is free to schedule but costs time; moving takes move_time and an
+    inter-ring move needs the pair aligned when it starts. Labels are earliest
+    arrival times, and waiting never makes a later arrival earlier (FIFO), so the
+    first time the center is settled is optimal; no horizon is involved.
+    Inter-ring moves are generated per ring pair, not per cell: a settled cell
+    uses the window open right now, then waits on its pair. Each pair queues
+    one event per alignment window (in time order, via next_window) that moves
+    every waiting cell across; a cell waits at most one period, and nobody waits
+    for a ring that is fully settled.
+    Returns (arrival time, plan) with plan = [(depart time, from node, to node)],
+    or (INF, []) if the center can't be reached. Times are seconds from now.
+    """
+    start = start or maze.start_node
+    table = AlignmentTable(maze)
+    S, R = maze.sectors_per_ring, maze.num_rings
+    cw_open, in_open = maze.dp_cw_open, maze.dp_in_open
+    center = R * S # Id of the center node in the labels
+    arrival = {start.id: 0.0}
+    came_from = {start.id: None}
+    heap = [(0.0, 0, None)] # (time, seq, window or None for a label)
+    labels = {0: start.id} # seq -> cell of a label entry
+    seq = 1
+    unsettled = [S] * R
+    waiting = {r: ([], []) for r in table.pairs} # pair -> (cells moving in, cells moving out), with their settle times
+    queued = set() # Pairs with a window event in the heap
+
+    def relax(u, v, depart):
+        nonlocal seq
+        at = depart + move_time
+        if at < arrival.get(v, INF):
+            arrival[v] = at
+            came_from[v] = (u, depart)
+            labels[seq] = v
+            heapq.heappush(heap, (at, seq, None))
+            seq += 1
+
+    def cross(pair, k, depart, inward, cells):
+        """Move cells over pair (aligned with shift k) at depart"""
+        if inward:
+            base = (pair - 1) * S
+            for u, _ in cells:
+                relax(u, base + (u + k) % S, depart)
+        else:
+            base = pair * S
+            for u, _ in cells:
+                v = base + (u - k) % S
+                if in_open[v]:
+                    relax(u, v, depart)
+
+    def wait(u, pair, inward, t):
+        nonlocal seq
+        if not unsettled[pair - 1 if inward else pair]:
+            return
+        window = table.next_window(pair, t)
+        if window is None:
+            return
+        if window[0] <= t: # Aligned right now
+            cross(pair, window[1], t, inward, [(u, t)])
+            if window[2] == INF: # Rings turn together: nothing more to wait for
+                return
+        waiting[pair][0 if inward else 1].append((u, t))
+        if pair not in queued:
+            depart, k, end = window if window[0] > t else table.next_window(pair, window[2] + 2 * table.EPS)
+            heapq.heappush(heap, (depart, seq, (pair, k, end)))
+            seq += 1
+            queued.add(pair)
+
+    while heap:
+        t, key, window = heapq.heappop(heap)
+        if window is not None:
+            pair, k, end = window
+            queued.discard(pair)
+            period = table.pairs[pair][0]
+            for inward, cells in ((True, waiting[pair][0]), (False, waiting[pair][1])):
+                if period is not None: # Past a full period every target was offered already
+                    cells[:] = [(u, since) for u, since in cells if t - since < period]
+                if not unsettled[pair - 1 if inward else pair]:
+                    cells.clear()
+                cross(pair, k, t, inward, cells)
+            if waiting[pair][0] or waiting[pair][1]:
+                following = table.next_window(pair, end + 2 * table.EPS)
+                if following is not None:
+                    heapq.heappush(heap, (following[0], seq, (pair,) + following[1:]))
+                    seq += 1
+                    queued.add(pair)
+            continue
+        u = labels.pop(key)
+        if t > arrival[u]:
+            continue
+        if u == center:
+            break
+        r, c = divmod(u, S)
+        unsettled[r] -= 1
+        if cw_open[u]:
+            relax(u, r * S + (c + 1) % S, t)
+        if cw_open[r * S + (c - 1) % S]:
+            relax(u, r * S + (c - 1) % S, t)
+        if r == 1:
+            if in_open[u]:
+                relax(u, center, t)
+        elif r > 1 and in_open[u]:
+            wait(u, r, True, t)
+        if r < R - 1:
+            wait(u, r + 1, False, t)
+
+    if center not in arrival:
+        return INF, []
+    node_of = lambda i: maze.center_node if i == center else maze.grid[i // S][i % S]
+    plan = []
+    v = center
+    while came_from[v] is not None:
+        u, depart = came_from[v]
+        plan.append((depart, node_of(u), node_of(v)))
+        v = u
+    plan.reverse()
+    return arrival[center], plan
@@ -0,0 +1,98 @@
+import random
+import unittest
+from game_classes import Maze, GreedyAI, DIRECTIONS, move_cost
+from dynamic_maze import DynamicMaze
+
+
+def scan_neighbors(maze, node):
+    """Reference 8-direction neighbor scan (the pre-CSR get_neighbors)"""
+    result = []
+    for dr, dc in DIRECTIONS:
+        neighbor = maze.get_node(node.r + dr, node.c + dc)
+        if neighbor and neighbor.type != '#':
+            result.append(neighbor)
+    return result
+
+
+class TestAdjacencyIndex(unittest.TestCase):
+    """CSR neighbor index must track wall changes"""
+
+    def assert_index_matches(self, maze):
+        for r in range(maze.height):
+            for c in range(maze.width):
+                node = maze.get_node(r, c)
+                if node.type != '#':
+                    self.assertEqual(maze.get_neighbors(node), scan_neighbors(maze, node))
+
+    def test_index_matches_scan(self):
+        maze = Maze(width=15, height=15, seed=7)
+        self.assert_index_matches(maze)
+
+    def test_edge_costs(self):
+        maze = Maze(grid_layout="STP\n...")
+        costs = {(n.r, n.c): cost for n, cost in maze.get_edges(maze.start_node)}
+        self.assertEqual(costs[(0, 1)], 4)       # trap: 1 + 3
+        self.assertEqual(costs[(1, 1)], 1.414)   # diagonal
+        self.assertEqual(costs[(1, 0)], 1)
+
+    def test_move_cost_is_unclamped(self):
+        maze = Maze(grid_layout="STP\n..P")
+        start = maze.start_node
+        self.assertEqual(move_cost(start, maze.get_node(0, 1)), 4)
+        self.assertAlmostEqual(move_cost(start, maze.get_node(1, 1)), 1.414)
+        self.assertAlmostEqual(move_cost(maze.get_node(0, 1), maze.get_node(1, 2)), 1.414 - 2)
+
+    def test_type_change_bumps_version(self):
+        maze = Maze(width=15, height=15, seed=3)
+        version = maze.version
+        rng = random.Random(1)
+        for _ in range(20):
+            node = maze.get_node(rng.randrange(15), rng.randrange(15))
+            node.type = '.' if node.type == '#' else '#'
+        self.assertGreater(maze.version, version)
+        self.assert_index_matches(maze)
+        self.assertEqual(maze.csr_version, maze.version)
+
+    def test_type_codes_patched_in_place(self):
+        maze = Maze(width=15, height=15, seed=3)
+        codes = maze.type_codes()
+        rng = random.Random(2)
+        for _ in range(20):
+            node = maze.get_node(rng.randrange(15), rng.randrange(15))
+            node.type = '.' if node.type == '#' else '#'
+            self.assertIs(maze.type_codes(), codes) # Same buffer, no rebuild
+            self.assertEqual(bytes(codes), bytes(ord(n.type) for row in maze.grid for n in row))
+
+    def test_dynamic_maze_update(self):
+        maze = DynamicMaze(width=15, height=15, seed=11)
+        maze.queue_dynamic_event()
+        for _ in range(10):
+            maze.process_updates(0.5)
+        self.assert_index_matches(maze)
+        for node, edges in maze.adjacency_list.items():
+            self.assertNotEqual(node.type, '#')
+
+    def test_compact_mode(self):
+        maze = Maze(width=21, height=21, seed=5, compact=True)
+        maze.get_node(3, 3).type = '.'
+        maze.get_node(5, 6).type = '#'
+        self.assert_index_matches(maze)
+
+
+    def test_unstable_penalty_before_clamp(self):
+        maze = DynamicMaze(width=15, height=15, seed=6)
+        target = next(n for row in maze.grid[1:-1] for n in row[1:-1]
+                      if n.type == '.' and n not in (maze.start_node, maze.goal_node) and scan_neighbors(maze, n))
+        target.type = 'P'
+        maze.schedule_change(target, 'ADD_WALL', "Test", 1.0)
+        ai = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+        expand = ai.penalize_unstable(maze.edges, maze.node_at, maze.is_node_unstable)
+        for node in scan_neighbors(maze, target):
+            # Generic (pre-kernel) cost: raw step + powerup + warning penalty, then the clamp
+            diagonal = node.r != target.r and node.c != target.c
+            expected = max(0.1, (1.414 if diagonal else 1) - 2 + 50)
+            self.assertAlmostEqual(dict(expand(node.id))[target.id], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
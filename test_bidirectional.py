@@ -0,0 +1,85 @@
+import unittest
+from game_classes import Maze, GreedyAI
+from bidirectional_search import BidirectionalSearch
+from Bidirectional.bidirectional import BidirectionalAI
+
+
+def unidirectional_bfs(maze):
+    start, goal = maze.start_node.id, maze.goal_node.id
+    seen, frontier, dist = {start}, [start], 0
+    while frontier:
+        dist += 1
+        next_frontier = []
+        for i in frontier:
+            for j in maze.neighbor_ids(i):
+                if j == goal:
+                    return dist
+                if j not in seen:
+                    seen.add(j)
+                    next_frontier.append(j)
+        frontier = next_frontier
+    return float('inf')
+
+
+def path_cost(maze, path):
+    return sum(dict(maze.edges(a))[b] for a, b in zip(path, path[1:]))
+
+
+class TestBidirectionalSearch(unittest.TestCase):
+
+    def test_bfs_matches_unidirectional(self):
+        for seed in range(20):
+            maze = Maze(width=21, height=21, seed=seed)
+            self.assertEqual(maze.optimal_path_length, unidirectional_bfs(maze))
+
+    def test_dijkstra_matches_greedy_ai(self):
+        for seed in range(20):
+            maze = Maze(width=21, height=21, seed=seed)
+            dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+            expected = path_cost(maze, [maze.start_node.id] + [n.id for n in dijkstra.full_path])
+            for queue_type in ('heap', 'bucket'):
+                cost, path = BidirectionalSearch(maze, queue_type).a_star(maze.start_node.id, maze.goal_node.id,
+                                                                          heuristic=False)
+                self.assertAlmostEqual(cost, expected, places=6)
+                self.assertAlmostEqual(path_cost(maze, path), cost, places=6)
+
+    def test_a_star_exact_without_powerups(self):
+        for seed in range(20):
+            maze = Maze(width=21, height=21, seed=seed)
+            for row in maze.grid:
+                for node in row:
+                    if node.type == 'P':
+                        node.type = '.'
+            engine = BidirectionalSearch(maze)
+            exact, _ = engine.a_star(maze.start_node.id, maze.goal_node.id, heuristic=False)
+            self.assertAlmostEqual(maze.a_star_optimal(), exact, places=6)
+
+    def test_a_star_optimal_exact_with_powerups(self):
+        checked = 0
+        for seed in range(40):
+            maze = Maze(width=31, height=31, seed=seed)
+            if not any(node.type == 'P' for row in maze.grid for node in row):
+                continue
+            checked += 1
+            dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+            expected = path_cost(maze, [maze.start_node.id] + [n.id for n in dijkstra.full_path])
+            self.assertAlmostEqual(maze.a_star_optimal(), expected, places=6)
+        self.assertGreater(checked, 0)
+
+    def test_unreachable_goal(self):
+        maze = Maze(grid_layout="S#.\n##.\n..G")
+        self.assertEqual(maze.optimal_path_length, float('inf'))
+        self.assertEqual(maze.a_star_optimal(), 0)
+
+    def test_agent(self):
+        maze = Maze(width=25, height=25, seed=6)
+        for mode in ('a_star', 'bfs'):
+            ai = BidirectionalAI(maze.start_node, maze.goal_node, maze, mode=mode)
+            self.assertEqual(ai.full_path[-1], maze.goal_node)
+            self.assertGreater(ai.metrics.nodes_visited, 0)
+        bfs = BidirectionalAI(maze.start_node, maze.goal_node, maze, mode='bfs')
+        self.assertEqual(len(bfs.full_path), maze.optimal_path_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+from dynamic_maze import DynamicMaze
+from game_classes import GreedyAI
+from block_graph import BlockGraph
+from HPA.hpa import HPAStarAI
+
+
+def path_cost(maze, path):
+    cost, prev = 0, maze.start_node.id
+    for node in path:
+        cost += dict(maze.edges(prev))[node.id]
+        prev = node.id
+    return cost
+
+
+class TestBlockGraph(unittest.TestCase):
+    """HPA* paths must be valid grid paths, and repaired caches equal a fresh build"""
+
+    def test_hpa_paths_are_valid_and_near_optimal(self):
+        for seed in range(1, 6):
+            maze = DynamicMaze(width=41, height=41, seed=seed)
+            hpa = HPAStarAI(maze.start_node, maze.goal_node, maze)
+            dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+            self.assertEqual(hpa.finished, dijkstra.finished)
+            if dijkstra.finished:
+                continue
+            prev = maze.start_node
+            for node in hpa.full_path:
+                self.assertEqual(max(abs(node.r - prev.r), abs(node.c - prev.c)), 1)
+                self.assertNotEqual(node.type, '#')
+                prev = node
+            self.assertEqual(prev, maze.goal_node)
+            optimal = path_cost(maze, dijkstra.full_path)
+            self.assertGreaterEqual(path_cost(maze, hpa.full_path), optimal - 1e-9)
+            self.assertLessEqual(path_cost(maze, hpa.full_path), optimal * 1.05)
+
+    def test_updates_match_fresh_build(self):
+        rng = random.Random(4)
+        maze = DynamicMaze(width=31, height=31, seed=8)
+        graph = maze.build_block_graph()
+        for _ in range(25):
+            for _ in range(rng.randint(1, 3)):
+                node = maze.node_at(rng.randrange(maze.width * maze.height))
+                if node not in (maze.start_node, maze.goal_node):
+                    maze.schedule_change(node, 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL', "Test", 1.0)
+            maze.process_updates(10.0)
+            maze.process_updates(10.0)
+            self.assertIs(maze.build_block_graph(), graph)
+            fresh = BlockGraph(maze)
+            self.assertEqual(graph.pair_reps, fresh.pair_reps)
+            self.assertEqual(graph.entrances, fresh.entrances)
+            self.assertEqual({e: sorted(edges) for e, edges in graph.intra.items()},
+                             {e: sorted(edges) for e, edges in fresh.intra.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from game_classes import BucketQueue, PriorityQueue, Maze, GreedyAI, HierarchicalAI
+
+
+class TestBucketQueue(unittest.TestCase):
+    """Bucket frontier must pop in the same priority order as the heap"""
+
+    def test_pops_in_priority_order(self):
+        rng = random.Random(4)
+        bucket, heap = BucketQueue(), PriorityQueue()
+        popped = []
+        for step in range(2000):
+            if rng.random() < 0.6 or bucket.empty():
+                # Monotone pushes, like Dijkstra: never below the last popped priority
+                floor = popped[-1] if popped else 0
+                p = floor + rng.choice([0, 1, 1.414, 4, 4.414, 0.1])
+                bucket.put(p, p)
+                heap.put(p, p)
+            else:
+                popped.append(bucket.get())
+                self.assertAlmostEqual(popped[-1], heap.get())
+        # Order is exact at the queue's resolution (0.001)
+        keys = [round(p * 1000) for p in popped]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_ties_are_fifo(self):
+        q = BucketQueue()
+        for item in 'abc':
+            q.put(item, 2.5)
+        self.assertEqual([q.get(), q.get(), q.get()], ['a', 'b', 'c'])
+        self.assertTrue(q.empty())
+
+    def test_searches_match_heap(self):
+        maze = Maze(width=41, height=41, seed=12)
+        self.assertAlmostEqual(maze.a_star_optimal(queue_type='heap'),
+                               maze.a_star_optimal(queue_type='bucket'), places=3)
+        for algorithm in ('dijkstra', 'a_star'):
+            heap = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type=algorithm)
+            bucket = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type=algorithm, queue_type='bucket')
+            self.assertAlmostEqual(heap.solution_cost, bucket.solution_cost, places=3)
+        ai = HierarchicalAI(maze.start_node, maze.goal_node, maze, queue_type='bucket')
+        self.assertEqual(ai.full_path[-1], maze.goal_node)
+
+
+if __name__ == '__main__':
+    unittest.main()
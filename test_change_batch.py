@@ -0,0 +1,73 @@
+import unittest
+from dynamic_maze import DynamicMaze
+
+
+def open_cells(maze, count):
+    return [n for row in maze.grid for n in row
+            if n.type == '.' and n not in (maze.start_node, maze.goal_node)][:count]
+
+
+def run_until_quiet(maze, dt=0.05, limit=200):
+    """Frames with a structural update until nothing is pending"""
+    updates = []
+    for _ in range(limit):
+        if maze.process_updates(dt):
+            updates.append(list(maze.last_changed_nodes))
+        if not maze.pending_changes:
+            break
+    return updates
+
+
+class TestChangeBatch(unittest.TestCase):
+    """A burst of changes becomes one structural update (one replan)"""
+
+    def test_batch_applies_in_one_frame(self):
+        maze = DynamicMaze(width=21, height=21, seed=4)
+        cells = open_cells(maze, 4)
+        with maze.change_batch() as batch:
+            for node in cells:
+                maze.schedule_change(node, 'ADD_WALL', "Chaos Surge!", 1.0)
+        self.assertIsNone(maze.open_batch)
+        self.assertEqual({c['batch'] for c in maze.pending_changes}, {batch})
+        self.assertEqual(len({c['anim_duration'] for c in maze.pending_changes}), 1)
+
+        before = maze.blocks_rebuilt
+        updates = run_until_quiet(maze)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(set(updates[0]), set(cells))
+        self.assertEqual(maze.last_change_set['batches'], [batch])
+        self.assertEqual(set(maze.last_change_set['added_walls']), set(cells))
+        self.assertEqual(maze.last_change_set['removed_walls'], [])
+        blocks = {(n.r // maze.block_size, n.c // maze.block_size) for n in cells}
+        self.assertEqual(maze.blocks_rebuilt - before, len(blocks))
+
+    def test_nested_batches_join_outer(self):
+        maze = DynamicMaze(width=15, height=15, seed=2)
+        a, b = open_cells(maze, 2)
+        with maze.change_batch() as outer:
+            maze.schedule_change(a, 'ADD_WALL', "Test", 1.0)
+            with maze.change_batch() as inner:
+                maze.schedule_change(b, 'ADD_WALL', "Test", 1.0)
+        self.assertEqual(outer, inner)
+        self.assertEqual(len(run_until_quiet(maze)), 1)
+
+    def test_close_changes_coalesce(self):
+        maze = DynamicMaze(width=15, height=15, seed=3)
+        a, b = open_cells(maze, 2)
+        maze.schedule_change(a, 'ADD_WALL', "Test", 1.0)
+        maze.schedule_change(b, 'ADD_WALL', "Test", 1.0)
+        first, second = maze.pending_changes
+        first['anim_duration'], second['anim_duration'] = 0.6, 0.7
+        self.assertEqual(len(run_until_quiet(maze)), 1)
+
+        c, d = open_cells(maze, 2)
+        maze.coalesce_window = 0
+        maze.schedule_change(c, 'ADD_WALL', "Test", 1.0)
+        maze.schedule_change(d, 'ADD_WALL', "Test", 1.0)
+        first, second = maze.pending_changes
+        first['anim_duration'], second['anim_duration'] = 0.6, 0.7
+        self.assertEqual(len(run_until_quiet(maze)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from change_scheduler import ChangeScheduler
+from dynamic_maze import DynamicMaze
+
+
+class TestChangeScheduler(unittest.TestCase):
+    """Changes advance by absolute due time, in per-frame batches"""
+
+    def test_pop_due_in_order(self):
+        scheduler = ChangeScheduler()
+        for due, name in ((2.0, 'b'), (1.0, 'a'), (2.0, 'c'), (5.0, 'd')):
+            scheduler.push(due, name)
+        self.assertEqual(scheduler.pop_due(0.5), [])
+        self.assertEqual(scheduler.pop_due(2.0), ['a', 'b', 'c'])
+        self.assertEqual(scheduler.next_due(), 5.0)
+        self.assertEqual(len(scheduler), 1)
+
+    def test_phases_are_delivered_as_batches(self):
+        maze = DynamicMaze(width=15, height=15, seed=6)
+        cells = [n for row in maze.grid for n in row if n.type == '.'][:3]
+        for node in cells:
+            maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        change = maze.pending_changes[0]
+
+        self.assertFalse(maze.process_updates(0.4))
+        self.assertAlmostEqual(maze.remaining_time(change), 0.6)
+        self.assertEqual(maze.last_transitions, {'ANIMATING': [], 'APPLIED': []})
+
+        self.assertFalse(maze.process_updates(0.6))
+        self.assertEqual(len(maze.last_transitions['ANIMATING']), 3)
+        self.assertAlmostEqual(maze.remaining_time(change), change['anim_duration'])
+
+        self.assertTrue(maze.process_updates(1.5))
+        self.assertEqual([c['node'] for c in maze.last_transitions['APPLIED']], cells)
+        self.assertEqual(set(maze.last_changed_nodes), set(cells))
+        self.assertEqual(maze.pending_changes, [])
+        self.assertEqual(len(maze.scheduler), 0)
+        self.assertEqual(len(maze.recent_edge_changes), 3)
+
+        maze.process_updates(1.0)
+        self.assertEqual(maze.recent_edge_changes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
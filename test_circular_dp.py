@@ -0,0 +1,118 @@
+import random
+import unittest
+from circular_maze import CircularMaze, np
+
+ENGINES = ['python'] + (['numpy'] if np is not None else [])
+
+
+def reference_dp(maze, T=15):
+    """The original dict-keyed backward induction over get_weighted_neighbors"""
+    values = {}
+    for t in range(T + 1):
+        for s in range(maze.sectors_per_ring):
+            values[(t, 0, s)] = 0
+    for r in range(1, maze.num_rings):
+        for s in range(maze.sectors_per_ring):
+            values[(T, r, s)] = r * 2
+    for t in range(T - 1, -1, -1):
+        for r in range(1, maze.num_rings):
+            for s in range(maze.sectors_per_ring):
+                best = 1 + values[(t + 1, r, s)]
+                for neigh, cost in maze.get_weighted_neighbors(maze.grid[r][s], future_time=t * 1.0):
+                    best = min(best, cost + values[(t + 1, neigh.r, neigh.c)])
+                values[(t, r, s)] = best
+    return [[values[(0, r, s)] for s in range(maze.sectors_per_ring)] for r in range(maze.num_rings)]
+
+
+def dp_costs(maze):
+    return [[node.dp_cost for node in row] for row in maze.grid]
+
+
+class TestCircularDP(unittest.TestCase):
+    """Cached, layer-reusing run_dp must equal the plain time-expanded DP"""
+
+    def test_matches_reference_while_rotating(self):
+        for engine in ENGINES:
+            for seed, (rings, sectors) in enumerate(((4, 12), (6, 24), (9, 16), (2, 8))):
+                random.seed(seed)
+                maze = CircularMaze(num_rings=rings, sectors=sectors)
+                maze.dp_engine = engine
+                rng = random.Random(seed)
+                for _ in range(40):
+                    maze.update(rng.uniform(0.0, 0.7))
+                    maze.run_dp()
+                    self.assertEqual(dp_costs(maze), reference_dp(maze), engine)
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_engines_agree_on_large_maze(self):
+        random.seed(5)
+        maze = CircularMaze(num_rings=30, sectors=64)
+        results = []
+        for engine in ('python', 'numpy'):
+            maze.dp_engine = engine
+            maze.run_dp()
+            results.append(dp_costs(maze))
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(all(type(v) is int for row in results[1] for v in row))
+
+    def test_periodic_phases_reuse_layers(self):
+        random.seed(3)
+        maze = CircularMaze(num_rings=4, sectors=12)
+        maze.run_dp()
+        first = maze.dp_layers_computed
+        self.assertLessEqual(first, maze.DP_HORIZON)
+        for _ in range(60): # One second at 60 fps
+            maze.update(1 / 60)
+            maze.run_dp()
+        # Only layers whose shifts crossed an alignment boundary were recomputed
+        self.assertLess(maze.dp_layers_computed - first, 60)
+        self.assertEqual(dp_costs(maze), reference_dp(maze))
+
+
+class TestWallBuffers(unittest.TestCase):
+    """Walls live in two flat bytearrays; node.walls is a view onto them"""
+
+    def test_node_walls_view(self):
+        random.seed(5)
+        maze = CircularMaze(num_rings=4, sectors=8)
+        node = maze.grid[2][3]
+        self.assertEqual(node.walls['cw'], maze.cw_walls[node.id] == 1)
+        node.walls['in'] = False
+        self.assertEqual(maze.in_walls[node.id], 0)
+        node.walls['in'] = True
+        self.assertTrue(node.walls['in'])
+        with self.assertRaises(KeyError):
+            node.walls['out']
+
+    def test_generation_is_seeded_and_connected(self):
+        for seed in range(5):
+            random.seed(seed)
+            first = CircularMaze(num_rings=6, sectors=16)
+            random.seed(seed)
+            second = CircularMaze(num_rings=6, sectors=16)
+            self.assertEqual(first.cw_walls, second.cw_walls)
+            self.assertEqual(first.in_walls, second.in_walls)
+            # Every ring cell is reachable through the carved passages (rings unrotated)
+            S = first.sectors_per_ring
+            seen, stack = {S}, [S]
+            while stack:
+                r, c = divmod(stack.pop(), S)
+                steps = []
+                if not first.cw_walls[r * S + c]:
+                    steps.append(r * S + (c + 1) % S)
+                if not first.cw_walls[r * S + (c - 1) % S]:
+                    steps.append(r * S + (c - 1) % S)
+                if r > 1 and not first.in_walls[r * S + c]:
+                    steps.append((r - 1) * S + c)
+                if r < first.num_rings - 1 and not first.in_walls[(r + 1) * S + c]:
+                    steps.append((r + 1) * S + c)
+                for v in steps:
+                    if v not in seen:
+                        seen.add(v)
+                        stack.append(v)
+            self.assertEqual(len(seen), (first.num_rings - 1) * S)
+            self.assertTrue(any(not first.in_walls[S + c] for c in range(S))) # A way into the center
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import math
+import random
+import unittest
+from circular_maze import CircularMaze
+
+
+def old_screen_pos(maze, node, screen_size):
+    """get_screen_pos before the geometry cache (trig from scratch every call)"""
+    w, h = screen_size
+    cx, cy = w // 2, h // 2 + 30
+    ring_step = (min(w, h) // 2 - 50) // (maze.num_rings + 0.5)
+    angle_step = 360 / maze.sectors_per_ring
+    deg = -90 + (node.c * angle_step) + (maze.offsets[node.r] * angle_step) + (angle_step / 2)
+    dist = (node.r * ring_step) + (ring_step / 2)
+    return int(cx + math.cos(math.radians(deg)) * dist), int(cy + math.sin(math.radians(deg)) * dist)
+
+
+class TestPolarGeometry(unittest.TestCase):
+    """Screen geometry is computed once per window size and matches the per-frame trig"""
+
+    def setUp(self):
+        random.seed(3)
+        self.maze = CircularMaze(num_rings=5, sectors=12)
+
+    def test_cached_per_window_size(self):
+        geo = self.maze.screen_geometry((1000, 720))
+        self.assertIs(self.maze.screen_geometry((1000, 720)), geo)
+        self.assertIsNot(self.maze.screen_geometry((800, 600)), geo)
+        self.assertEqual(self.maze.screen_geometry((800, 600)).size, (800, 600))
+
+    def test_screen_pos_matches_rotating_rings(self):
+        for dt in (0.0, 1.7, 13.25, 250.0):
+            self.maze.update(dt)
+            for size in ((1000, 720), (640, 900)):
+                for row in self.maze.grid:
+                    for node in row:
+                        self.assertEqual(self.maze.get_screen_pos(node, size), old_screen_pos(self.maze, node, size))
+
+    def test_sector_outline_and_walls(self):
+        geo = self.maze.screen_geometry((1000, 720))
+        angle_step = 360 / 12
+        origin = (7, 9)
+        pt = lambda deg, radius: (7 + math.cos(math.radians(deg)) * radius, 9 + math.sin(math.radians(deg)) * radius)
+        s, inner, outer = 4, 30, 55
+        start = -90 + s * angle_step
+        expected = [pt(start + (i / 10) * angle_step, outer) for i in range(11)]
+        expected += [pt(start + (i / 10) * angle_step, inner) for i in range(10, -1, -1)]
+        for got, want in zip(geo.band(s, inner, outer, origin), expected):
+            self.assertAlmostEqual(got[0], want[0])
+            self.assertAlmostEqual(got[1], want[1])
+        a, b = geo.spoke(s, inner, outer, origin)
+        self.assertAlmostEqual(a[0], pt(start + angle_step, inner)[0])
+        self.assertAlmostEqual(b[1], pt(start + angle_step, outer)[1])
+
+    def test_wall_writes_bump_version(self):
+        version = self.maze.walls_version
+        self.maze.grid[2][5].walls['cw'] = False
+        self.assertGreater(self.maze.walls_version, version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from game_classes import Maze, CellNode
+
+
+class TestCompactMaze(unittest.TestCase):
+    """Compact (buffer-backed) mazes must behave like the Node grid version"""
+
+    def test_same_maze_for_same_seed(self):
+        for seed in (1, 42, 12345):
+            regular = Maze(width=21, height=21, seed=seed)
+            compact = Maze(width=21, height=21, seed=seed, compact=True)
+            for r in range(21):
+                for c in range(21):
+                    self.assertEqual(regular.get_node(r, c).type, compact.get_node(r, c).type)
+            self.assertEqual(regular.optimal_path_length, compact.optimal_path_length)
+            self.assertAlmostEqual(regular.a_star_optimal(), compact.a_star_optimal(), places=3)
+
+    def test_neighbors_match(self):
+        layout = "S.T\n#P.\n..G"
+        regular = Maze(grid_layout=layout)
+        compact = Maze(grid_layout=layout, compact=True)
+        for node in regular.adjacency_list:
+            view = compact.get_node(node.r, node.c)
+            self.assertEqual(regular.get_neighbors(node), compact.get_neighbors(view))
+            self.assertEqual(regular.adjacency_list[node], compact.adjacency_list[view])
+        self.assertNotIn(compact.get_node(1, 0), compact.adjacency_list)
+
+    def test_nodes_are_lazy_views(self):
+        maze = Maze(width=51, height=51, seed=3, compact=True)
+        self.assertLess(len(maze._node_cache), 10)
+
+        node = maze.get_node(1, 1)
+        self.assertIsInstance(node, CellNode)
+        self.assertIs(node, maze.grid[1][1])
+
+        # Writes through the view land in the buffers
+        node.type = '#'
+        node.cost = float('inf')
+        self.assertEqual(maze.cell_types[node.id], ord('#'))
+        self.assertNotIn(node, maze.get_neighbors(maze.start_node))
+
+    def test_node_ids(self):
+        maze = Maze(width=11, height=9, seed=4)
+        node = maze.get_node(3, 7)
+        self.assertEqual(node.id, 3 * 11 + 7)
+        self.assertIs(maze.node_at(node.id), node)
+        self.assertEqual(hash(node), hash(maze.get_node(3, 7)))
+        self.assertFalse(hasattr(node, '__dict__'))
+
+    def test_large_maze_loads(self):
+        maze = Maze(width=301, height=301, seed=9, compact=True)
+        self.assertLess(maze.optimal_path_length, float('inf'))
+        self.assertGreater(maze.a_star_optimal(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
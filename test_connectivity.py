@@ -0,0 +1,64 @@
+import random
+import unittest
+from dynamic_maze import DynamicMaze
+from game_classes import Maze, GreedyAI
+from connectivity import ConnectivityOracle
+
+
+def components(oracle):
+    groups = {}
+    for i, e in oracle.label.items():
+        groups.setdefault(oracle.find(e), set()).add(i)
+    for root, cells in groups.items():
+        assert oracle.size[root] == len(cells)
+    return {frozenset(cells) for cells in groups.values()}
+
+
+class TestConnectivityOracle(unittest.TestCase):
+    """Maintained components must equal a fresh flood fill after every change"""
+
+    def test_dynamic_maze_updates(self):
+        for seed in range(1, 4):
+            rng = random.Random(seed)
+            maze = DynamicMaze(width=21, height=21, seed=seed)
+            for _ in range(60):
+                for _ in range(rng.randint(1, 4)):
+                    node = maze.node_at(rng.randrange(maze.width * maze.height))
+                    if node not in (maze.start_node, maze.goal_node):
+                        kind = 'ADD_WALL' if rng.random() < 0.6 else 'REMOVE_WALL'
+                        maze.schedule_change(node, kind, "Test", 1.0)
+                maze.process_updates(10.0)
+                maze.process_updates(10.0)
+                self.assertTrue(maze.connectivity.is_current())
+                self.assertEqual(components(maze.connectivity), components(ConnectivityOracle(maze)))
+
+    def test_updates_without_block_information(self):
+        rng = random.Random(7)
+        maze = Maze(width=15, height=15, seed=7)
+        oracle = ConnectivityOracle(maze)
+        for _ in range(100):
+            node = maze.node_at(rng.randrange(maze.width * maze.height))
+            if node in (maze.start_node, maze.goal_node):
+                continue
+            node.type = '.' if node.type == '#' else '#'
+            oracle.update(node)
+            self.assertEqual(components(oracle), components(ConnectivityOracle(maze)))
+
+    def test_walled_off_goal_skips_search(self):
+        maze = DynamicMaze(grid_layout="S.#..\n..#.G")
+        self.assertFalse(maze.is_goal_reachable())
+        self.assertEqual(maze.connectivity.component_size(maze.start_node), 4)
+        ai = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='a_star')
+        self.assertTrue(ai.finished)
+        self.assertEqual(ai.metrics.nodes_visited, 0)
+
+        gate = maze.grid[0][2]
+        maze.schedule_change(gate, 'REMOVE_WALL', "Test", 1.0)
+        maze.process_updates(10.0)
+        maze.process_updates(10.0)
+        self.assertTrue(maze.is_goal_reachable())
+        self.assertEqual(maze.connectivity.component_size(maze.goal_node), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
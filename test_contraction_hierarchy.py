@@ -0,0 +1,61 @@
+import random
+import unittest
+from game_classes import Maze
+from landmarks import Landmarks
+from ContractionHierarchy.ch import ContractionHierarchyAI
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    """CH queries must be exact and unpack into real grid steps"""
+
+    def setUp(self):
+        self.maze = Maze(width=25, height=25, seed=14)
+        self.ch = self.maze.build_contraction_hierarchy()
+        # Zero landmarks: just the plain Dijkstra helper
+        self.dijkstra = Landmarks(self.maze, k=0).dijkstra
+
+    def test_queries_are_exact(self):
+        cells = [i for i in range(25 * 25) if self.maze.cell_code(i) != ord('#')]
+        rng = random.Random(5)
+        for _ in range(100):
+            s, t = rng.choice(cells), rng.choice(cells)
+            cost, path = self.ch.query_ids(s, t)
+            self.assertAlmostEqual(cost, self.dijkstra(s, self.maze.edges)[t], places=6)
+            self.assertEqual((path[0], path[-1]), (s, t))
+            steps = sum(dict(self.maze.edges(a))[b] for a, b in zip(path, path[1:]))
+            self.assertAlmostEqual(steps, cost, places=6)
+
+    def test_batch_returns_nodes(self):
+        maze = self.maze
+        results = self.ch.query_many([(maze.start_node, maze.goal_node), (maze.goal_node, maze.start_node)])
+        self.assertEqual(len(results), 2)
+        cost, path = results[0]
+        self.assertIs(path[0], maze.start_node)
+        self.assertIs(path[-1], maze.goal_node)
+
+    def test_rebuilt_only_when_maze_changes(self):
+        self.assertIs(self.maze.build_contraction_hierarchy(), self.ch)
+        next(n for row in self.maze.grid for n in row if n.type == '.').type = '#'
+        self.assertIsNot(self.maze.build_contraction_hierarchy(), self.ch)
+
+    def test_agent(self):
+        maze = self.maze
+        ai = ContractionHierarchyAI(maze.start_node, maze.goal_node, maze)
+        self.assertEqual(ai.full_path[-1], maze.goal_node)
+        self.assertLess(ai.metrics.nodes_visited, maze.get_total_walkable_nodes())
+
+
+    def test_agent_runs_one_query_per_plan(self):
+        maze = self.maze
+        calls = []
+        distance = self.ch.distance
+        self.ch.distance = lambda s, t: calls.append((s, t)) or distance(s, t)
+        ai = ContractionHierarchyAI(maze.start_node, maze.goal_node, maze)
+        self.assertEqual(len(calls), 1)
+        cost, _ = self.ch.query(maze.start_node, maze.goal_node)
+        self.assertAlmostEqual(sum(dict(maze.edges(a.id))[b.id] for a, b in zip([maze.start_node] + ai.full_path, ai.full_path)),
+                               cost, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
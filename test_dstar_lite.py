@@ -0,0 +1,83 @@
+import random
+import unittest
+from dynamic_maze import DynamicMaze
+from game_classes import GreedyAI
+from DStarLite.dstar_lite import DStarLiteAI
+
+
+def path_cost(maze, start, path):
+    cost, prev = 0, start.id
+    for node in path:
+        cost += dict(maze.edges(prev))[node.id]
+        prev = node.id
+    return cost
+
+
+def apply_random_changes(maze, rng, ai, count):
+    for _ in range(count):
+        node = maze.node_at(rng.randrange(maze.width * maze.height))
+        if node in (maze.start_node, maze.goal_node, ai.current_node):
+            continue
+        maze.schedule_change(node, 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL', "Test", 1.0)
+    maze.process_updates(10.0) # WARNING -> ANIMATING
+    maze.process_updates(10.0) # applied
+
+
+class TestDStarLite(unittest.TestCase):
+    """Repaired plans must stay optimal and cost less than replanning from scratch"""
+
+    def test_initial_plan_is_optimal(self):
+        maze = DynamicMaze(width=25, height=25, seed=4)
+        ai = DStarLiteAI(maze.start_node, maze.goal_node, maze)
+        dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+        self.assertEqual(ai.full_path[-1], maze.goal_node)
+        self.assertAlmostEqual(path_cost(maze, maze.start_node, ai.full_path),
+                               path_cost(maze, maze.start_node, dijkstra.full_path))
+
+    def test_process_updates_reports_changed_nodes(self):
+        maze = DynamicMaze(width=15, height=15, seed=2)
+        node = next(n for n in maze.grid[7] if n.type == '.')
+        maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        maze.process_updates(10.0)
+        self.assertEqual(maze.last_changed_nodes, [])
+        self.assertTrue(maze.process_updates(10.0))
+        self.assertEqual(maze.last_changed_nodes, [node])
+
+    def test_repair_matches_fresh_search(self):
+        rng = random.Random(1)
+        maze = DynamicMaze(width=25, height=25, seed=9)
+        ai = DStarLiteAI(maze.start_node, maze.goal_node, maze)
+        repaired = scratch = 0
+        for _ in range(15):
+            if ai.finished:
+                break
+            ai.choose_move(maze)
+            apply_random_changes(maze, rng, ai, 3)
+            ai.notify_changes(maze.last_changed_nodes)
+
+            fresh = DStarLiteAI(ai.current_node, maze.goal_node, maze)
+            self.assertEqual(ai.finished, fresh.finished)
+            if not fresh.finished:
+                self.assertAlmostEqual(path_cost(maze, ai.current_node, ai.full_path),
+                                       path_cost(maze, ai.current_node, fresh.full_path))
+            repaired += ai.replan_log[-1]['expansions']
+            scratch += fresh.replan_log[0]['expansions']
+        self.assertLess(repaired, scratch)
+
+
+    def test_warning_cells_are_penalized_like_greedy(self):
+        maze = DynamicMaze(width=25, height=25, seed=4)
+        ai = DStarLiteAI(maze.start_node, maze.goal_node, maze)
+        # Put the middle of the current plan into its WARNING phase, then replan on any change
+        for node in ai.full_path[len(ai.full_path) // 3: len(ai.full_path) // 3 + 3]:
+            maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        ai.notify_changes([])
+        dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+        penalized = GreedyAI.penalize_unstable(maze.edges, maze.node_at, maze.is_node_unstable)
+        cost = lambda path: sum(dict(penalized(a.id))[b.id] for a, b in zip([maze.start_node] + path, path))
+        self.assertAlmostEqual(cost(ai.full_path), cost(dijkstra.full_path))
+        self.assertEqual(ai.replan_log[-1]['changed'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from dynamic_maze import DynamicMaze
+from dynamic_simulator import DynamicSimulator, percentile
+from AStar.astar import AStarAI
+from DStarLite.dstar_lite import DStarLiteAI
+
+
+class TestDynamicSimulator(unittest.TestCase):
+    """Headless runs must be fast, repeatable and measure what the agents do"""
+
+    def run_sim(self, agent_class, events=60):
+        maze = DynamicMaze(width=21, height=21, seed=3)
+        sim = DynamicSimulator(maze, agent_class, event_interval=(0.5, 1.0), seed=3)
+        return sim.run(events=events)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 95), 0)
+
+    def test_runs_in_simulated_time(self):
+        report = self.run_sim(AStarAI)
+        self.assertEqual(report['events'], 60)
+        self.assertGreater(report['sim_time'], 30) # At least 0.5 s between events
+        self.assertGreater(report['replans'], 0)
+        latency = report['latency_ms']
+        self.assertLessEqual(latency[50], latency[95])
+        self.assertLessEqual(latency[95], latency[99])
+
+    def test_repeatable_with_a_seed(self):
+        first, second = self.run_sim(AStarAI), self.run_sim(AStarAI)
+        for key in ('sim_time', 'changes', 'replans', 'failed_replans', 'arrivals', 'expanded', 'cost_drift'):
+            self.assertEqual(first[key], second[key])
+
+    def test_d_star_lite_plans_stay_optimal(self):
+        report = self.run_sim(DStarLiteAI)
+        self.assertAlmostEqual(report['cost_drift']['max'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
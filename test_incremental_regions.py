@@ -0,0 +1,52 @@
+import random
+import unittest
+from collections import Counter
+from dynamic_maze import DynamicMaze
+from region_logic import RegionLogic
+
+
+def incremental_state(maze):
+    parts = {rid: frozenset(n.id for n in nodes) for rid, nodes in maze.region_list_map.items()}
+    links = {frozenset((parts[a], parts[b])) for a, others in maze.region_connectivity.items() for b in others}
+    return ({frozenset(b) for b in maze.bccs.values()}, {n.id for n in maze.articulation_points},
+            set(parts.values()), links)
+
+
+def full_state(maze):
+    blocks = {frozenset(b) for b in RegionLogic.compute_biconnected_components(maze)}
+    counts = Counter(i for block in blocks for i in block)
+    aps = {i for i, count in counts.items() if count > 1}
+    _, graph, by_id = RegionLogic.compute_regions(maze, {maze.node_at(i) for i in aps})
+    parts = {rid: frozenset(n.id for n in nodes) for rid, nodes in by_id.items()}
+    links = {frozenset((parts[a], parts[b])) for a, others in graph.items() for b in others}
+    return blocks, aps, set(parts.values()), links
+
+
+class TestIncrementalRegions(unittest.TestCase):
+    """Blocks, APs and regions patched after each change must equal a full recomputation"""
+
+    def test_blocks_of_a_cycle_with_a_tail(self):
+        maze = DynamicMaze(grid_layout="S.#\n.##\n#.G")
+        blocks = RegionLogic.compute_biconnected_components(maze)
+        self.assertEqual(sorted(map(sorted, blocks)), [[0, 1, 3], [3, 7], [7, 8]])
+        self.assertEqual({n.id for n in maze.articulation_points}, {3, 7})
+
+    def test_random_changes_match_full_recompute(self):
+        for seed in range(1, 4):
+            rng = random.Random(seed)
+            maze = DynamicMaze(width=21, height=21, seed=seed)
+            for _ in range(40):
+                for _ in range(rng.randint(1, 4)):
+                    node = maze.node_at(rng.randrange(maze.width * maze.height))
+                    if node in (maze.start_node, maze.goal_node):
+                        continue
+                    maze.schedule_change(node, 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL', "Test", 1.0)
+                maze.process_updates(10.0)
+                maze.process_updates(10.0)
+                self.assertEqual(incremental_state(maze), full_state(maze))
+                for rid, nodes in maze.region_list_map.items():
+                    self.assertTrue(all(maze.regions[n] == rid for n in nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
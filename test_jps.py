@@ -0,0 +1,76 @@
+import unittest
+from game_classes import Maze, GreedyAI
+from JPS.jps import JPSAI
+from circular_maze import CircularMaze
+from dynamic_maze import DynamicMaze
+
+
+class ExactJPS(JPSAI):
+    """Zero heuristic: JPS must then return a Dijkstra-optimal path"""
+    def heuristic(self, node):
+        return 0
+
+
+def search_cost(maze, path):
+    """Clamped search cost of a path (CSR edge costs)"""
+    cost, prev = 0, maze.start_node.id
+    for node in path:
+        cost += dict(maze.edges(prev))[node.id]
+        prev = node.id
+    return cost
+
+
+class TestJumpPointSearch(unittest.TestCase):
+
+    def test_matches_dijkstra_with_traps_and_powerups(self):
+        for seed in range(15):
+            maze = Maze(width=21, height=21, seed=seed)
+            dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+            for plus in (False, True):
+                jps = ExactJPS(maze.start_node, maze.goal_node, maze, plus=plus)
+                self.assertAlmostEqual(search_cost(maze, jps.full_path),
+                                       search_cost(maze, dijkstra.full_path), places=6)
+
+    def test_path_is_stepwise(self):
+        maze = Maze(width=31, height=25, seed=8)
+        jps = JPSAI(maze.start_node, maze.goal_node, maze)
+        prev = maze.start_node
+        for node in jps.full_path:
+            self.assertLessEqual(max(abs(node.r - prev.r), abs(node.c - prev.c)), 1)
+            self.assertNotEqual(node.type, '#')
+            prev = node
+        self.assertEqual(prev, maze.goal_node)
+
+    def test_powerup_detour(self):
+        # Straight run costs 4; stepping through the powerups is cheaper
+        layout = "S...G\n.PPP."
+        maze = Maze(grid_layout=layout)
+        jps = ExactJPS(maze.start_node, maze.goal_node, maze)
+        self.assertIn(maze.get_node(1, 2), jps.full_path)
+
+    def test_fewer_expansions_than_a_star(self):
+        layout = "\n".join(["S" + "." * 39] + ["." * 40] * 38 + ["." * 39 + "G"])
+        maze = Maze(grid_layout=layout)
+        a_star = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='a_star')
+        jps = JPSAI(maze.start_node, maze.goal_node, maze)
+        self.assertLess(jps.metrics.nodes_visited * 10, a_star.metrics.nodes_visited)
+
+    def test_unstable_cells_come_from_the_pending_index(self):
+        maze = DynamicMaze(width=15, height=15, seed=6)
+        ai = JPSAI(maze.start_node, maze.goal_node, maze)
+        self.assertEqual(ai.unstable_cells(), [])
+        targets = [n for n in maze.grid[7] if n.type == '.'][:3]
+        for node in targets:
+            maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        wall = next(n for n in maze.grid[7] if n.type == '#')
+        maze.schedule_change(wall, 'REMOVE_WALL', "Test", 1.0) # Opening up is not a hazard
+        self.assertEqual(ai.unstable_cells(), sorted(n.id for n in targets))
+
+    def test_circular_maze_falls_back_to_a_star(self):
+        maze = CircularMaze(num_rings=4, sectors=12)
+        jps = JPSAI(maze.start_node, maze.goal_node, maze)
+        self.assertEqual(jps.full_path[-1], maze.goal_node)
+
+
+if __name__ == '__main__':
+    unittest.main()
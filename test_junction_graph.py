@@ -0,0 +1,59 @@
+import unittest
+from game_classes import Maze, GreedyAI
+from junction_graph import JunctionGraph
+from Corridor.corridor import CorridorAI
+
+
+def path_cost(maze, path):
+    cost, prev = 0, maze.start_node.id
+    for node in path:
+        cost += dict(maze.edges(prev))[node.id]
+        prev = node.id
+    return cost
+
+
+class TestJunctionGraph(unittest.TestCase):
+    """Searches on the contracted graph must expand back to valid grid paths"""
+
+    def test_corridor_collapses(self):
+        maze = Maze(grid_layout="S....G\n######")
+        graph = JunctionGraph(maze)
+        self.assertEqual(graph.junctions, {maze.start_node.id, maze.goal_node.id})
+        (goal, cost, length, cells), = graph.edges[maze.start_node.id]
+        self.assertEqual((goal, length, len(cells)), (maze.goal_node.id, 5, 4))
+
+    def test_corners_and_stubs_do_not_stop_a_corridor(self):
+        # Cells 1 and 11 are corners the diagonals cut past, cell 2 is a dead-end stub:
+        # none is on a shortest path, so the corridor still collapses into one edge
+        maze = Maze(grid_layout="S..#\n#.##\n##..\n###G")
+        graph = JunctionGraph(maze)
+        self.assertEqual(graph.junctions, {maze.start_node.id, maze.goal_node.id})
+        (goal, cost, length, cells), = graph.edges[maze.start_node.id]
+        self.assertEqual((goal, length, cells), (maze.goal_node.id, 3, (5, 10)))
+        self.assertEqual(graph.stats()['bypassed'], 3)
+
+    def test_all_searches_expand_to_grid_paths(self):
+        for seed in range(10):
+            maze = Maze(width=21, height=21, seed=seed)
+            dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+            for search in ('bfs', 'dfs', 'dijkstra', 'a_star', 'best_first'):
+                ai = CorridorAI(maze.start_node, maze.goal_node, maze, search)
+                prev = maze.start_node
+                for node in ai.full_path:
+                    self.assertEqual(max(abs(node.r - prev.r), abs(node.c - prev.c)), 1)
+                    prev = node
+                self.assertEqual(prev, maze.goal_node)
+                if search == 'bfs':
+                    self.assertEqual(len(ai.full_path), maze.optimal_path_length)
+                if search == 'dijkstra':
+                    self.assertAlmostEqual(path_cost(maze, ai.full_path), path_cost(maze, dijkstra.full_path))
+
+    def test_stats_report_contraction(self):
+        maze = Maze(width=31, height=31, seed=2)
+        stats = maze.build_junction_graph().stats()
+        self.assertLess(stats['nodes_after'], stats['nodes_before'])
+        self.assertEqual(stats['nodes_before'], maze.get_total_walkable_nodes())
+
+
+if __name__ == '__main__':
+    unittest.main()
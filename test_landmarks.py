@@ -0,0 +1,60 @@
+import random
+import unittest
+from game_classes import Maze, GreedyAI, HierarchicalAI
+
+
+class TestLandmarks(unittest.TestCase):
+    """ALT heuristic must be admissible and cut A* expansions"""
+
+    def setUp(self):
+        self.maze = Maze(width=31, height=31, seed=21)
+        self.landmarks = self.maze.build_landmarks(k=6)
+
+    def test_admissible(self):
+        rng = random.Random(2)
+        cells = [i for i in range(31 * 31) if self.maze.cell_code(i) != ord('#')]
+        for _ in range(10):
+            t = rng.choice(cells)
+            exact = self.landmarks.dijkstra(t, self.maze.reverse_edges) # d(v, t) for every v
+            for v in rng.sample(cells, 50):
+                self.assertLessEqual(self.landmarks.estimate(v, t), exact[v] + 1e-9)
+
+    def test_a_star_stays_optimal_with_fewer_expansions(self):
+        maze = self.maze
+        dijkstra = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='dijkstra')
+        euclidean = GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='a_star')
+        alt = GreedyAI(maze.start_node, maze.goal_node, maze, heuristic_type='landmarks', algorithm_type='a_star')
+        self.assertAlmostEqual(alt.solution_cost, dijkstra.solution_cost, places=6)
+        self.assertLess(alt.metrics.nodes_visited, euclidean.metrics.nodes_visited)
+
+    def test_bidirectional_reference_is_exact_and_pruned(self):
+        from bidirectional_search import BidirectionalSearch
+        maze = self.maze
+        self.assertTrue(any(node.type == 'P' for row in maze.grid for node in row))
+        engine = BidirectionalSearch(maze)
+        exact, _ = engine.a_star(maze.start_node.id, maze.goal_node.id, heuristic=False)
+        plain = engine.visited
+        cost, path = engine.a_star(maze.start_node.id, maze.goal_node.id, landmarks=self.landmarks)
+        self.assertAlmostEqual(cost, exact, places=6)
+        self.assertEqual((path[0], path[-1]), (maze.start_node.id, maze.goal_node.id))
+        self.assertLess(engine.visited, plain)
+        self.assertAlmostEqual(maze.a_star_optimal(), exact, places=6)
+
+    def test_hierarchical_segments_use_landmarks(self):
+        maze = self.maze
+        ai = HierarchicalAI(maze.start_node, maze.goal_node, maze)
+        self.assertEqual(ai.full_path[-1], maze.goal_node)
+
+    def test_stale_after_wall_change(self):
+        node = next(n for row in self.maze.grid for n in row if n.type == '.')
+        node.type = '#'
+        self.assertFalse(self.landmarks.is_current())
+        # Falls back to the Euclidean estimate
+        goal = self.maze.goal_node
+        start = self.maze.start_node
+        expected = ((start.r - goal.r)**2 + (start.c - goal.c)**2) ** 0.5
+        self.assertAlmostEqual(self.maze.heuristic(start, 'landmarks'), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from dynamic_maze import DynamicMaze
+from maze_history import MazeHistory, pack_walls, unpack_walls
+from test_incremental_regions import incremental_state, full_state
+
+
+def churn(maze, rng, rounds):
+    """Random wall flips through the normal change pipeline; returns (revision, codes) per round"""
+    states = [(maze.revision, bytes(maze.type_codes()))]
+    for _ in range(rounds):
+        for _ in range(rng.randint(1, 4)):
+            node = maze.node_at(rng.randrange(maze.width * maze.height))
+            if node in (maze.start_node, maze.goal_node):
+                continue
+            maze.schedule_change(node, 'REMOVE_WALL' if node.type == '#' else 'ADD_WALL', "Test", 1.0)
+        maze.process_updates(10.0)
+        maze.process_updates(10.0)
+        states.append((maze.revision, bytes(maze.type_codes())))
+    return states
+
+
+class TestMazeHistory(unittest.TestCase):
+    """Past maze states come back from the log and snapshots, not from re-simulation"""
+
+    def test_wall_mask_round_trip(self):
+        codes = bytes(random.Random(1).choice(b'.#T') for _ in range(77))
+        flags = unpack_walls(pack_walls(codes), len(codes))
+        self.assertEqual(len(pack_walls(codes)), 10)
+        self.assertEqual(flags, bytes(1 if b == ord('#') else 0 for b in codes))
+
+    def test_codes_at_every_revision(self):
+        base = bytearray(b'..#T..##.')
+        history = MazeHistory(base, snapshot_every=4)
+        states = [bytes(base)]
+        rng = random.Random(2)
+        for version in range(1, 30):
+            cell = rng.randrange(len(base))
+            base[cell] = ord('.') if base[cell] == ord('#') else ord('#')
+            history.record(cell, base[cell], version * 2)
+            states.append(bytes(base))
+        self.assertEqual(len(history.snapshots), 8)
+        for revision, codes in enumerate(states):
+            self.assertEqual(bytes(history.codes_at(revision)), codes)
+        self.assertEqual(history.revision_at(0), 0)
+        self.assertEqual(history.revision_at(11), 5) # Versions 2, 4, ..., 10 are at or before 11
+        self.assertEqual(history.revision_at(1000), history.head)
+
+    def test_checkout_restores_past_state(self):
+        rng = random.Random(3)
+        maze = DynamicMaze(width=21, height=21, seed=3)
+        maze.history.snapshot_every = 8
+        states = churn(maze, rng, 25)
+        head = maze.history.head
+        self.assertGreater(head, 16)
+
+        for revision, codes in rng.sample(states[1:], 6) + states[:1]:
+            maze.checkout(revision)
+            self.assertEqual(bytes(maze.type_codes()), codes)
+            self.assertEqual(incremental_state(maze), full_state(maze))
+        self.assertEqual(maze.seek(maze.version), head)
+
+        # New changes land on the present even while a past revision is shown
+        node = next(n for row in maze.grid for n in row if n.type == '.' and n not in (maze.start_node, maze.goal_node))
+        present = bytearray(states[-1][1])
+        present[node.id] = ord('#')
+        maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        maze.process_updates(10.0)
+        maze.process_updates(10.0)
+        self.assertEqual(maze.revision, head + 1)
+        self.assertEqual(bytes(maze.type_codes()), bytes(present))
+        self.assertEqual(incremental_state(maze), full_state(maze))
+
+
+    def test_checkout_restores_trap_and_powerup_costs(self):
+        maze = DynamicMaze(width=21, height=21, seed=3)
+        cells = [n for row in maze.grid for n in row if n.type == '.' and n not in (maze.start_node, maze.goal_node)]
+        trap, powerup = cells[0], cells[-1]
+        trap.type, trap.cost = 'T', 3
+        powerup.type, powerup.cost = 'P', -2
+        maze.history = MazeHistory(maze.type_codes(), snapshot_every=maze.history.snapshot_every)
+        before = maze.version
+        for node in (trap, powerup):
+            maze.schedule_change(node, 'ADD_WALL', "Test", 1.0)
+        maze.process_updates(10.0)
+        maze.process_updates(10.0)
+        self.assertEqual((trap.cost, powerup.cost), (float('inf'), float('inf')))
+
+        maze.checkout(maze.seek(before))
+        self.assertEqual(maze.revision, 0)
+        self.assertEqual((trap.type, trap.cost), ('T', 3))
+        self.assertEqual((powerup.type, powerup.cost), ('P', -2))
+        maze.checkout(maze.seek(maze.version))
+        self.assertEqual((trap.cost, powerup.cost), (float('inf'), float('inf')))
+
+
+if __name__ == '__main__':
+    unittest.main()
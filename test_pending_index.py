@@ -0,0 +1,40 @@
+import unittest
+from dynamic_maze import DynamicMaze
+
+
+class TestPendingIndex(unittest.TestCase):
+    """The per-node index must follow pending_changes through every phase"""
+
+    def setUp(self):
+        self.maze = DynamicMaze(width=15, height=15, seed=6)
+        self.open_node = next(n for n in self.maze.grid[7] if n.type == '.')
+        self.wall_node = next(n for n in self.maze.grid[7] if n.type == '#')
+
+    def test_phases(self):
+        maze = self.maze
+        maze.schedule_change(self.open_node, 'ADD_WALL', "Test", 1.0)
+        maze.schedule_change(self.wall_node, 'REMOVE_WALL', "Test", 1.0)
+        self.assertEqual(maze.warning_nodes, {self.open_node, self.wall_node})
+        self.assertTrue(maze.is_node_unstable(self.open_node))
+        self.assertFalse(maze.is_node_unstable(self.wall_node)) # Opening up is not a hazard
+        self.assertEqual(maze.pending_by_node[self.open_node][0]['type'], 'ADD_WALL')
+
+        maze.process_updates(10.0)
+        self.assertEqual(maze.warning_nodes, set())
+        self.assertEqual(maze.animating_nodes, {self.open_node, self.wall_node})
+        self.assertFalse(maze.is_node_unstable(self.open_node))
+
+        maze.process_updates(10.0)
+        self.assertEqual(maze.pending_by_node, {})
+        self.assertEqual(maze.animating_nodes, set())
+
+    def test_assigning_the_list_reindexes(self):
+        maze = self.maze
+        maze.schedule_change(self.open_node, 'ADD_WALL', "Test", 1.0)
+        maze.pending_changes = []
+        self.assertFalse(maze.is_node_unstable(self.open_node))
+        self.assertEqual(maze.pending_by_node, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
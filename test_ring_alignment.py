@@ -0,0 +1,94 @@
+import heapq
+import random
+import unittest
+from circular_maze import CircularMaze
+from ring_alignment import AlignmentTable, INF
+
+
+def grid_time_arrival(maze, dt=0.05, limit=160.0):
+    """Earliest arrival when departures may only happen at multiples of dt,
+    checked with get_weighted_neighbors itself (slow, reference only)"""
+    best = {maze.start_node: 0.0}
+    heap = [(0.0, 0, maze.start_node)]
+    count = 1
+    while heap:
+        t, _, node = heapq.heappop(heap)
+        if node is maze.center_node:
+            return t
+        if t > best[node]:
+            continue
+        seen = set()
+        j = round(t / dt)
+        while j * dt < t + limit: # Every shift comes around within `limit` seconds
+            for target, _ in maze.get_weighted_neighbors(node, future_time=j * dt):
+                if target not in seen: # First chance to move there is the best one
+                    seen.add(target)
+                    at = j * dt + 1.0
+                    if at < best.get(target, INF):
+                        best[target] = at
+                        heapq.heappush(heap, (at, count, target))
+                        count += 1
+            j += 1
+    return INF
+
+
+class TestRingAlignment(unittest.TestCase):
+    """Closed-form alignment windows and the exact earliest-arrival plan"""
+
+    def test_depart_matches_alignment_rule(self):
+        random.seed(4)
+        maze = CircularMaze(num_rings=5, sectors=12)
+        maze.update(3.3)
+        table = AlignmentTable(maze)
+        rng = random.Random(4)
+        for _ in range(300):
+            r, k, t = rng.randrange(2, 5), rng.randrange(12), rng.uniform(0, 400)
+            depart = table.depart(r, k, t)
+            self.assertGreaterEqual(depart, t)
+            self.assertEqual(maze.pair_shift(r, depart), k)
+            if depart > t:
+                # Not aligned with k a moment before the window opens
+                self.assertNotEqual(maze.pair_shift(r, depart - 1e-6), k)
+
+    def test_depart_inside_window_start(self):
+        random.seed(4)
+        maze = CircularMaze(num_rings=5, sectors=12)
+        table = AlignmentTable(maze)
+        period, length, starts = table.pairs[3]
+        # Right at (or just after) a window start the pair is already aligned: no extra period
+        self.assertAlmostEqual(table.depart(3, 5, starts[5]), starts[5], places=6)
+        self.assertEqual(table.depart(3, 5, starts[5] + length / 2), starts[5] + length / 2)
+
+    def test_plan_is_valid_and_optimal(self):
+        for seed, (rings, sectors) in enumerate(((4, 12), (5, 12), (6, 16))):
+            random.seed(seed)
+            maze = CircularMaze(num_rings=rings, sectors=sectors)
+            maze.update(seed * 2.7)
+            arrival, plan = maze.earliest_arrival()
+            self.assertLess(arrival, INF)
+
+            t, node = 0.0, maze.start_node
+            for depart, source, target in plan:
+                self.assertIs(source, node)
+                self.assertGreaterEqual(depart, t)
+                self.assertIn(target, [n for n, _ in maze.get_weighted_neighbors(source, future_time=depart)])
+                t, node = depart + 1.0, target
+            self.assertIs(node, maze.center_node)
+            self.assertAlmostEqual(t, arrival)
+
+            # Departures restricted to a time grid can only be later, by less than a step per move
+            coarse = grid_time_arrival(maze)
+            self.assertLessEqual(arrival, coarse + 1e-6)
+            self.assertLessEqual(coarse, arrival + 0.05 * len(plan) + 1e-6)
+
+    def test_a_star_optimal_is_not_capped_by_the_dp_horizon(self):
+        random.seed(2)
+        maze = CircularMaze(num_rings=12, sectors=24)
+        exact = maze.a_star_optimal()
+        self.assertEqual(exact, maze.earliest_arrival()[0])
+        self.assertIs(maze.optimal_plan[-1][2], maze.center_node)
+        self.assertGreater(exact, maze.DP_HORIZON) # Beyond what the 15-step DP can see
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from dynamic_maze import DynamicMaze
+from game_classes import GreedyAI
+
+
+def apply(maze, r, c, change_type):
+    maze.schedule_change(maze.grid[r][c], change_type, "Test", 1.0)
+    maze.process_updates(10.0)
+    maze.process_updates(10.0)
+    return maze.last_change_set
+
+
+class TestRouteIndex(unittest.TestCase):
+    """Structural changes only force a replan when they can touch the remaining route"""
+
+    def make(self, layout):
+        maze = DynamicMaze(grid_layout=layout)
+        return maze, GreedyAI(maze.start_node, maze.goal_node, maze, algorithm_type='a_star')
+
+    def test_walls_on_and_off_the_route(self):
+        maze, ai = self.make("S....G\n.#####\n......")
+        self.assertEqual([(n.r, n.c) for n in ai.full_path], [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5)])
+        self.assertFalse(ai.needs_replan(apply(maze, 2, 3, 'ADD_WALL')))
+        ai.route_margin = 2
+        ai.compute_path() # New plan: the index is rebuilt with the corridor
+        self.assertTrue(ai.needs_replan(maze.last_change_set))
+        ai.route_margin = 0
+        ai.compute_path()
+        self.assertTrue(ai.needs_replan(apply(maze, 0, 4, 'ADD_WALL')))
+
+    def test_walls_behind_the_ai_are_ignored(self):
+        maze, ai = self.make("S....G\n.#####\n......")
+        ai.choose_move(maze)
+        ai.choose_move(maze)
+        self.assertFalse(ai.needs_replan(apply(maze, 0, 1, 'ADD_WALL')))
+
+    def test_shortcut_only_when_cheaper(self):
+        maze, ai = self.make("S....G\n.#####\n......")
+        self.assertFalse(ai.needs_replan(apply(maze, 1, 3, 'REMOVE_WALL')))
+
+        maze, ai = self.make("S#G\n.#.\n...")
+        self.assertAlmostEqual(ai.solution_cost, 1 + 1.414 + 1.414 + 1)
+        self.assertTrue(ai.needs_replan(apply(maze, 1, 1, 'REMOVE_WALL')))
+
+    def test_stuck_ai_waits_for_a_reconnecting_opening(self):
+        maze, ai = self.make("S.#..\n..#.G")
+        self.assertTrue(ai.finished)
+        self.assertFalse(ai.needs_replan(apply(maze, 1, 3, 'ADD_WALL')))
+        self.assertFalse(ai.needs_replan(apply(maze, 1, 3, 'REMOVE_WALL')))
+        self.assertTrue(ai.needs_replan(apply(maze, 0, 2, 'REMOVE_WALL')))
+
+
+if __name__ == '__main__':
+    unittest.main()